@@ -11,48 +11,61 @@ from alatpay.models import (
 )
 from alatpay.utils import assert_success
 from logger.logger import get_logger
-from typing import Callable, Dict, Optional
+from transport import codec
+from transport.instrumentation import Instrumentation, instrumented
+from typing import Awaitable, Callable, Dict, Optional, Union
 
 
 logger = get_logger(__name__) 
 
 
-class CardPayment():
+class _BaseCardPayment():
+    """
+    Payload building and response checks shared by the sync and async card flows.
+    """
+
+    provider = "alatpay"
 
     def __init__(self,
-            post_request: Callable[[Dict, str], Dict],
-            business_id: str
+            post_request: Callable,
+            business_id: str,
+            post_raw_request: Callable = None,
+            instrumentation: Instrumentation = None
         ):
-        self._post_request = post_request
+        # post_raw_request switches to the fast JSON path: bodies are sent as
+        # bytes and responses validated with model_validate_json()
+        self._fast_json = post_raw_request is not None
+        self._post_request = post_raw_request or post_request
         self.__business_id = business_id
+        self._instrumentation = instrumentation
 
-    def initiate_card_payment(self, payload: InitPayloadModel) -> InitResponseModel:
-        path = "/paymentCard/api/v1/paymentCard/mc/initialize"
+    def _initiate_payload(self, payload: InitPayloadModel) -> Union[bytes, Dict]:
         data = payload.model_dump()
         data["businessId"] = self.__business_id 
-
-        resp = self._post_request(data, path)
-
-        assert_success(
-            resp,
-            expected_message="Success",
-            error_message="Couldn't Initiate Card Payment",
-            error_code=400
-        )
+        return codec.dumps(data) if self._fast_json else data
+
+    def _initiate_result(self, resp: Union[bytes, Dict]) -> InitResponseModel:
+        result, body = codec.decode_model(resp, InitResponseModel, "Success")
+        if result is None:
+            assert_success(
+                body,
+                expected_message="Success",
+                error_message="Couldn't Initiate Card Payment",
+                error_code=400
+            )
         
-        logger.info(f"Card initiation success — transactionId: {resp['data']['transactionId']}")
-        return InitResponseModel(**resp)
+        logger.info("Card initiation success — transactionId: %s", result.transactionId)
+        return result
 
-    def authenticate_card(self, userData: UserDataModel, payload: InitResponseModel) -> AuthResponseModel:
-        path = "/paymentcard/api/v1/paymentCard/mc/authenticate"
+    def _authenticate_payload(self, userData: UserDataModel, payload: InitResponseModel) -> Union[bytes, Dict]:
         data = payload.model_dump()
 
         if data.get("gatewayRecommendation") == "PROCEED":
             send_data = userData.model_dump()
             send_data["businessId"] = self.__business_id
-            resp = self._post_request(send_data, path)
+            return codec.dumps(send_data) if self._fast_json else send_data
         else:
-            logger.warning(f"Card initiation failed")
+            logger.warning("Card initiation failed")
             raise AlatException(
                 message="This card does not meet the required security validations, and so this card cannot not be used to perform this transaction at this time.",
                 code=400,
@@ -61,48 +74,166 @@ class CardPayment():
                     "transactionID": data.get("transactionID", "")
                 }
             )
-        
-        assert_success(
-            resp,
-            expected_message="Success",
-            error_message="Card Authentication Was Not Successful",
-            error_code=400
-        )
 
-        logger.info(f"Card initiation success — transactionId: {resp['data']['transactionId']}")
-        return AuthResponseModel(**resp)
+    def _authenticate_result(self, resp: Union[bytes, Dict]) -> AuthResponseModel:
+        result, body = codec.decode_model(resp, AuthResponseModel, "Success")
+        if result is None:
+            assert_success(
+                body,
+                expected_message="Success",
+                error_message="Card Authentication Was Not Successful",
+                error_code=400
+            )
+
+        logger.info("Card initiation success — transactionId: %s", result.transactionId)
+        return result
 
 
-class BankTransfer():
+class CardPayment(_BaseCardPayment):
 
     def __init__(self,
-            post_request: Callable[[Dict, str], Dict],
-            get_request: Callable[[str, Optional[Dict]], Dict],
-            business_id: str
+            post_request: Callable[..., Dict],
+            business_id: str,
+            post_raw_request: Callable[..., bytes] = None,
+            instrumentation: Instrumentation = None
         ):
-        self._post_request = post_request
-        self.__get_request = get_request
+        super().__init__(post_request, business_id, post_raw_request, instrumentation)
+
+    @instrumented("initiate_card_payment")
+    def initiate_card_payment(self, payload: InitPayloadModel, idempotency_key: str = None) -> InitResponseModel:
+        path = "/paymentCard/api/v1/paymentCard/mc/initialize"
+        data = self._initiate_payload(payload)
+
+        resp = self._post_request(data, path, idempotency_key=idempotency_key)
+        return self._initiate_result(resp)
+
+    @instrumented("authenticate_card")
+    def authenticate_card(self, userData: UserDataModel, payload: InitResponseModel, idempotency_key: str = None) -> AuthResponseModel:
+        path = "/paymentcard/api/v1/paymentCard/mc/authenticate"
+        send_data = self._authenticate_payload(userData, payload)
+
+        resp = self._post_request(send_data, path, idempotency_key=idempotency_key, guard_key=userData.orderId)
+        return self._authenticate_result(resp)
+
+
+class AsyncCardPayment(_BaseCardPayment):
+
+    def __init__(self,
+            post_request: Callable[..., Awaitable[Dict]],
+            business_id: str,
+            post_raw_request: Callable[..., Awaitable[bytes]] = None,
+            instrumentation: Instrumentation = None
+        ):
+        super().__init__(post_request, business_id, post_raw_request, instrumentation)
+
+    @instrumented("initiate_card_payment")
+    async def initiate_card_payment(self, payload: InitPayloadModel, idempotency_key: str = None) -> InitResponseModel:
+        path = "/paymentCard/api/v1/paymentCard/mc/initialize"
+        data = self._initiate_payload(payload)
+
+        resp = await self._post_request(data, path, idempotency_key=idempotency_key)
+        return self._initiate_result(resp)
+
+    @instrumented("authenticate_card")
+    async def authenticate_card(self, userData: UserDataModel, payload: InitResponseModel, idempotency_key: str = None) -> AuthResponseModel:
+        path = "/paymentcard/api/v1/paymentCard/mc/authenticate"
+        send_data = self._authenticate_payload(userData, payload)
+
+        resp = await self._post_request(send_data, path, idempotency_key=idempotency_key, guard_key=userData.orderId)
+        return self._authenticate_result(resp)
+
+
+class _BaseBankTransfer():
+    """
+    Payload building and response checks shared by the sync and async bank transfer flows.
+    """
+
+    provider = "alatpay"
+
+    def __init__(self,
+            post_request: Callable,
+            get_request: Callable,
+            business_id: str,
+            post_raw_request: Callable = None,
+            get_raw_request: Callable = None,
+            instrumentation: Instrumentation = None
+        ):
+        self._fast_json = post_raw_request is not None and get_raw_request is not None
+        self._post_request = post_raw_request if self._fast_json else post_request
+        self._get_request = get_raw_request if self._fast_json else get_request
         self.__business_id = business_id
+        self._instrumentation = instrumentation
 
-    def generate_virtual_account(self, payload: AccountGenerationPayloadModel) -> AccountGenerationResponseModel:
-        path = "/bank-transfer/api/v1/bankTransfer/virtualAccount"
+    def _virtual_account_payload(self, payload: AccountGenerationPayloadModel) -> Union[bytes, Dict]:
         data = payload.model_dump()
         data["businessId"] = self.__business_id
+        return codec.dumps(data) if self._fast_json else data
+
+    def _virtual_account_result(self, resp: Union[bytes, Dict]) -> AccountGenerationResponseModel:
+        result, body = codec.decode_model(resp, AccountGenerationResponseModel, "Business fetched locally")
+        if result is None:
+            assert_success(
+                body,
+                expected_message="Business fetched locally",
+                error_message="Failed to create virtual account",
+                error_code=400
+            )
+
+        logger.info("Virtual Account Generation Success — transactionId: %s", result.data.transactionId)
+        return result
+
 
-        resp = self._post_request(data, path)
+class BankTransfer(_BaseBankTransfer):
+
+    def __init__(self,
+            post_request: Callable[..., Dict],
+            get_request: Callable[[str, Optional[Dict]], Dict],
+            business_id: str,
+            post_raw_request: Callable[..., bytes] = None,
+            get_raw_request: Callable[[str, Optional[Dict]], bytes] = None,
+            instrumentation: Instrumentation = None
+        ):
+        super().__init__(post_request, get_request, business_id, post_raw_request, get_raw_request, instrumentation)
 
-        assert_success(
-            resp,
-            expected_message="Business fetched locally",
-            error_message="Failed to create virtual account",
-            error_code=400
-        )
+    @instrumented("generate_virtual_account")
+    def generate_virtual_account(self, payload: AccountGenerationPayloadModel, idempotency_key: str = None) -> AccountGenerationResponseModel:
+        path = "/bank-transfer/api/v1/bankTransfer/virtualAccount"
+        data = self._virtual_account_payload(payload)
 
-        logger.info(f"Virtual Account Generation Success — transactionId: {resp['data']['transactionId']}")
-        return AccountGenerationResponseModel(**resp)
+        resp = self._post_request(data, path, idempotency_key=idempotency_key, guard_key=payload.orderId)
+        return self._virtual_account_result(resp)
     
+    @instrumented("confirm_transaction_status")
     def confirm_transaction_status(self, transaction_id: str) -> AccountGenerationResponseModel:
         path = f"/bank-transfer/api/v1/bankTransfer/transactions/{transaction_id}"
 
-        resp = self.__get_request(path)
-        return resp
+        resp = self._get_request(path)
+        return codec.as_dict(resp)
+
+
+class AsyncBankTransfer(_BaseBankTransfer):
+
+    def __init__(self,
+            post_request: Callable[..., Awaitable[Dict]],
+            get_request: Callable[[str, Optional[Dict]], Awaitable[Dict]],
+            business_id: str,
+            post_raw_request: Callable[..., Awaitable[bytes]] = None,
+            get_raw_request: Callable[[str, Optional[Dict]], Awaitable[bytes]] = None,
+            instrumentation: Instrumentation = None
+        ):
+        super().__init__(post_request, get_request, business_id, post_raw_request, get_raw_request, instrumentation)
+
+    @instrumented("generate_virtual_account")
+    async def generate_virtual_account(self, payload: AccountGenerationPayloadModel, idempotency_key: str = None) -> AccountGenerationResponseModel:
+        path = "/bank-transfer/api/v1/bankTransfer/virtualAccount"
+        data = self._virtual_account_payload(payload)
+
+        resp = await self._post_request(data, path, idempotency_key=idempotency_key, guard_key=payload.orderId)
+        return self._virtual_account_result(resp)
+
+    @instrumented("confirm_transaction_status")
+    async def confirm_transaction_status(self, transaction_id: str) -> AccountGenerationResponseModel:
+        path = f"/bank-transfer/api/v1/bankTransfer/transactions/{transaction_id}"
+
+        resp = await self._get_request(path)
+        return codec.as_dict(resp)
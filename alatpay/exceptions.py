@@ -1,25 +1,6 @@
-import logging
+from transport.exceptions import ErrorCode, GatewayError
 
 
-logger = logging.getLogger(__name__)
-
-
-class AlatException(Exception):
-    def __init__(self, message: str, code: int, context: dict = None):
-        self.code = code
-        self.context = context or {}
-
-        masked_context = {k: self._mask_value(v) for k, v in self.context.items()}
-
-        full_message = message
-        if code:
-            full_message += f" (Error code: {code})"
-
-        logger.error(f"AlatException raised: {full_message} | Context: {masked_context}")
-        super().__init__(full_message)
-
-    def _mask_value(self, value):
-        if isinstance(value, str):
-            if len(value) > 6:
-                return value[:2] + "****" + value[-2:]
-        return value[:2] + "****"
+class AlatException(GatewayError):
+    def __init__(self, message: str, code: int, context: dict = None, error_code: ErrorCode = None):
+        super().__init__(message, code, context, error_code)
@@ -3,104 +3,145 @@ import httpx
 import os
 from alatpay.exceptions import AlatException
 from alatpay.models import *
-from alatpay.card_transaction import CardPayment, BankTransfer
+from alatpay.card_transaction import AsyncBankTransfer, AsyncCardPayment, BankTransfer, CardPayment
 from dotenv import load_dotenv
 from logger.logger import get_logger
+from transport.exceptions import classify_error
+from transport.routes import RouteTable
+from transport.transport import AsyncBaseIntegration, BaseIntegration
 from typing import Dict
 
 
 load_dotenv()
 logger = get_logger(__name__) 
 
+ALATPAY_ROUTES = RouteTable([
+    "/paymentCard/api/v1/paymentCard/mc/initialize",
+    "/paymentcard/api/v1/paymentCard/mc/authenticate",
+    "/bank-transfer/api/v1/bankTransfer/virtualAccount",
+    "/bank-transfer/api/v1/bankTransfer/transactions/{transaction_id}"
+])
 
-class AlatPayIntegration():
 
-    def __init__(self, client: httpx.Client = None):
-        self.__subscription_key = os.getenv("ALAT_PAY_PRIMARY_KEY")
-        self.__business_id = os.getenv("ALAT_PAY_BUSINESS_ID")
-        self.__base_url = os.getenv("ALAT_PAY_BASE_URL")
-        self.__client = client or httpx.Client()
+def _alatpay_settings(integration_name: str) -> Dict:
+    subscription_key = os.getenv("ALAT_PAY_PRIMARY_KEY")
+    business_id = os.getenv("ALAT_PAY_BUSINESS_ID")
+    base_url = os.getenv("ALAT_PAY_BASE_URL")
 
-        self.__card_transactions = None
-        self.__bank_transfer = None
+    if not all([subscription_key, business_id, base_url]):
+        logger.error("Missing required environment variables for %s.", integration_name)
+        raise EnvironmentError(f"Missing required environment variables for {integration_name}")
 
-        if not all([self.__subscription_key, self.__business_id, self.__base_url]):
-            logger.error("Missing required environment variables for AlatPayIntegration.")
-            raise EnvironmentError("Missing required environment variables for AlatPayIntegration")
+    return {
+        "business_id": business_id,
+        "base_url": base_url,
+        "headers": {
+            "Ocp-Apim-Subscription-Key": subscription_key,
+            "Cache-Control": "no-cache"
+        }
+    }
 
-    def __enter__(self):
-        return self
 
-    def __exit__(self, exc_type, exc_value, traceback):
-        self.__client.close()
+def _raise_alat_exception(error: httpx.HTTPStatusError) -> None:
+    # A proxy in front of ALATPay may answer a 5xx with HTML or nothing at all
+    try:
+        context = error.response.json()
+    except ValueError:
+        context = None
+    if not isinstance(context, dict):
+        context = {}
 
-    def close(self):
-        self.__client.close()
+    message = context.get("message") or error.response.reason_phrase or f"HTTP {error.response.status_code}"
+    logger.error("HTTP %s Error: %s", error.response.status_code, message)
+    raise AlatException(
+        message=message,
+        code=error.response.status_code,
+        context=context,
+        error_code=classify_error(error)
+    )
 
-    def _get_request(self, path: str, params: Dict = None) -> Dict:
-        headers = {
-            "Ocp-Apim-Subscription-Key": self.__subscription_key,
-            "Cache-Control": "no-cache"
-        }
 
-        try:
-            resp = self.__client.get(
-                url=f"{self.__base_url}{path}",
-                headers=headers,
-                params=params if params else None
-            )
-            resp.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            raise
-        
-        retVal = resp.json()
-        return retVal
-
-    def _post_request(self, payload: Dict, path: str) -> Dict:
-        headers = {
-            "Content-Type": "application/json",
-            "Ocp-Apim-Subscription-Key": self.__subscription_key,
-            "Cache-Control": "no-cache"
-        }
+class AlatPayIntegration(BaseIntegration):
 
-        try:
-            resp = self.__client.post(
-                url=f"{self.__base_url}{path}",
-                json=payload,
-                headers=headers
+    provider = "alatpay"
+    routes = ALATPAY_ROUTES
+
+    def __init__(self, client: httpx.Client = None, **options):
+        settings = _alatpay_settings("AlatPayIntegration")
+        self.__business_id = settings.pop("business_id")
+        super().__init__(**settings, client=client, **options)
+
+        self.__card_transactions = None
+        self.__bank_transfer = None
+
+    def _on_status_error(self, error: httpx.HTTPStatusError, method: str) -> None:
+        if method == "POST":
+            _raise_alat_exception(error)
+        super()._on_status_error(error, method)
+
+    @property
+    def card_transactions(self) -> CardPayment:
+        if self.__card_transactions is None:
+            self.__card_transactions = CardPayment(
+                self._post_request,
+                self.__business_id,
+                post_raw_request=self._post_raw_request if self._fast_json else None,
+                instrumentation=self._instrumentation
             )
-            resp.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            context = e.response.json()
-            logger.error(f"HTTP {e.response.status_code} Error: {e.response.json()["message"]}")
-            raise AlatException(
-                message=context["message"],
-                code=e.response.status_code,
-                context=context
+        return self.__card_transactions
+
+    @property
+    def bank_transfer(self) -> BankTransfer:
+        if self.__bank_transfer is None:
+            self.__bank_transfer = BankTransfer(
+                self._post_request,
+                self._get_request,
+                self.__business_id,
+                post_raw_request=self._post_raw_request if self._fast_json else None,
+                get_raw_request=self._get_raw_request if self._fast_json else None,
+                instrumentation=self._instrumentation
             )
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            raise
+        return self.__bank_transfer
+
 
-        resp_data = resp.json()
-        return resp_data
+class AsyncAlatPayIntegration(AsyncBaseIntegration):
+
+    provider = "alatpay"
+    routes = ALATPAY_ROUTES
+
+    def __init__(self, client: httpx.AsyncClient = None, **options):
+        settings = _alatpay_settings("AsyncAlatPayIntegration")
+        self.__business_id = settings.pop("business_id")
+        super().__init__(**settings, client=client, **options)
+
+        self.__card_transactions = None
+        self.__bank_transfer = None
+
+    def _on_status_error(self, error: httpx.HTTPStatusError, method: str) -> None:
+        if method == "POST":
+            _raise_alat_exception(error)
+        super()._on_status_error(error, method)
 
     @property
-    def card_transactions(self) -> AuthResponseModel:
+    def card_transactions(self) -> AsyncCardPayment:
         if self.__card_transactions is None:
-            self.__card_transactions = CardPayment(self._post_request, self.__business_id)
+            self.__card_transactions = AsyncCardPayment(
+                self._post_request,
+                self.__business_id,
+                post_raw_request=self._post_raw_request if self._fast_json else None,
+                instrumentation=self._instrumentation
+            )
         return self.__card_transactions
 
     @property
-    def bank_transfer(self):
+    def bank_transfer(self) -> AsyncBankTransfer:
         if self.__bank_transfer is None:
-            self.__bank_transfer = BankTransfer(
+            self.__bank_transfer = AsyncBankTransfer(
                 self._post_request,
                 self._get_request,
-                self.__business_id
+                self.__business_id,
+                post_raw_request=self._post_raw_request if self._fast_json else None,
+                get_raw_request=self._get_raw_request if self._fast_json else None,
+                instrumentation=self._instrumentation
             )
         return self.__bank_transfer
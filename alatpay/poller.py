@@ -0,0 +1,266 @@
+import asyncio
+import heapq
+import inspect
+import itertools
+import time
+from alatpay.card_transaction import AsyncBankTransfer
+from alatpay.exceptions import AlatException
+from alatpay.models import AccountDetailsModel
+from datetime import datetime, timezone
+from logger.logger import get_logger
+from transport import codec
+from transport.rate_limit import TokenBucket
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+
+logger = get_logger(__name__)
+
+TERMINAL_STATUSES = frozenset({"completed", "successful", "success", "failed", "reversed", "expired"})
+
+TransferCallback = Callable[[str, Union[Dict, Exception]], None]
+
+
+def _expiry_deadline(expired_at: Union[str, datetime, None], default_ttl: float) -> float:
+    """
+    Convert an ALATPay `expiredAt` timestamp into a time.monotonic() deadline.
+    Naive timestamps are taken as UTC.
+    """
+    if expired_at is None:
+        return time.monotonic() + default_ttl
+
+    if isinstance(expired_at, str):
+        try:
+            expired_at = datetime.fromisoformat(expired_at)
+        except ValueError:
+            logger.warning("Unparseable expiredAt %r, using the default TTL", expired_at)
+            return time.monotonic() + default_ttl
+
+    if expired_at.tzinfo is None:
+        expired_at = expired_at.replace(tzinfo=timezone.utc)
+    return time.monotonic() + (expired_at - datetime.now(timezone.utc)).total_seconds()
+
+
+class _Watch():
+
+    __slots__ = ("transaction_id", "deadline", "attempts", "future", "callbacks")
+
+    def __init__(self, transaction_id: str, deadline: float, future: asyncio.Future):
+        self.transaction_id = transaction_id
+        self.deadline = deadline
+        self.attempts = 0
+        self.future = future
+        self.callbacks: List[TransferCallback] = []
+
+
+class TransferPoller():
+    """
+    Watches many pending virtual-account transfers from one event loop.
+
+    Each watched `transactionId` is polled through `confirm_transaction_status`,
+    first after `initial_interval` seconds, then with the interval growing by
+    `backoff` up to `max_interval`, until its status is terminal or its
+    `expiredAt` passes. Due polls are taken off a heap in batches, at most
+    `concurrency` run at once and `rate` caps requests per second across all
+    watches.
+
+    `watch` returns a future resolved with the final status response, or
+    failed with an AlatException (code 408) if the account expired unpaid.
+    Callbacks receive `(transaction_id, response_or_exception)`.
+
+        async with TransferPoller(integration.bank_transfer) as poller:
+            account = await integration.bank_transfer.generate_virtual_account(payload)
+            status = await poller.watch_account(account.data)
+    """
+
+    def __init__(self,
+            bank_transfer: AsyncBankTransfer,
+            rate: float = 20.0,
+            concurrency: int = 50,
+            initial_interval: float = 5.0,
+            max_interval: float = 120.0,
+            backoff: float = 1.5,
+            batch_window: float = 0.05,
+            default_ttl: float = 1800.0,
+            terminal_statuses: Iterable[str] = TERMINAL_STATUSES
+        ):
+        self.__bank_transfer = bank_transfer
+        self.__bucket = TokenBucket(rate)
+        self.__concurrency = concurrency
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.batch_window = batch_window
+        self.default_ttl = default_ttl
+        self.terminal_statuses = frozenset(status.lower() for status in terminal_statuses)
+
+        self.__heap: List[Tuple[float, int, _Watch]] = []
+        self.__sequence = itertools.count()
+        self.__watches: Dict[str, _Watch] = {}
+        self.__polls: Set[asyncio.Task] = set()
+        self.__wake: Optional[asyncio.Event] = None
+        self.__slots: Optional[asyncio.Semaphore] = None
+        self.__runner: Optional[asyncio.Task] = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    @property
+    def pending(self) -> int:
+        return len(self.__watches)
+
+    def start(self) -> None:
+        if self.__runner is None:
+            self.__wake = asyncio.Event()
+            self.__slots = asyncio.Semaphore(self.__concurrency)
+            self.__runner = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop polling and cancel the futures of every transfer still watched.
+        """
+        if self.__runner is None:
+            return
+
+        self.__runner.cancel()
+        for task in list(self.__polls):
+            task.cancel()
+        await asyncio.gather(self.__runner, *self.__polls, return_exceptions=True)
+        self.__runner = None
+
+        for watch in self.__watches.values():
+            watch.future.cancel()
+        self.__watches.clear()
+        self.__heap.clear()
+
+    def watch(self,
+            transaction_id: str,
+            expired_at: Union[str, datetime] = None,
+            callback: TransferCallback = None
+        ) -> asyncio.Future:
+        """
+        Start tracking `transaction_id`. Watching an id that is already
+        tracked returns its existing future.
+        """
+        self.start()
+
+        watch = self.__watches.get(transaction_id)
+        if watch is None:
+            future = asyncio.get_running_loop().create_future()
+            watch = _Watch(transaction_id, _expiry_deadline(expired_at, self.default_ttl), future)
+            self.__watches[transaction_id] = watch
+            # However the future finishes, including a caller cancelling it,
+            # the transfer stops being watched.
+            future.add_done_callback(lambda _, watch=watch: self._forget(watch))
+            self._schedule(watch, self.initial_interval)
+
+        if callback is not None:
+            watch.callbacks.append(callback)
+        return watch.future
+
+    def watch_account(self, account: AccountDetailsModel, callback: TransferCallback = None) -> asyncio.Future:
+        return self.watch(account.transactionId, account.expiredAt, callback)
+
+    def unwatch(self, transaction_id: str) -> None:
+        watch = self.__watches.pop(transaction_id, None)
+        if watch is not None:
+            watch.future.cancel()
+
+    def _forget(self, watch: _Watch) -> None:
+        if self.__watches.get(watch.transaction_id) is watch:
+            del self.__watches[watch.transaction_id]
+
+    def _schedule(self, watch: _Watch, delay: float) -> None:
+        due = min(time.monotonic() + delay, max(watch.deadline, time.monotonic()))
+        heapq.heappush(self.__heap, (due, next(self.__sequence), watch))
+        self.__wake.set()
+
+    def _next_interval(self, watch: _Watch) -> float:
+        return min(self.max_interval, self.initial_interval * self.backoff ** watch.attempts)
+
+    async def _run(self) -> None:
+        while True:
+            if not self.__heap:
+                await self.__wake.wait()
+                self.__wake.clear()
+                continue
+
+            now = time.monotonic()
+            due = self.__heap[0][0]
+            if due > now:
+                try:
+                    await asyncio.wait_for(self.__wake.wait(), due - now)
+                except asyncio.TimeoutError:
+                    pass
+                self.__wake.clear()
+                continue
+
+            # Everything due within the batch window goes out in this pass, so
+            # the loop wakes once per batch rather than once per transfer.
+            horizon = now + self.batch_window
+            while self.__heap and self.__heap[0][0] <= horizon:
+                _, _, watch = heapq.heappop(self.__heap)
+                if watch.future.done():
+                    continue
+
+                await self.__slots.acquire()
+                task = asyncio.ensure_future(self._poll(watch))
+                self.__polls.add(task)
+                task.add_done_callback(self.__polls.discard)
+
+    async def _poll(self, watch: _Watch) -> None:
+        resp = None
+        try:
+            wait = self.__bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            resp = codec.as_dict(await self.__bank_transfer.confirm_transaction_status(watch.transaction_id))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Status check failed for transactionId %s: %s", watch.transaction_id, e)
+        finally:
+            self.__slots.release()
+
+        if watch.future.done():
+            return
+
+        status = str(((resp or {}).get("data") or {}).get("status") or "").lower()
+        if status in self.terminal_statuses:
+            logger.info("Transfer %s reached status %s", watch.transaction_id, status)
+            self._resolve(watch, resp)
+        elif time.monotonic() >= watch.deadline:
+            logger.info("Transfer %s expired before payment was confirmed", watch.transaction_id)
+            self._resolve(watch, AlatException(
+                message="Virtual account expired before payment was confirmed.",
+                code=408,
+                context={
+                    "transactionId": watch.transaction_id,
+                    "status": status
+                }
+            ))
+        else:
+            watch.attempts += 1
+            self._schedule(watch, self._next_interval(watch))
+
+    def _resolve(self, watch: _Watch, outcome: Union[Dict, Exception]) -> None:
+        self.__watches.pop(watch.transaction_id, None)
+        if isinstance(outcome, Exception):
+            watch.future.set_exception(outcome)
+            # Callers that only use callbacks never await the future.
+            watch.future.exception()
+        else:
+            watch.future.set_result(outcome)
+
+        for callback in watch.callbacks:
+            try:
+                result = callback(watch.transaction_id, outcome)
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    self.__polls.add(task)
+                    task.add_done_callback(self.__polls.discard)
+            except Exception as e:
+                logger.error("Transfer callback failed for transactionId %s: %s", watch.transaction_id, e)
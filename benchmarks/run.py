@@ -0,0 +1,317 @@
+"""
+Benchmark harness for the Paystack and ALATPay integrations.
+
+Every TransactionHandler and ALATPay endpoint is called through the real
+integration stack against an in-process httpx.MockTransport serving
+realistic payloads, so the numbers cover everything the library does per
+request (payload serialisation, retries and breakers, response decoding,
+pydantic validation, logging) without any network noise.
+
+    python -m benchmarks.run --mode sync threads async --concurrency 16 --page-size 100 --output results.json
+    python -m benchmarks.run --baseline results.json --threshold 0.15
+
+Each scenario and mode gets three passes: a timed pass (latency percentiles
+and throughput), a tracemalloc pass (peak and retained memory per call) and
+a cProfile pass (CPU split into serialization, validation, logging,
+transport and other). cProfile only sees the thread it runs in, so the
+profiled pass of the threads mode runs sequentially.
+"""
+import argparse
+import asyncio
+import cProfile
+import json
+import logging
+import os
+import platform
+import pstats
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+os.environ.setdefault("PAYSTACK_TEST_SECRET_KEY", "sk_test_benchmark")
+os.environ.setdefault("PAYSTACK_BASE_URL", "https://api.paystack.test")
+os.environ.setdefault("ALAT_PAY_PRIMARY_KEY", "benchmark")
+os.environ.setdefault("ALAT_PAY_BUSINESS_ID", "biz-00001")
+os.environ.setdefault("ALAT_PAY_BASE_URL", "https://apibox.alatpay.test")
+
+from alatpay.main import AlatPayIntegration, AsyncAlatPayIntegration
+from benchmarks.scenarios import SCENARIOS, Scenario
+from benchmarks.server import MockGateway
+from paystack.analytics import percentile
+from paystack.main import AsyncPayStackIntegration, PayStackIntegration
+
+
+MODES = ("sync", "threads", "async")
+
+CPU_CATEGORIES = ("serialization", "validation", "logging", "transport", "other")
+
+# (category, substrings of a profiled function's file or name), first match wins
+_CPU_RULES = (
+    ("stub", ("benchmarks/server.py",)),
+    ("serialization", ("transport/codec.py", "/json/", "orjson", "json.", "model_dump")),
+    ("validation", ("pydantic", "validate", "email_validator", "/idna/")),
+    ("logging", ("/logging/", "logger/logger.py")),
+    ("transport", ("httpx", "httpcore", "h11", "anyio", "sniffio", "/transport/", "/ssl.py", "/socket.py"))
+)
+
+_LOGGERS = ("alatpay", "paystack", "stripe", "transport")
+
+
+def _configure_logging(level: str) -> None:
+    """
+    Route library logs through a real formatter into /dev/null, so their
+    cost shows up in the results without flooding the terminal.
+    """
+    handler = logging.StreamHandler(open(os.devnull, "w"))
+    handler.setFormatter(logging.Formatter("%(levelname)s [%(asctime)s] %(name)s - %(message)s"))
+    for name in _LOGGERS:
+        logger = logging.getLogger(name)
+        logger.handlers = [handler] if level != "OFF" else [logging.NullHandler()]
+        logger.setLevel(logging.CRITICAL + 1 if level == "OFF" else level)
+        logger.propagate = False
+
+
+def _classify(filename: str, function: str) -> str:
+    where = f"{filename}:{function}".replace(os.sep, "/")
+    for category, needles in _CPU_RULES:
+        if any(needle in where for needle in needles):
+            return category
+    return "other"
+
+
+def _cpu_split(profile: cProfile.Profile) -> Dict[str, float]:
+    """
+    Own (exclusive) CPU seconds per category. Builtins that match no rule
+    (len, isinstance, str methods) are charged to the categories of their
+    callers, in proportion to the time each caller spent in them. Time in
+    the mock server is dropped, it stands in for the network.
+    """
+    stats = pstats.Stats(profile).stats
+    seconds = dict.fromkeys(CPU_CATEGORIES, 0.0)
+    seconds["stub"] = 0.0
+    for (filename, _, function), (_, _, own, _, callers) in stats.items():
+        category = _classify(filename, function)
+        if category == "other" and filename == "~" and callers:
+            for (caller_file, _, caller_function), caller_stats in callers.items():
+                seconds[_classify(caller_file, caller_function)] += caller_stats[2]
+        else:
+            seconds[category] += own
+    seconds.pop("stub")
+    total = sum(seconds.values()) or 1.0
+    return {
+        category: {"seconds": round(value, 6), "share": round(value / total, 4)}
+        for category, value in seconds.items()
+    }
+
+
+class Runner():
+    """
+    Runs one scenario in one mode: `requests` calls spread over
+    `concurrency` threads or tasks (sync mode always uses one).
+    """
+
+    def __init__(self, gateway: MockGateway, mode: str, concurrency: int, fast_json: bool = False):
+        self.gateway = gateway
+        self.mode = mode
+        self.concurrency = 1 if mode == "sync" else concurrency
+        self.fast_json = fast_json
+
+    def _integration(self, provider: str) -> Any:
+        if self.mode == "async":
+            cls = AsyncPayStackIntegration if provider == "paystack" else AsyncAlatPayIntegration
+            client = self.gateway.async_client()
+        else:
+            cls = PayStackIntegration if provider == "paystack" else AlatPayIntegration
+            client = self.gateway.client()
+        return cls(client=client, fast_json=self.fast_json)
+
+    def _timed(self, call: Callable[[], Any], latencies: List[float]) -> None:
+        started = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - started)
+
+    async def _timed_async(self, call: Callable[[], Any], latencies: List[float]) -> None:
+        started = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - started)
+
+    def _drive(self, scenario: Scenario, integration: Any, requests: int, latencies: List[float], sequential: bool = False) -> None:
+        call = lambda: scenario.call(integration)
+        if self.mode == "sync" or sequential and self.mode == "threads":
+            for _ in range(requests):
+                self._timed(call, latencies)
+        elif self.mode == "threads":
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                for future in [pool.submit(self._timed, call, latencies) for _ in range(requests)]:
+                    future.result()
+        else:
+            asyncio.run(self._drive_async(scenario, integration, requests, latencies))
+
+    async def _drive_async(self, scenario: Scenario, integration: Any, requests: int, latencies: List[float]) -> None:
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def one() -> None:
+            async with slots:
+                await self._timed_async(lambda: scenario.call_async(integration), latencies)
+
+        await asyncio.gather(*(one() for _ in range(requests)))
+
+    def run(self, scenario: Scenario, requests: int, warmup: int, alloc_requests: int, profile_requests: int) -> Dict:
+        integration = self._integration(scenario.provider)
+        try:
+            self._drive(scenario, integration, warmup, [])
+
+            latencies: List[float] = []
+            started = time.perf_counter()
+            self._drive(scenario, integration, requests, latencies)
+            elapsed = time.perf_counter() - started
+
+            tracemalloc.start()
+            before, _ = tracemalloc.get_traced_memory()
+            self._drive(scenario, integration, alloc_requests, [])
+            after, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            profile = cProfile.Profile()
+            profile.enable()
+            self._drive(scenario, integration, profile_requests, [], sequential=True)
+            profile.disable()
+        finally:
+            if self.mode == "async":
+                asyncio.run(integration.aclose())
+            else:
+                integration.close()
+
+        ordered = sorted(latencies)
+        return {
+            "scenario": scenario.name,
+            "mode": self.mode,
+            "concurrency": self.concurrency,
+            "requests": requests,
+            "latency_ms": {
+                "mean": round(sum(ordered) / len(ordered) * 1000, 4),
+                **{f"p{q}": round(percentile(ordered, q) * 1000, 4) for q in (50, 90, 95, 99)},
+                "max": round(ordered[-1] * 1000, 4)
+            },
+            "throughput_rps": round(requests / elapsed, 2),
+            "memory": {
+                "peak_bytes": peak - before,
+                "retained_bytes_per_call": round((after - before) / max(alloc_requests, 1), 1)
+            },
+            "cpu": _cpu_split(profile)
+        }
+
+
+def _key(result: Dict, config: Dict) -> tuple:
+    return result["scenario"], result["mode"], result["concurrency"], config["page_size"], config["latency_ms"]
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    Regressions of more than `threshold` (a fraction) in p50/p99 latency or
+    throughput against a previous results file, as readable lines.
+    """
+    previous = {_key(result, baseline["config"]): result for result in baseline["results"]}
+    regressions = []
+    for result in results["results"]:
+        old = previous.get(_key(result, results["config"]))
+        if old is None:
+            continue
+        for metric in ("p50", "p99"):
+            before, now = old["latency_ms"][metric], result["latency_ms"][metric]
+            if before and now > before * (1 + threshold):
+                regressions.append(f"{result['scenario']} [{result['mode']}] {metric} {before:.3f}ms -> {now:.3f}ms")
+        before, now = old["throughput_rps"], result["throughput_rps"]
+        if before and now < before * (1 - threshold):
+            regressions.append(f"{result['scenario']} [{result['mode']}] throughput {before:.0f} -> {now:.0f} req/s")
+    return regressions
+
+
+def _environment() -> Dict:
+    versions = {}
+    for package in ("httpx", "pydantic", "orjson"):
+        try:
+            versions[package] = __import__(package).__version__
+        except (ImportError, AttributeError):
+            versions[package] = None
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "packages": versions
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Benchmark the payment integrations against a mock gateway.")
+    parser.add_argument("--mode", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--concurrency", type=int, default=8, help="Threads or tasks in the threads and async modes")
+    parser.add_argument("--requests", type=int, default=500, help="Timed calls per scenario and mode")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--alloc-requests", type=int, default=100, help="Calls traced by tracemalloc")
+    parser.add_argument("--profile-requests", type=int, default=100, help="Calls profiled for the CPU split")
+    parser.add_argument("--page-size", type=int, default=50, help="Transactions per list_transactions page")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated network latency per response, in ms")
+    parser.add_argument("--scenario", nargs="*", help="Only scenarios whose name contains one of these")
+    parser.add_argument("--fast-json", action="store_true", help="Construct the integrations with fast_json=True")
+    parser.add_argument("--log-level", default="INFO", type=str.upper, choices=("DEBUG", "INFO", "WARNING", "ERROR", "OFF"))
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", help="Results file from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change counted as a regression")
+    args = parser.parse_args(argv)
+
+    _configure_logging(args.log_level)
+    gateway = MockGateway(page_size=args.page_size, latency=args.latency / 1000)
+    scenarios = [s for s in SCENARIOS if not args.scenario or any(part in s.name for part in args.scenario)]
+
+    config = {
+        "modes": args.mode,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "page_size": args.page_size,
+        "latency_ms": args.latency,
+        "fast_json": args.fast_json,
+        "log_level": args.log_level
+    }
+    results = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": _environment(),
+        "config": config,
+        "results": []
+    }
+
+    print(f"{'scenario':<40} {'mode':<8} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>10} {'peak KB':>9}  cpu (ser/val/log/tr/other %)")
+    for scenario in scenarios:
+        for mode in args.mode:
+            result = Runner(gateway, mode, args.concurrency, args.fast_json).run(
+                scenario, args.requests, args.warmup, args.alloc_requests, args.profile_requests
+            )
+            results["results"].append(result)
+            shares = "/".join(f"{result['cpu'][category]['share'] * 100:.0f}" for category in CPU_CATEGORIES)
+            print(
+                f"{scenario.name:<40} {mode:<8} {result['latency_ms']['p50']:>9.3f} {result['latency_ms']['p99']:>9.3f} "
+                f"{result['throughput_rps']:>10.1f} {result['memory']['peak_bytes'] / 1024:>9.1f}  {shares}"
+            )
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(results, fh, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            regressions = compare(results, json.load(fh), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print("No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+from alatpay.models import AccountGenerationPayloadModel, CustomerModel, InitPayloadModel, InitResponseModel, UserDataModel
+from paystack.models import ChargeAuthorizationPayloadModel, PartialDebitPayload, TransactionsInitPayloadModel
+from typing import Any, Awaitable, Callable, NamedTuple
+
+
+class Scenario(NamedTuple):
+    name: str
+    provider: str
+    call: Callable[[Any], Any]
+    call_async: Callable[[Any], Awaitable[Any]]
+
+
+_CUSTOMER = CustomerModel(
+    email="customer1@example.com",
+    phone="08012345678",
+    firstName="Ada",
+    lastName="Obi",
+    metadata="{}"
+)
+
+_INIT = TransactionsInitPayloadModel(amount="50000", email="customer1@example.com", reference="ref-000000000001")
+_CHARGE = ChargeAuthorizationPayloadModel(amount="50000", email="customer1@example.com", authorization_code="AUTH_0000000001")
+_PARTIAL = PartialDebitPayload(authorization_code="AUTH_0000000001", currency="NGN", amount="50000", email="customer1@example.com")
+
+_CARD = InitPayloadModel(cardNumber="5399831234567890", currency="NGN")
+_CARD_INIT = InitResponseModel(
+    status=True,
+    message="Success",
+    gatewayRecommendation="PROCEED",
+    transactionId="txn-00001",
+    orderId="order-00001"
+)
+_USER = UserDataModel(
+    cardNumber="5399831234567890",
+    cardMonth="12",
+    cardYear="30",
+    securityCode="123",
+    businessName="Benchmark Ltd",
+    amount="5000",
+    currency="NGN",
+    orderId="order-00001",
+    description="Benchmark order",
+    channel="web",
+    transactionId="txn-00001",
+    customer=_CUSTOMER
+)
+_ACCOUNT = AccountGenerationPayloadModel(
+    amount=5000.0,
+    currency="NGN",
+    orderId="order-00001",
+    description="Benchmark order",
+    customer=_CUSTOMER
+)
+
+
+SCENARIOS = (
+    Scenario("paystack.initialize_transaction", "paystack",
+             lambda p: p.transactions.initialize_transaction(_INIT),
+             lambda p: p.transactions.initialize_transaction(_INIT)),
+    Scenario("paystack.verify_transaction", "paystack",
+             lambda p: p.transactions.verify_transaction("ref-000000000001"),
+             lambda p: p.transactions.verify_transaction("ref-000000000001")),
+    Scenario("paystack.list_transactions", "paystack",
+             lambda p: p.transactions.list_transactions({"perPage": 50}),
+             lambda p: p.transactions.list_transactions({"perPage": 50})),
+    Scenario("paystack.fetch_transaction", "paystack",
+             lambda p: p.transactions.fetch_transaction(4000000001),
+             lambda p: p.transactions.fetch_transaction(4000000001)),
+    Scenario("paystack.charge_authorization", "paystack",
+             lambda p: p.transactions.charge_authorization(_CHARGE),
+             lambda p: p.transactions.charge_authorization(_CHARGE)),
+    Scenario("paystack.view_transaction_timeline", "paystack",
+             lambda p: p.transactions.view_transaction_timeline("ref-000000000001"),
+             lambda p: p.transactions.view_transaction_timeline("ref-000000000001")),
+    Scenario("paystack.transaction_totals", "paystack",
+             lambda p: p.transactions.transaction_totals(),
+             lambda p: p.transactions.transaction_totals()),
+    Scenario("paystack.export_transactions", "paystack",
+             lambda p: p.transactions.export_transactions(),
+             lambda p: p.transactions.export_transactions()),
+    Scenario("paystack.partial_debit", "paystack",
+             lambda p: p.transactions.partial_debit(_PARTIAL),
+             lambda p: p.transactions.partial_debit(_PARTIAL)),
+    Scenario("alatpay.initiate_card_payment", "alatpay",
+             lambda a: a.card_transactions.initiate_card_payment(_CARD),
+             lambda a: a.card_transactions.initiate_card_payment(_CARD)),
+    Scenario("alatpay.authenticate_card", "alatpay",
+             lambda a: a.card_transactions.authenticate_card(_USER, _CARD_INIT),
+             lambda a: a.card_transactions.authenticate_card(_USER, _CARD_INIT)),
+    Scenario("alatpay.generate_virtual_account", "alatpay",
+             lambda a: a.bank_transfer.generate_virtual_account(_ACCOUNT),
+             lambda a: a.bank_transfer.generate_virtual_account(_ACCOUNT)),
+    Scenario("alatpay.confirm_transaction_status", "alatpay",
+             lambda a: a.bank_transfer.confirm_transaction_status("txn-00001"),
+             lambda a: a.bank_transfer.confirm_transaction_status("txn-00001"))
+)
@@ -0,0 +1,221 @@
+import asyncio
+import httpx
+import time
+from datetime import datetime, timedelta, timezone
+from transport import codec
+from typing import Dict, List, Tuple
+
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _customer(i: int) -> Dict:
+    return {
+        "id": 100000 + i,
+        "first_name": "Ada",
+        "last_name": "Obi",
+        "email": f"customer{i}@example.com",
+        "customer_code": f"CUS_{i:010d}",
+        "phone": "+2348012345678",
+        "metadata": None,
+        "risk_action": "default",
+        "international_format_phone": "+2348012345678"
+    }
+
+
+def transaction(i: int, status: str = "success") -> Dict:
+    """
+    A Paystack transaction shaped like the live API's, log and authorization included.
+    """
+    created = (BASE_TIME + timedelta(minutes=i)).isoformat()
+    return {
+        "id": 4000000000 + i,
+        "domain": "test",
+        "status": status,
+        "reference": f"ref-{i:012d}",
+        "receipt_number": None,
+        "amount": 50000 + i,
+        "message": None,
+        "gateway_response": "Successful",
+        "paid_at": created,
+        "created_at": created,
+        "channel": "card",
+        "currency": "NGN",
+        "ip_address": "102.89.0.1",
+        "metadata": {"custom_fields": [{"display_name": "Cart ID", "variable_name": "cart_id", "value": str(i)}]},
+        "log": {
+            "start_time": 1704067200,
+            "time_spent": 9,
+            "attempts": 1,
+            "errors": 0,
+            "success": True,
+            "mobile": False,
+            "input": [],
+            "history": [
+                {"type": "action", "message": "Attempted to pay with card", "time": 7},
+                {"type": "success", "message": "Successfully paid with card", "time": 9}
+            ]
+        },
+        "fees": 750,
+        "fees_split": None,
+        "authorization": {
+            "authorization_code": f"AUTH_{i:010d}",
+            "bin": "408408",
+            "last4": "4081",
+            "exp_month": "12",
+            "exp_year": "2030",
+            "channel": "card",
+            "card_type": "visa ",
+            "bank": "TEST BANK",
+            "country_code": "NG",
+            "brand": "visa",
+            "reusable": True,
+            "signature": f"SIG_{i:016d}",
+            "account_name": None
+        },
+        "customer": _customer(i),
+        "plan": None,
+        "split": {},
+        "order_id": None,
+        "paidAt": created,
+        "createdAt": created,
+        "requested_amount": 50000 + i,
+        "pos_transaction_data": None,
+        "source": None,
+        "fees_breakdown": None,
+        "connect": None,
+        "transaction_date": created,
+        "plan_object": {},
+        "subaccount": {}
+    }
+
+
+def paystack_routes(page_size: int) -> List[Tuple[str, str, Dict]]:
+    """
+    (method, path prefix, body) for every Paystack transaction endpoint.
+    `page_size` sets how many transactions a list page carries.
+    """
+    charge = {key: value for key, value in transaction(1).items() if key not in ("fees_split", "split", "order_id", "requested_amount")}
+    return [
+        ("POST", "/transaction/initialize", {
+            "status": True,
+            "message": "Authorization URL created",
+            "data": {"authorization_url": "https://checkout.paystack.com/abc123", "access_code": "abc123", "reference": "ref-000000000001"}
+        }),
+        ("GET", "/transaction/verify/", {"status": True, "message": "Verification successful", "data": transaction(1)}),
+        ("GET", "/transaction/timeline/", {"status": True, "message": "Timeline retrieved", "data": transaction(1)["log"]}),
+        ("GET", "/transaction/totals", {
+            "status": True,
+            "message": "Transaction totals",
+            "data": {
+                "total_transactions": 42,
+                "total_volume": 2100000,
+                "total_volume_by_currency": [{"currency": "NGN", "amount": 2100000}],
+                "pending_transfers": 0,
+                "pending_transfers_by_currency": [{"currency": "NGN", "amount": 0}]
+            }
+        }),
+        ("GET", "/transaction/export", {
+            "status": True,
+            "message": "Export successful",
+            "data": {"path": "https://files.paystack.co/exports/transactions.csv", "expiresAt": "2024-01-01T01:00:00Z"}
+        }),
+        ("POST", "/transaction/charge_authorization", {"status": True, "message": "Charge attempted", "data": charge}),
+        ("POST", "/transaction/partial_debit", {"status": True, "message": "Charge attempted", "data": {**charge, "metadata": None, "log": None, "plan": None}}),
+        ("GET", "/transaction/", {"status": True, "message": "Transaction retrieved", "data": transaction(1)}),
+        ("GET", "/transaction", {
+            "status": True,
+            "message": "Transactions retrieved",
+            "data": [transaction(i) for i in range(page_size)],
+            "meta": {"total": page_size, "perPage": page_size, "page": 1, "pageCount": 1}
+        })
+    ]
+
+
+def alatpay_routes() -> List[Tuple[str, str, Dict]]:
+    account = {
+        "businessId": "biz-00001",
+        "amount": 5000.0,
+        "currency": "NGN",
+        "orderId": "order-00001",
+        "description": "Benchmark order",
+        "customer": {
+            "email": "customer1@example.com",
+            "phone": "08012345678",
+            "firstName": "Ada",
+            "lastName": "Obi",
+            "metadata": "{}"
+        },
+        "id": "va-00001",
+        "merchantId": "merchant-00001",
+        "virtualBankCode": "035",
+        "virtualBankAccountNumber": "1234567890",
+        "businessBankAccountNumber": "0987654321",
+        "businessBankCode": "00035",
+        "transactionId": "txn-00001",
+        "status": "pending",
+        "expiredAt": "2024-01-01T00:30:00Z",
+        "settlementType": "instant",
+        "createdAt": "2024-01-01T00:00:00Z"
+    }
+    return [
+        ("POST", "/paymentCard/api/v1/paymentCard/mc/initialize", {
+            "status": True,
+            "message": "Success",
+            "gatewayRecommendation": "PROCEED",
+            "transactionId": "txn-00001",
+            "orderId": "order-00001"
+        }),
+        ("POST", "/paymentcard/api/v1/paymentCard/mc/authenticate", {
+            "status": True,
+            "message": "Success",
+            "redirectHtml": "<form action='https://acs.example.com'></form>",
+            "gatewayRecommendation": "PROCEED",
+            "transactionId": "txn-00001",
+            "orderId": "order-00001"
+        }),
+        ("POST", "/bank-transfer/api/v1/bankTransfer/virtualAccount", {"status": True, "message": "Business fetched locally", "data": account}),
+        ("GET", "/bank-transfer/api/v1/bankTransfer/transactions/", {"status": True, "message": "Success", "data": {**account, "status": "completed"}})
+    ]
+
+
+class MockGateway():
+    """
+    Serves canned Paystack and ALATPay responses through httpx.MockTransport.
+
+    Bodies are serialised once up front so the stub itself costs next to
+    nothing; `latency` seconds of simulated network time are added to every
+    response (slept, or awaited for the async transport).
+    """
+
+    def __init__(self, page_size: int = 50, latency: float = 0.0):
+        self.latency = latency
+        self.__routes = [
+            (method, prefix, codec.dumps(body))
+            for method, prefix, body in paystack_routes(page_size) + alatpay_routes()
+        ]
+        self.requests = 0
+
+    def _response(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        path = request.url.path
+        for method, prefix, body in self.__routes:
+            if request.method == method and (path == prefix or (prefix.endswith("/") and path.startswith(prefix))):
+                return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+        return httpx.Response(404, json={"message": f"No stub for {request.method} {path}"})
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._response(request)
+
+    async def _handle_async(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._response(request)
+
+    def client(self) -> httpx.Client:
+        return httpx.Client(transport=httpx.MockTransport(self._handle))
+
+    def async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self._handle_async))
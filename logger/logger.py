@@ -1,14 +1,300 @@
+import atexit
 import logging
 import logging.config as config
-import logging
-import logging.config as config
+import logging.handlers
+import queue
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+OVERFLOW_POLICIES = ("drop_new", "drop_old", "block")
+
+_LOGGERS = ("alatpay", "paystack", "reconciliation", "stripe", "transport", "webhooks")
+
+_listener: Optional["BatchingQueueListener"] = None
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps a random `rate` share of records at or below `level` (routine
+    success and debug lines); anything above it always passes. Rates can
+    be set per logger with `rates`, matched on the longest name prefix,
+    e.g. {"paystack.transactions": 0.01}.
+    """
+
+    def __init__(self, rate: float = 1.0, level: int = logging.INFO, rates: Dict[str, float] = None):
+        super().__init__()
+        self.rate = rate
+        self.level = level
+        self.rates = dict(rates or {})
+        self.__by_logger: Dict[str, float] = {}
+
+    def _rate(self, name: str) -> float:
+        rate = self.__by_logger.get(name)
+        if rate is None:
+            prefixes = [prefix for prefix in self.rates if name == prefix or name.startswith(prefix + ".")]
+            rate = self.rates[max(prefixes, key=len)] if prefixes else self.rate
+            self.__by_logger[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.level:
+            return True
+        # Shared by several handlers, decide once per record
+        keep = getattr(record, "_sampled", None)
+        if keep is None:
+            rate = self._rate(record.name)
+            keep = record._sampled = rate >= 1.0 or random.random() < rate
+        return keep
+
+
+class DuplicateFilter(logging.Filter):
+    """
+    Rate limits similar records at or above `level`: the same logger, level,
+    call site and message template, whatever the arguments. The first
+    `burst` of them per `window` seconds pass; the rest are suppressed and
+    counted, and the next one let through carries a "(N similar suppressed)"
+    note, also set as its `suppressed` attribute.
+    """
+
+    def __init__(self, window: float = 60.0, burst: int = 1, level: int = logging.WARNING, max_keys: int = 10_000):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.level = level
+        self.max_keys = max_keys
+        # key -> [window start, passed in window, suppressed since last pass]
+        self.__seen: Dict[Tuple, List] = {}
+        self.__lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        expired = [key for key, entry in self.__seen.items() if now - entry[0] >= self.window and not entry[2]]
+        for key in expired:
+            del self.__seen[key]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.level:
+            return True
+        keep = getattr(record, "_deduplicated", None)
+        if keep is not None:
+            return keep
+
+        key = (record.name, record.levelno, record.pathname, record.lineno, record.msg)
+        now = time.monotonic()
+        with self.__lock:
+            entry = self.__seen.get(key)
+            if entry is None:
+                if len(self.__seen) >= self.max_keys:
+                    self._prune(now)
+                entry = self.__seen[key] = [now, 0, 0]
+            elif now - entry[0] >= self.window:
+                entry[0], entry[1] = now, 0
+
+            keep = entry[1] < self.burst
+            if keep:
+                entry[1] += 1
+                suppressed, entry[2] = entry[2], 0
+            else:
+                entry[2] += 1
+
+        if keep and suppressed:
+            record.msg = f"{record.getMessage()} ({suppressed} similar suppressed)"
+            record.args = None
+            record.suppressed = suppressed
+        record._deduplicated = keep
+        return keep
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Puts records on a bounded queue for a BatchingQueueListener to write.
+
+    When the queue is full the record is dropped (`drop_new`), the oldest
+    queued record is dropped to make room (`drop_old`), or the caller waits
+    up to `block_timeout` seconds before dropping it (`block`; don't use it
+    from an event loop). Dropped records are counted in `dropped`.
+
+    Only the message itself is interpolated here, so later changes to its
+    arguments cannot alter it; the formatter (timestamps, JSON, tracebacks)
+    runs on the listener thread.
+    """
+
+    def __init__(self, queue_: queue.Queue, overflow: str = "drop_new", block_timeout: float = 0.5):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r}, expected one of: {', '.join(OVERFLOW_POLICIES)}")
+        super().__init__(queue_)
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self.__dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def _drop(self) -> None:
+        with self.__dropped_lock:
+            self.dropped += 1
+
+    def take_dropped(self) -> int:
+        with self.__dropped_lock:
+            dropped, self.dropped = self.dropped, 0
+        return dropped
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if self.overflow == "block":
+            try:
+                self.queue.put(record, timeout=self.block_timeout)
+            except queue.Full:
+                self._drop()
+            return
+
+        if self.overflow == "drop_old":
+            try:
+                oldest = self.queue.get_nowait()
+                if oldest is None:
+                    # The listener's stop sentinel, it has to stay
+                    self.queue.put_nowait(oldest)
+                else:
+                    self._drop()
+                    self.queue.put_nowait(record)
+                    return
+            except (queue.Empty, queue.Full):
+                pass
+        self._drop()
+
+
+def _write_batch(handler: logging.Handler, records: List[logging.LogRecord]) -> None:
+    """
+    Format a batch of records and write them with a single flush. Stream
+    and file handlers (rotating ones included) are written directly, any
+    other handler gets its records one by one.
+    """
+    if not isinstance(handler, logging.StreamHandler):
+        for record in records:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return
+
+    rotating = isinstance(handler, logging.handlers.BaseRotatingHandler)
+    handler.acquire()
+    try:
+        for record in records:
+            if record.levelno < handler.level or not handler.filter(record):
+                continue
+            try:
+                if rotating and handler.shouldRollover(record):
+                    handler.doRollover()
+                if handler.stream is None:
+                    # FileHandler opened with delay=True
+                    handler.stream = handler._open()
+                handler.stream.write(handler.format(record) + handler.terminator)
+            except Exception:
+                handler.handleError(record)
+        handler.flush()
+    finally:
+        handler.release()
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    Drains a BoundedQueueHandler's queue on a background thread, writing up
+    to `batch_size` records at a time with one flush per batch. A partial
+    batch is written once `flush_interval` seconds pass without a new
+    record. Records dropped on overflow are reported in a warning.
+    """
+
+    def __init__(self,
+            source: BoundedQueueHandler,
+            *handlers: logging.Handler,
+            batch_size: int = 100,
+            flush_interval: float = 0.5
+        ):
+        super().__init__(source.queue, *handlers, respect_handler_level=True)
+        self.source = source
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+    def _dropped_record(self, count: int) -> logging.LogRecord:
+        return logging.LogRecord(
+            "logger", logging.WARNING, __file__, 0,
+            "%d log records dropped, the logging queue was full", (count,), None
+        )
+
+    def _monitor(self) -> None:
+        q = self.queue
+        stopping = False
+        while not stopping:
+            try:
+                records = [q.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                records = []
+
+            while len(records) < self.batch_size:
+                try:
+                    records.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            if records and records[-1] is self._sentinel:
+                records.pop()
+                stopping = True
+            elif self._sentinel in records:
+                records.remove(self._sentinel)
+                stopping = True
+
+            dropped = self.source.take_dropped()
+            if dropped:
+                records.append(self._dropped_record(dropped))
+            if records:
+                for handler in self.handlers:
+                    _write_batch(handler, records)
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        # The sentinel must get through even when the queue is full
+        self.queue.put(self._sentinel)
+        self._thread.join()
+        self._thread = None
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def apply_default_logging(
     log_level: str = "INFO",
     log_file: str = None,
-    use_json: bool = False
-):
+    use_json: bool = False,
+    max_bytes: int = 0,
+    backup_count: int = 5,
+    rotate_when: str = None,
+    use_queue: bool = False,
+    queue_size: int = 10_000,
+    overflow: str = "drop_new",
+    batch_size: int = 100,
+    flush_interval: float = 0.5,
+    sample_rate: float = 1.0,
+    sample_rates: Dict[str, float] = None,
+    dedup_window: float = 0.0,
+    dedup_burst: int = 1
+) -> Optional[BatchingQueueListener]:
     
     """
     Applies a default logging configuration.
@@ -17,8 +303,27 @@ def apply_default_logging(
     - log_level: Global log level (default: INFO)
     - log_file: If provided, logs will also be saved to this file
     - use_json: If True, use JSON formatter for logs
+    - max_bytes: Rotate the log file once it reaches this size (0: never)
+    - backup_count: Rotated log files to keep
+    - rotate_when: Rotate the log file on a schedule instead, e.g. "midnight"
+      or "H" (see logging.handlers.TimedRotatingFileHandler)
+    - use_queue: If True, loggers only put records on a bounded queue and a
+      background thread formats and writes them, so no log I/O happens on
+      the calling thread. Returns the running listener
+    - queue_size: Records the queue holds before `overflow` applies
+    - overflow: "drop_new", "drop_old" or "block" (see BoundedQueueHandler)
+    - batch_size / flush_interval: Records written per flush, and how long a
+      partial batch may wait
+    - sample_rate: Share of INFO and DEBUG records kept (see SamplingFilter),
+      sample_rates overrides it per logger name prefix
+    - dedup_window / dedup_burst: If set, similar WARNING and ERROR records
+      beyond `dedup_burst` per `dedup_window` seconds are suppressed (see
+      DuplicateFilter)
     """
 
+    global _listener
+    _stop_listener()
+
     base_formatter = {
         "format": "%(levelname)s [%(asctime)s] %(name)s - %(message)s",
         "datefmt": "%Y-%m-%d %H:%M:%S"
@@ -43,6 +348,18 @@ def apply_default_logging(
             "filename": log_file,
             "formatter": "json" if use_json else "default",
         }
+        if max_bytes:
+            handlers["file"].update({
+                "class": "logging.handlers.RotatingFileHandler",
+                "maxBytes": max_bytes,
+                "backupCount": backup_count
+            })
+        elif rotate_when:
+            handlers["file"].update({
+                "class": "logging.handlers.TimedRotatingFileHandler",
+                "when": rotate_when,
+                "backupCount": backup_count
+            })
 
     LOGGING_CONFIG = {
         "version": 1,
@@ -53,21 +370,43 @@ def apply_default_logging(
         },
         "handlers": handlers,
         "loggers": {
-            "alatpay": {
-                "handlers": list(handlers.keys()),
-                "level": log_level.upper(),
-                "propagate": False
-            },
-            "stripe": {
+            name: {
                 "handlers": list(handlers.keys()),
                 "level": log_level.upper(),
                 "propagate": False
             }
+            for name in _LOGGERS
         }
     }
 
     config.dictConfig(LOGGING_CONFIG)
 
+    filters = []
+    if sample_rate < 1.0 or sample_rates:
+        filters.append(SamplingFilter(sample_rate, rates=sample_rates))
+    if dedup_window:
+        filters.append(DuplicateFilter(dedup_window, dedup_burst))
+
+    targets = logging.getLogger(_LOGGERS[0]).handlers
+    if not use_queue:
+        for handler in targets:
+            for log_filter in filters:
+                handler.addFilter(log_filter)
+        return None
+
+    # dictConfig built the real handlers; the loggers now only feed the
+    # queue and the listener thread owns the handlers. Filtering before the
+    # queue keeps sampled out records from ever being enqueued.
+    queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size), overflow=overflow)
+    for log_filter in filters:
+        queue_handler.addFilter(log_filter)
+    for name in _LOGGERS:
+        logging.getLogger(name).handlers = [queue_handler]
+
+    _listener = BatchingQueueListener(queue_handler, *targets, batch_size=batch_size, flush_interval=flush_interval)
+    _listener.start()
+    return _listener
+
 def get_logger(name: str = "payment") -> logging.Logger:
     """
     Returns a logger with a NullHandler if no handlers are attached.
@@ -0,0 +1,266 @@
+import math
+from array import array
+from datetime import datetime, timezone
+from paystack.models import ByCurrency, TransactionsTotalData
+from transport.fields import get_field, to_epoch
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Fields iter_transactions(fields=...) needs to feed TransactionColumns
+ANALYTICS_FIELDS = ("amount", "fees", "currency", "channel", "status", "created_at", "customer")
+
+GROUP_KEYS = ("currency", "channel", "status", "customer", "hour", "hour_of_day", "day")
+
+_ENCODED = ("currency", "channel", "status")
+
+Label = Union[str, int, Tuple]
+
+
+def _hour_label(bucket: int) -> str:
+    return datetime.fromtimestamp(bucket * 3600, timezone.utc).strftime("%Y-%m-%dT%H:00:00Z")
+
+
+def _day_label(bucket: int) -> str:
+    return datetime.fromtimestamp(bucket * 86400, timezone.utc).strftime("%Y-%m-%d")
+
+
+def percentile(ordered: Sequence[float], q: float) -> float:
+    """
+    Linear interpolation between closest ranks, numpy's default method.
+    """
+    if not ordered:
+        return math.nan
+    rank = (len(ordered) - 1) * q / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class TransactionColumns():
+    """
+    Transactions held column by column in typed arrays for fast aggregation.
+
+    Amounts, fees, customer ids and timestamps are stored in `array` buffers;
+    currency, channel and status are dictionary encoded. Appending a
+    transaction costs a few machine words whatever its payload size, so a
+    month of streamed transactions fits in a few MB. Aggregations run on
+    zero-copy numpy views when numpy is installed and fall back to single
+    pure-Python passes over the arrays otherwise.
+
+        columns = TransactionColumns(handler.iter_transactions(params, fields=ANALYTICS_FIELDS))
+        columns.totals()
+        columns.group_by("channel", "currency")
+        columns.percentiles(by="channel")
+    """
+
+    def __init__(self, transactions: Iterable[Any] = ()):
+        self.amount = array("q")
+        self.fees = array("q")
+        self.customer = array("q")
+        self.created = array("d")
+        self.currency = array("H")
+        self.channel = array("H")
+        self.status = array("H")
+        self.labels: Dict[str, List[Optional[str]]] = {key: [] for key in _ENCODED}
+        self.__codes: Dict[str, Dict[Optional[str], int]] = {key: {} for key in _ENCODED}
+        self.extend(transactions)
+
+    def __len__(self) -> int:
+        return len(self.amount)
+
+    def _encode(self, key: str, value: Optional[str]) -> int:
+        codes = self.__codes[key]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.labels[key])
+            self.labels[key].append(value)
+        return code
+
+    def append(self, transaction: Any) -> None:
+        """
+        Add one transaction: a list/mirror model, a projection holding
+        ANALYTICS_FIELDS, a CompactTransaction, or a raw dict from a page
+        or export.
+        """
+        customer = get_field(transaction, "customer")
+        self.amount.append(int(get_field(transaction, "amount") or 0))
+        self.fees.append(int(get_field(transaction, "fees") or 0))
+        self.customer.append(int((get_field(customer, "id") if customer is not None else get_field(transaction, "customer_id")) or 0))
+        self.created.append(to_epoch(get_field(transaction, "created_at") or get_field(transaction, "createdAt")))
+        self.currency.append(self._encode("currency", get_field(transaction, "currency")))
+        self.channel.append(self._encode("channel", get_field(transaction, "channel")))
+        self.status.append(self._encode("status", get_field(transaction, "status")))
+
+    def extend(self, transactions: Iterable[Any]) -> None:
+        for transaction in transactions:
+            self.append(transaction)
+
+    def _rows(self, status: Optional[str]) -> Any:
+        """
+        Row selector for `status`: a boolean mask (numpy) or index list, None for all rows.
+        """
+        if status is None:
+            return None
+        code = self.__codes["status"].get(status, -1)
+        if np is not None:
+            return np.frombuffer(self.status, dtype=np.uint16) == code
+        return [i for i, value in enumerate(self.status) if value == code]
+
+    def _column(self, name: str, rows: Any) -> Any:
+        values = getattr(self, name)
+        if np is not None:
+            view = np.frombuffer(values, dtype={"q": np.int64, "d": np.float64, "H": np.uint16}[values.typecode])
+            return view if rows is None else view[rows]
+        return list(values) if rows is None else [values[i] for i in rows]
+
+    def _key_codes(self, key: str, rows: Any) -> Tuple[Any, List[Label]]:
+        """
+        Per-row integer group codes for one key, with the label of each code.
+        """
+        if key in _ENCODED:
+            return self._column(key, rows), self.labels[key]
+
+        if key == "customer":
+            values = self._column("customer", rows)
+            label = int
+        else:
+            created = self._column("created", rows)
+            width = 86400 if key == "day" else 3600
+            label = {"hour": _hour_label, "day": _day_label, "hour_of_day": int}[key]
+            if np is not None:
+                buckets = np.floor(np.nan_to_num(created, nan=-width) / width).astype(np.int64)
+                values = buckets % 24 if key == "hour_of_day" else buckets
+            else:
+                buckets = [math.floor(ts / width) if ts == ts else -1 for ts in created]
+                values = [bucket % 24 for bucket in buckets] if key == "hour_of_day" else buckets
+
+        if np is not None:
+            uniques, codes = np.unique(values, return_inverse=True)
+            return codes, [label(int(value)) for value in uniques]
+        uniques = sorted(set(values))
+        index = {value: code for code, value in enumerate(uniques)}
+        return [index[value] for value in values], [label(value) for value in uniques]
+
+    def _groups(self, keys: Sequence[str], rows: Any) -> Tuple[Any, List[Label]]:
+        for key in keys:
+            if key not in GROUP_KEYS:
+                raise ValueError(f"Unknown group key {key!r}, expected one of: {', '.join(GROUP_KEYS)}")
+
+        codes, labels = self._key_codes(keys[0], rows)
+        labels = [(label,) for label in labels]
+        for key in keys[1:]:
+            next_codes, next_labels = self._key_codes(key, rows)
+            width = len(next_labels)
+            if np is not None:
+                combined = codes.astype(np.int64) * width + next_codes
+                uniques, codes = np.unique(combined, return_inverse=True)
+                pairs = [(int(value) // width, int(value) % width) for value in uniques]
+            else:
+                combined = [code * width + next_code for code, next_code in zip(codes, next_codes)]
+                uniques = sorted(set(combined))
+                index = {value: i for i, value in enumerate(uniques)}
+                codes = [index[value] for value in combined]
+                pairs = [(value // width, value % width) for value in uniques]
+            labels = [labels[first] + (next_labels[second],) for first, second in pairs]
+
+        return codes, [label[0] if len(keys) == 1 else label for label in labels]
+
+    def group_by(self, *keys: str, status: Optional[str] = "success") -> Dict[Label, Dict[str, int]]:
+        """
+        Count, amount and fees per group. Keys: currency, channel, status,
+        customer, hour (hourly UTC buckets), hour_of_day, day. Several keys
+        group by their combination, labelled with tuples.
+        """
+        rows = self._rows(status)
+        codes, labels = self._groups(keys, rows)
+        amount, fees = self._column("amount", rows), self._column("fees", rows)
+
+        if np is not None:
+            size = len(labels)
+            counts = np.bincount(codes, minlength=size)
+            amounts = np.bincount(codes, weights=amount, minlength=size)
+            fee_sums = np.bincount(codes, weights=fees, minlength=size)
+        else:
+            counts, amounts, fee_sums = [0] * len(labels), [0] * len(labels), [0] * len(labels)
+            for code, value, fee in zip(codes, amount, fees):
+                counts[code] += 1
+                amounts[code] += value
+                fee_sums[code] += fee
+
+        return {
+            label: {"count": int(counts[i]), "amount": int(amounts[i]), "fees": int(fee_sums[i])}
+            for i, label in enumerate(labels) if counts[i]
+        }
+
+    def percentiles(self,
+            column: str = "amount",
+            q: Sequence[float] = (50, 90, 99),
+            by: Union[str, Sequence[str]] = None,
+            status: Optional[str] = "success"
+        ) -> Dict:
+        """
+        Percentiles of `column` (amount or fees), overall or per group of `by`.
+        """
+        rows = self._rows(status)
+        values = self._column(column, rows)
+
+        if by is None:
+            if np is not None:
+                return {p: float(np.percentile(values, p)) if len(values) else math.nan for p in q}
+            ordered = sorted(values)
+            return {p: float(percentile(ordered, p)) for p in q}
+
+        codes, labels = self._groups((by,) if isinstance(by, str) else tuple(by), rows)
+        if np is not None:
+            order = np.lexsort((values, codes))
+            bounds = np.cumsum(np.bincount(codes, minlength=len(labels)))
+            groups = np.split(values[order], bounds[:-1])
+            return {
+                labels[i]: {p: float(value) for p, value in zip(q, np.percentile(group, q))}
+                for i, group in enumerate(groups) if len(group)
+            }
+
+        grouped: Dict[int, List] = {}
+        for code, value in zip(codes, values):
+            grouped.setdefault(code, []).append(value)
+        return {
+            labels[code]: {p: float(percentile(sorted(group), p)) for p in q}
+            for code, group in grouped.items()
+        }
+
+    def totals(self, status: Optional[str] = "success") -> TransactionsTotalData:
+        """
+        The figures of `transaction_totals`, computed locally. Pending
+        transfers are not part of the transaction list and report as zero.
+        """
+        by_currency = self.group_by("currency", status=status)
+        return TransactionsTotalData(
+            total_transactions=sum(group["count"] for group in by_currency.values()),
+            total_volume=sum(group["amount"] for group in by_currency.values()),
+            total_volume_by_currency=[
+                ByCurrency(currency=currency, amount=group["amount"]) for currency, group in by_currency.items()
+            ],
+            pending_transfers=0,
+            pending_transfers_by_currency=[]
+        )
+
+    def breakdown(self, status: Optional[str] = "success", top_customers: int = 20) -> Dict[str, Any]:
+        """
+        `totals` plus per-channel, per-currency, hourly and top-customer
+        breakdowns and amount percentiles.
+        """
+        by_customer = self.group_by("customer", status=status)
+        top = sorted(by_customer.items(), key=lambda item: item[1]["amount"], reverse=True)[:top_customers]
+        return {
+            "totals": self.totals(status),
+            "by_channel": self.group_by("channel", status=status),
+            "by_currency": self.group_by("currency", status=status),
+            "by_hour": self.group_by("hour", status=status),
+            "by_customer": dict(top),
+            "amount_percentiles": self.percentiles("amount", status=status)
+        }
@@ -3,96 +3,110 @@ import httpx
 import os
 from dotenv import load_dotenv
 from logger.logger import get_logger
-from paystack.transactions.handler import TransactionHandler 
+from paystack.transactions.handler import AsyncTransactionHandler, TransactionHandler
+from transport.cache import ResponseCache
+from transport.routes import RouteTable
+from transport.transport import AsyncBaseIntegration, BaseIntegration
 from typing import Dict
 
 
 load_dotenv()
 logger = get_logger(__name__) 
 
+PAYSTACK_ROUTES = RouteTable([
+    "/transaction",
+    "/transaction/initialize",
+    "/transaction/verify/{reference}",
+    "/transaction/{id}",
+    "/transaction/charge_authorization",
+    "/transaction/timeline/{id_or_ref}",
+    "/transaction/totals",
+    "/transaction/export",
+    "/transaction/partial_debit"
+])
+
+
+def _paystack_settings(integration_name: str) -> Dict:
+    secret_key = os.getenv("PAYSTACK_TEST_SECRET_KEY")
+    base_url = os.getenv("PAYSTACK_BASE_URL")
+
+    if not all([secret_key, base_url]):
+        logger.error("Missing required environment variables for %s.", integration_name)
+        raise EnvironmentError(f"Missing required environment variables for {integration_name}")
+
+    return {
+        "base_url": base_url,
+        "headers": {
+            "Authorization": f"Bearer {secret_key}",
+            "Cache-Control": "no-cache"
+        }
+    }
 
-class PayStackIntegration():
 
-    def __init__(self, client: httpx.Client = None):
-        self.__secret_key = os.getenv("PAYSTACK_TEST_SECRET_KEY")
-        self.__base_url = os.getenv("PAYSTACK_BASE_URL")
-        self.__client = client or httpx.Client()
+class PayStackIntegration(BaseIntegration):
 
-        self.__transactions = None
+    provider = "paystack"
+    routes = PAYSTACK_ROUTES
 
-        if not all([self.__secret_key, self.__base_url]):
-            logger.error("Missing required environment variables for PayStackIntegration.")
-            raise EnvironmentError("Missing required environment variables for PayStackIntegration")
+    def __init__(self, client: httpx.Client = None, lazy: bool = False, cache: ResponseCache = None, **options):
+        super().__init__(
+            **_paystack_settings("PayStackIntegration"),
+            client=client,
+            **options
+        )
 
-    def __enter__(self):
-        return self
+        self.__lazy = lazy
+        self.__cache = cache
+        self.__transactions = None
 
-    def __exit__(self, exc_type, exc_value, traceback):
-        self.__client.close()
+    @property
+    def transactions(self) -> TransactionHandler:
+        if self.__transactions is None:
+            self.__transactions = TransactionHandler(
+                post_request=self._post_request,
+                get_request=self._get_request,
+                post_raw_request=self._post_raw_request if self._fast_json else None,
+                get_raw_request=self._get_raw_request if self._fast_json else None,
+                lazy=self.__lazy,
+                cache=self.__cache,
+                download=self._download,
+                instrumentation=self._instrumentation
+            )
+        return self.__transactions
 
-    def close(self):
-        self.__client.close()
 
-    def _get_request(self, path: str, params: Dict = None) -> Dict:
-        authorization = f"Bearer {self.__secret_key}"
-        headers = {
-            "Authorization": authorization,
-            "Cache-Control": "no-cache"
-        }
+class AsyncPayStackIntegration(AsyncBaseIntegration):
 
-        try:
-            resp = self.__client.get(
-                url=f"{self.__base_url}{path}",
-                headers=headers,
-                params=params if params else None
-            )
-            resp.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            raise
-        
-        retVal = resp.json()
-        return retVal
-
-
-    def _post_request(self, payload: Dict, path: str) -> Dict:
-        authorization = f"Bearer {self.__secret_key}"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": authorization,
-            "Cache-Control": "no-cache"
-        }
+    provider = "paystack"
+    routes = PAYSTACK_ROUTES
 
-        try:
-            resp = self.__client.post(
-                url=f"{self.__base_url}{path}",
-                json=payload,
-                headers=headers
-            )
-            resp.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            raise
+    def __init__(self, client: httpx.AsyncClient = None, lazy: bool = False, cache: ResponseCache = None, **options):
+        super().__init__(
+            **_paystack_settings("AsyncPayStackIntegration"),
+            client=client,
+            **options
+        )
 
-        resp_data = resp.json()
-        return resp_data
+        self.__lazy = lazy
+        self.__cache = cache
+        self.__transactions = None
 
     @property
-    def transactions(self) -> TransactionHandler:
+    def transactions(self) -> AsyncTransactionHandler:
         if self.__transactions is None:
-            self.__transactions = TransactionHandler(
+            self.__transactions = AsyncTransactionHandler(
                 post_request=self._post_request,
-                get_request=self._get_request
+                get_request=self._get_request,
+                post_raw_request=self._post_raw_request if self._fast_json else None,
+                get_raw_request=self._get_raw_request if self._fast_json else None,
+                lazy=self.__lazy,
+                cache=self.__cache,
+                download=self._download,
+                instrumentation=self._instrumentation
             )
         return self.__transactions
 
 
 
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    pass
@@ -0,0 +1,300 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from logger.logger import get_logger
+from paystack.models import ByCurrency, CompactTransaction, ListTransactionsDataModel, TransactionsTotalData
+from paystack.transactions.handler import AsyncTransactionHandler, TransactionHandler
+from transport import codec
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+logger = get_logger(__name__)
+
+_COLUMNS = (
+    "id", "reference", "customer_id", "customer_email", "status", "amount",
+    "fees", "currency", "channel", "created_at", "paid_at", "raw"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    reference TEXT,
+    customer_id INTEGER,
+    customer_email TEXT,
+    status TEXT,
+    amount INTEGER,
+    fees INTEGER,
+    currency TEXT,
+    channel TEXT,
+    created_at TEXT,
+    paid_at TEXT,
+    raw BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_reference ON transactions (reference);
+CREATE INDEX IF NOT EXISTS transactions_customer ON transactions (customer_id);
+CREATE INDEX IF NOT EXISTS transactions_status ON transactions (status, created_at);
+CREATE INDEX IF NOT EXISTS transactions_created_at ON transactions (created_at);
+CREATE INDEX IF NOT EXISTS transactions_amount ON transactions (amount);
+CREATE TABLE IF NOT EXISTS mirror_state (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[str]:
+    """
+    Fixed-width UTC ISO strings, so SQLite can compare them as text.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _row(item: ListTransactionsDataModel) -> Tuple:
+    return (
+        item.id,
+        item.reference,
+        item.customer.id,
+        item.customer.email,
+        item.status,
+        item.amount,
+        item.fees,
+        item.currency,
+        item.channel,
+        _timestamp(item.created_at or item.createdAt),
+        _timestamp(item.paid_at or item.paidAt),
+        item.model_dump_json().encode()
+    )
+
+
+class TransactionMirror():
+    """
+    Local SQLite copy of the integration's transactions.
+
+    `sync` pages through every transaction the first time, then only asks
+    Paystack for transactions created since the newest one mirrored, minus
+    `overlap` seconds so late status changes (pending to success) on recent
+    transactions are picked up too. Queries never touch the network; use
+    `staleness` to decide when a sync is due.
+
+        mirror = TransactionMirror(integration.transactions, "data/paystack.db")
+        mirror.sync()
+        mirror.list(status="success", customer=292193195)
+    """
+
+    def __init__(self,
+            handler: Union[TransactionHandler, AsyncTransactionHandler],
+            path: str,
+            per_page: int = 100,
+            overlap: float = 24 * 3600,
+            batch_size: int = 500
+        ):
+        self.__handler = handler
+        self.path = path
+        self.per_page = per_page
+        self.overlap = overlap
+        self.batch_size = batch_size
+        self.__lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.__conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.__conn.close()
+
+    def _fetch(self, sql: str, args: Iterable = ()) -> List[Tuple]:
+        with self.__lock:
+            return self.__conn.execute(sql, tuple(args)).fetchall()
+
+    def _state(self, key: str) -> Optional[str]:
+        rows = self._fetch("SELECT value FROM mirror_state WHERE key = ?", (key,))
+        return rows[0][0] if rows else None
+
+    def _set_state(self, key: str, value: str) -> None:
+        self.__conn.execute("INSERT OR REPLACE INTO mirror_state (key, value) VALUES (?, ?)", (key, value))
+
+    def _sync_params(self) -> Dict:
+        params = {"perPage": self.per_page}
+        newest = self._state("newest_created_at")
+        if newest is not None and self._state("full_sync_complete"):
+            since = datetime.strptime(newest, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+            params["from"] = (since - timedelta(seconds=self.overlap)).isoformat()
+            params["to"] = datetime.now(timezone.utc).isoformat()
+        return params
+
+    def _upsert(self, items: List[ListTransactionsDataModel]) -> None:
+        with self.__lock:
+            self.__conn.execute("BEGIN")
+            try:
+                self.__conn.executemany(
+                    f"INSERT OR REPLACE INTO transactions ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    [_row(item) for item in items]
+                )
+                self.__conn.execute("COMMIT")
+            except BaseException:
+                self.__conn.execute("ROLLBACK")
+                raise
+
+    def _finish_sync(self, started: float, count: int) -> int:
+        newest = self._fetch("SELECT MAX(created_at) FROM transactions")[0][0]
+        with self.__lock:
+            if newest is not None:
+                self._set_state("newest_created_at", newest)
+            self._set_state("full_sync_complete", "1")
+            self._set_state("synced_at", str(started))
+
+        logger.info("Transaction mirror synced %s transactions in %.1fs", count, time.time() - started)
+        return count
+
+    def sync(self) -> int:
+        """
+        Bring the mirror up to date through a TransactionHandler. Returns the
+        number of transactions written.
+        """
+        started = time.time()
+        count = 0
+        batch = []
+        for item in self.__handler.iter_transactions(self._sync_params(), prefetch=True):
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._upsert(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            self._upsert(batch)
+            count += len(batch)
+        return self._finish_sync(started, count)
+
+    async def sync_async(self) -> int:
+        """
+        `sync` through an AsyncTransactionHandler. Database work runs on a
+        worker thread, so a busy database never stalls the event loop that is
+        fetching the next page.
+        """
+        started = time.time()
+        count = 0
+        batch = []
+        params = await asyncio.to_thread(self._sync_params)
+        async for item in self.__handler.iter_transactions(params, prefetch=True):
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                await asyncio.to_thread(self._upsert, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            await asyncio.to_thread(self._upsert, batch)
+            count += len(batch)
+        return await asyncio.to_thread(self._finish_sync, started, count)
+
+    @property
+    def synced_at(self) -> Optional[float]:
+        value = self._state("synced_at")
+        return float(value) if value is not None else None
+
+    def staleness(self) -> Optional[float]:
+        """
+        Seconds since the last sync started, None if the mirror was never synced.
+        """
+        synced_at = self.synced_at
+        return time.time() - synced_at if synced_at is not None else None
+
+    def _where(self,
+            status: str = None,
+            customer: int = None,
+            currency: str = None,
+            channel: str = None,
+            from_: datetime = None,
+            to: datetime = None,
+            amount_min: int = None,
+            amount_max: int = None
+        ) -> Tuple[str, List]:
+        clauses, args = [], []
+        for column, op, value in (
+            ("status", "=", status),
+            ("customer_id", "=", customer),
+            ("currency", "=", currency),
+            ("channel", "=", channel),
+            ("created_at", ">=", _timestamp(from_)),
+            ("created_at", "<=", _timestamp(to)),
+            ("amount", ">=", amount_min),
+            ("amount", "<=", amount_max)
+        ):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                args.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def get(self, reference: str) -> Optional[ListTransactionsDataModel]:
+        rows = self._fetch("SELECT raw FROM transactions WHERE reference = ? ORDER BY id DESC LIMIT 1", (reference,))
+        return ListTransactionsDataModel.model_validate_json(rows[0][0]) if rows else None
+
+    def list(self, limit: int = 50, offset: int = 0, **filters) -> List[ListTransactionsDataModel]:
+        """
+        Mirrored transactions, newest first. Filters: status, customer,
+        currency, channel, from_, to, amount_min, amount_max.
+        """
+        where, args = self._where(**filters)
+        rows = self._fetch(
+            f"SELECT raw FROM transactions{where} ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+            (*args, limit, offset)
+        )
+        return [ListTransactionsDataModel.model_validate_json(row[0]) for row in rows]
+
+    def iter(self,
+            batch_size: int = 1000,
+            compact: bool = False,
+            keep_raw: bool = False,
+            **filters
+        ) -> Iterable[Union[ListTransactionsDataModel, CompactTransaction]]:
+        """
+        Every matching transaction, oldest first, read in keyset-paginated
+        batches so the database is never locked while the caller iterates.
+        `compact=True` yields CompactTransaction tuples decoded straight from
+        the stored JSON without model validation; `keep_raw` keeps that JSON
+        on each record for `to_model()`.
+        """
+        where, args = self._where(**filters)
+        where = f"{where} AND" if where else " WHERE"
+        position = ("", 0)
+        while True:
+            rows = self._fetch(
+                f"SELECT COALESCE(created_at, ''), id, raw FROM transactions{where} (COALESCE(created_at, ''), id) > (?, ?)"
+                " ORDER BY COALESCE(created_at, ''), id LIMIT ?",
+                (*args, *position, batch_size)
+            )
+            if not rows:
+                return
+            for row in rows:
+                if compact:
+                    yield CompactTransaction.from_item(codec.loads(row[2]), row[2] if keep_raw else None)
+                else:
+                    yield ListTransactionsDataModel.model_validate_json(row[2])
+            position = rows[-1][:2]
+
+    def count(self, **filters) -> int:
+        where, args = self._where(**filters)
+        return self._fetch(f"SELECT COUNT(*) FROM transactions{where}", args)[0][0]
+
+    def totals(self, status: str = "success", **filters) -> TransactionsTotalData:
+        """
+        `transaction_totals` computed locally. Pending transfers are not part
+        of the transaction list, so they are always reported as zero.
+        """
+        where, args = self._where(status=status, **filters)
+        rows = self._fetch(
+            f"SELECT currency, COUNT(*), COALESCE(SUM(amount), 0) FROM transactions{where} GROUP BY currency",
+            args
+        )
+
+        return TransactionsTotalData(
+            total_transactions=sum(row[1] for row in rows),
+            total_volume=sum(row[2] for row in rows),
+            total_volume_by_currency=[ByCurrency(currency=row[0], amount=row[2]) for row in rows],
+            pending_transfers=0,
+            pending_transfers_by_currency=[]
+        )
@@ -1 +1,3 @@
 from .transaction_models import *
+from .lazy import *
+from .compact import *
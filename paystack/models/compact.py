@@ -0,0 +1,183 @@
+import sys
+from array import array
+from paystack.models.transaction_models import ListTransactionsDataModel
+from transport import codec
+from transport.fields import get_field, to_epoch
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+
+__all__ = ["CompactTransaction", "TransactionBatch"]
+
+_ENCODED = ("status", "currency", "channel", "domain")
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class CompactTransaction(NamedTuple):
+    """
+    The fields of a listed transaction that bulk jobs actually read, in a
+    plain tuple.
+
+    Status, currency, channel and domain are interned so a million records
+    share a handful of strings. Timestamps are epoch seconds, NaN when
+    unknown; a missing amount, fee or customer id is 0. `raw` holds the
+    transaction's JSON when it was kept, which is what `to_model` validates.
+    """
+
+    id: int
+    reference: Optional[str]
+    status: str
+    amount: int
+    fees: int
+    currency: Optional[str]
+    channel: str
+    domain: str
+    created_at: float
+    paid_at: float
+    customer_id: int
+    customer_email: Optional[str]
+    raw: Optional[bytes] = None
+
+    @classmethod
+    def from_item(cls, item: Any, raw: bytes = None) -> "CompactTransaction":
+        """
+        Build from a raw `/transaction` item, a mirror row decoded from JSON
+        or any model with the ListTransactionsDataModel field names.
+        """
+        customer = get_field(item, "customer")
+        return cls(
+            id=int(get_field(item, "id") or 0),
+            reference=get_field(item, "reference"),
+            status=_intern(get_field(item, "status")),
+            amount=int(get_field(item, "amount") or 0),
+            fees=int(get_field(item, "fees") or 0),
+            currency=_intern(get_field(item, "currency")),
+            channel=_intern(get_field(item, "channel")),
+            domain=_intern(get_field(item, "domain")),
+            created_at=to_epoch(get_field(item, "created_at") or get_field(item, "createdAt")),
+            paid_at=to_epoch(get_field(item, "paid_at") or get_field(item, "paidAt")),
+            customer_id=int((get_field(customer, "id") if customer is not None else None) or 0),
+            customer_email=get_field(customer, "email") if customer is not None else None,
+            raw=raw
+        )
+
+    def to_model(self) -> ListTransactionsDataModel:
+        """
+        Fully validated ListTransactionsDataModel, only possible when the
+        record was built with `keep_raw`.
+        """
+        if self.raw is None:
+            raise ValueError(f"Transaction {self.id} was stored without its raw JSON, pass keep_raw=True to keep it")
+        return ListTransactionsDataModel.model_validate_json(self.raw)
+
+
+class TransactionBatch():
+    """
+    CompactTransactions stored column by column.
+
+    Ids, amounts, fees, customer ids and timestamps live in `array` buffers,
+    status, currency, channel and domain are dictionary encoded into 2-byte
+    codes, so a row costs a few dozen bytes plus its reference and email.
+    Indexing or iterating rebuilds CompactTransaction tuples one at a time.
+
+        batch = TransactionBatch(handler.iter_transactions(params, compact=True))
+        batch.amount            # array('q', [...])
+        batch[0].to_model()     # needs keep_raw=True
+    """
+
+    def __init__(self, transactions: Iterable[Any] = (), keep_raw: bool = False, meta: Dict = None):
+        self.id = array("q")
+        self.amount = array("q")
+        self.fees = array("q")
+        self.customer_id = array("q")
+        self.created_at = array("d")
+        self.paid_at = array("d")
+        self.reference: List[Optional[str]] = []
+        self.customer_email: List[Optional[str]] = []
+        self.raw: Optional[List[Optional[bytes]]] = [] if keep_raw else None
+        self.meta = meta
+        self.labels: Dict[str, List[Optional[str]]] = {key: [] for key in _ENCODED}
+        self.__codes: Dict[str, Dict[Optional[str], int]] = {key: {} for key in _ENCODED}
+        self.__columns = {key: array("H") for key in _ENCODED}
+        self.extend(transactions)
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def _encode(self, key: str, value: Optional[str]) -> int:
+        codes = self.__codes[key]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.labels[key])
+            self.labels[key].append(_intern(value))
+        return code
+
+    def column(self, key: str) -> List[Optional[str]]:
+        """
+        Decoded values of status, currency, channel or domain, one per row.
+        """
+        labels = self.labels[key]
+        return [labels[code] for code in self.__columns[key]]
+
+    def append(self, transaction: Any) -> None:
+        """
+        Add a CompactTransaction, a raw `/transaction` item or a list model.
+        """
+        if not isinstance(transaction, CompactTransaction):
+            raw = None
+            if self.raw is not None:
+                raw = codec.dumps(transaction) if isinstance(transaction, dict) else transaction.model_dump_json().encode()
+            transaction = CompactTransaction.from_item(transaction, raw)
+
+        self.id.append(transaction.id)
+        self.amount.append(transaction.amount)
+        self.fees.append(transaction.fees)
+        self.customer_id.append(transaction.customer_id)
+        self.created_at.append(transaction.created_at)
+        self.paid_at.append(transaction.paid_at)
+        self.reference.append(transaction.reference)
+        self.customer_email.append(transaction.customer_email)
+        for key in _ENCODED:
+            self.__columns[key].append(self._encode(key, getattr(transaction, key)))
+        if self.raw is not None:
+            self.raw.append(transaction.raw)
+
+    def extend(self, transactions: Iterable[Any]) -> None:
+        for transaction in transactions:
+            self.append(transaction)
+
+    def __getitem__(self, index: int) -> CompactTransaction:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TransactionBatch index out of range")
+
+        labels, columns = self.labels, self.__columns
+        return CompactTransaction(
+            id=self.id[index],
+            reference=self.reference[index],
+            status=labels["status"][columns["status"][index]],
+            amount=self.amount[index],
+            fees=self.fees[index],
+            currency=labels["currency"][columns["currency"][index]],
+            channel=labels["channel"][columns["channel"][index]],
+            domain=labels["domain"][columns["domain"][index]],
+            created_at=self.created_at[index],
+            paid_at=self.paid_at[index],
+            customer_id=self.customer_id[index],
+            customer_email=self.customer_email[index],
+            raw=self.raw[index] if self.raw is not None else None
+        )
+
+    def __iter__(self) -> Iterator[CompactTransaction]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_models(self) -> Iterator[ListTransactionsDataModel]:
+        """
+        Full pydantic models, validated one at a time. Needs keep_raw=True.
+        """
+        for record in self:
+            yield record.to_model()
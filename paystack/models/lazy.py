@@ -0,0 +1,133 @@
+from datetime import datetime
+from functools import lru_cache
+from pydantic import BaseModel, PrivateAttr, TypeAdapter, create_model
+from typing import Any, Iterable, List, Set, Tuple, Type, get_args, get_origin
+
+
+__all__ = ["LazyModel", "lazy_model", "lazy_response", "projected_model", "projected_response"]
+
+
+def _is_deferred(annotation: Any) -> bool:
+    """
+    Nested models and datetimes are the expensive parts of a Paystack payload.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, (BaseModel, datetime)):
+        return True
+    return any(_is_deferred(arg) for arg in get_args(annotation))
+
+
+class _Deferred():
+    """
+    Data descriptor that validates a raw field value the first time it is read.
+    """
+
+    def __init__(self, name: str, annotation: Any):
+        self.name = name
+        self.adapter = TypeAdapter(annotation)
+
+    def __get__(self, instance: "LazyModel", owner: type = None) -> Any:
+        if instance is None:
+            return self
+
+        value = instance.__dict__[self.name]
+        validated = instance.__pydantic_private__["_validated"]
+        if self.name not in validated:
+            value = self.adapter.validate_python(value)
+            instance.__dict__[self.name] = value
+            validated.add(self.name)
+        return value
+
+    def __set__(self, instance: "LazyModel", value: Any) -> None:
+        instance.__dict__[self.name] = value
+        instance.__pydantic_private__["_validated"].add(self.name)
+
+
+class LazyModel(BaseModel):
+    """
+    Base for models built by `lazy_model`.
+
+    Scalar fields are validated up front like any pydantic model; nested
+    models and datetimes are kept as raw JSON values and validated on first
+    attribute access. Lazy models subclass the model they were built from,
+    so isinstance checks keep working.
+    """
+
+    _validated: Set[str] = PrivateAttr(default_factory=set)
+
+    def to_model(self) -> BaseModel:
+        """
+        Fully validated instance of the original (eager) model.
+        """
+        eager = next(base for base in type(self).__mro__ if not issubclass(base, LazyModel))
+        return eager.model_validate(self.model_dump())
+
+
+@lru_cache(maxsize=None)
+def lazy_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    deferred = {
+        name: info for name, info in model.model_fields.items()
+        if _is_deferred(info.annotation)
+    }
+    overrides = {
+        name: (Any, ... if info.is_required() else info.default)
+        for name, info in deferred.items()
+    }
+
+    lazy = create_model(f"Lazy{model.__name__}", __base__=(LazyModel, model), **overrides)
+    for name, info in deferred.items():
+        setattr(lazy, name, _Deferred(name, info.annotation))
+    return lazy
+
+
+def _wrap_data(response_model: Type[BaseModel], data_model: Type[BaseModel], prefix: str) -> Type[BaseModel]:
+    annotation = response_model.model_fields["data"].annotation
+    data_type = List[data_model] if get_origin(annotation) in (list, List) else data_model
+    return create_model(f"{prefix}{response_model.__name__}", __base__=response_model, data=(data_type, ...))
+
+
+@lru_cache(maxsize=None)
+def lazy_response(response_model: Type[BaseModel], data_model: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    `response_model` with its `data` validated into the lazy variant of `data_model`.
+    """
+    return _wrap_data(response_model, lazy_model(data_model), "Lazy")
+
+
+@lru_cache(maxsize=None)
+def _projected_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    unknown = set(fields) - set(model.model_fields)
+    if unknown:
+        raise ValueError(f"{model.__name__} has no field(s): {', '.join(sorted(unknown))}")
+
+    return create_model(
+        f"{model.__name__}Projection",
+        **{name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields}
+    )
+
+
+def projected_model(model: Type[BaseModel], fields: Iterable[str]) -> Type[BaseModel]:
+    """
+    A slim model holding only `fields` of `model`. Every other key in the
+    payload is ignored without being validated.
+    """
+    return _projected_model(model, tuple(sorted(set(fields))))
+
+
+@lru_cache(maxsize=None)
+def _projected_response(
+    response_model: Type[BaseModel],
+    data_model: Type[BaseModel],
+    fields: Tuple[str, ...]
+) -> Type[BaseModel]:
+    return _wrap_data(response_model, _projected_model(data_model, fields), "Projected")
+
+
+def projected_response(
+    response_model: Type[BaseModel],
+    data_model: Type[BaseModel],
+    fields: Iterable[str]
+) -> Type[BaseModel]:
+    """
+    `response_model` with its `data` validated into a projection of `data_model`.
+    """
+    return _projected_response(response_model, data_model, tuple(sorted(set(fields))))
@@ -1,140 +1,263 @@
 import asyncio
+import contextlib
+import mmap
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
 from logger.logger import get_logger
 from paystack.errors.errors import TransactionError
 from paystack.models import *
 from paystack.utils.response import assert_success
-from typing import Callable, Dict, Union, Optional
+from pydantic import BaseModel
+from transport.cache import MemoryCache, ResponseCache
+from transport.codec import as_dict, decode_model, dumps
+from transport.csv_stream import CsvRowParser
+from transport.instrumentation import Instrumentation, instrumented, record_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 
 logger = get_logger(__name__) 
 
+VerifyOutcome = Tuple[str, Union[TransactionsVerifyResponseModel, Exception]]
+Fields = Optional[Iterable[str]]
 
-class TransactionHandler():
+# A transaction in one of these states never changes again, so lookups of it
+# may be cached; pending/ongoing/abandoned ones always go to Paystack.
+TERMINAL_STATUSES = frozenset({"success", "failed", "reversed"})
 
-    def __init__(self,
-            post_request: Callable[[Dict, str], Dict],
-            get_request: Callable[[str, Optional[Dict]], Dict]
-        ):
-        self._post_request = post_request
-        self._get_request = get_request
-
-    def initialize_transaction(self, payload: TransactionsInitPayloadModel, ) -> TransactionsInitResponseModel:
-        path = "/transaction/initialize"
-        data = payload.model_dump()
 
-        resp = self._post_request(data, path)
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
 
-        assert_success(
-            resp,
-            expected_message="Authorization URL created",
-            error_message="Transaction Authorization failed"
-        )
 
-        logger.info(f"Authorization URL created success — reference: {resp['data']['reference']}")
-        return TransactionsInitResponseModel(**resp)
+class _BaseTransactionHandler():
+    """
+    Response handling shared by the sync and async transaction handlers.
 
+    Subclasses only decide how a request is sent; every `_*_result` method
+    takes the response body, either raw JSON bytes (fast_json) or a decoded
+    dict, and returns the typed model or raises a TransactionError.
+    """
 
-    def verify_transaction(self, reference: str,) -> TransactionsVerifyResponseModel:
-        path = f"/transaction/verify/{reference}"
+    provider = "paystack"
 
-        resp = self._get_request(path)
+    def __init__(self,
+            post_request: Callable,
+            get_request: Callable,
+            post_raw_request: Callable = None,
+            get_raw_request: Callable = None,
+            lazy: bool = False,
+            cache: ResponseCache = None,
+            download: Callable = None,
+            instrumentation: Instrumentation = None
+        ):
+        # With the raw callables the handler never builds intermediate dicts:
+        # payloads go out as model_dump_json() bytes and responses are
+        # validated with model_validate_json().
+        self._fast_json = post_raw_request is not None and get_raw_request is not None
+        self._post_request = post_raw_request if self._fast_json else post_request
+        self._get_request = get_raw_request if self._fast_json else get_request
+        self._lazy = lazy
+        self._cache = cache
+        self._download = download
+        self._instrumentation = instrumentation
+
+    def _cache_key(self, ident: Union[str, int], fields: Fields) -> str:
+        # Projections and lazy models are different types, so each view of a
+        # transaction is cached separately.
+        view = ",".join(sorted(set(fields))) if fields else ("lazy" if self._lazy else "full")
+        return f"{ident}:{view}"
+
+    def _cached(self, method: str, key: str, model: Type[BaseModel] = None) -> Optional[Union[BaseModel, Dict]]:
+        if self._cache is None:
+            return None
+        cached = self._cache.get(method, key, model)
+        if self._instrumentation is not None:
+            record_cache(cached is not None)
+        return cached
+
+    def _cache_result(self, method: str, key: str, result: Union[BaseModel, Dict]) -> Union[BaseModel, Dict]:
+        """
+        Cache `result` if it describes a finished transaction, and return it.
+        Projections without `status` are never cached.
+        """
+        if self._cache is None:
+            return result
+
+        if isinstance(result, dict):
+            final = (result.get("data") or {}).get("success") is True
+        else:
+            final = getattr(result.data, "status", None) in TERMINAL_STATUSES
+
+        if final:
+            self._cache.put(method, key, result)
+        return result
+
+    def _response_model(self, response_model: Type[BaseModel], data_model: Type[BaseModel], fields: Fields) -> Type[BaseModel]:
+        """
+        The model a transaction response is validated into: a projection when
+        `fields` is given, the lazy variant in lazy mode, else `response_model`.
+        """
+        if fields:
+            return projected_response(response_model, data_model, fields)
+        if self._lazy:
+            return lazy_response(response_model, data_model)
+        return response_model
+
+    def _item_model(self, fields: Fields) -> Type[BaseModel]:
+        if fields:
+            return projected_model(ListTransactionsDataModel, fields)
+        if self._lazy:
+            return lazy_model(ListTransactionsDataModel)
+        return ListTransactionsDataModel
+
+    def _item_factory(self, fields: Fields, compact: bool, keep_raw: bool) -> Callable[[Dict], Any]:
+        """
+        Turns one raw `/transaction` item into what `iter_transactions` yields.
+        """
+        if compact:
+            if fields:
+                raise ValueError("fields and compact cannot be combined")
+            if keep_raw:
+                return lambda item: CompactTransaction.from_item(item, dumps(item))
+            return CompactTransaction.from_item
+        model = self._item_model(fields)
+        return lambda item: model(**item)
+
+    def _body(self, payload: BaseModel) -> Union[bytes, Dict]:
+        if self._fast_json:
+            return payload.model_dump_json().encode()
+        return payload.model_dump()
+
+    def _initialize_result(self, resp: Union[bytes, Dict]) -> TransactionsInitResponseModel:
+        result, body = decode_model(resp, TransactionsInitResponseModel, "Authorization URL created")
+        if result is None:
+            assert_success(
+                body,
+                expected_message="Authorization URL created",
+                error_message="Transaction Authorization failed"
+            )
 
-        assert_success(
-            resp,
-            expected_message="Authorization URL created",
-            error_message="Transaction Authorization failed"
-        )
+        logger.info("Authorization URL created success — reference: %s", result.data.reference)
+        return result
 
-        if resp.get("message") == "Verification successful":
-            logger.info(f"Transaction Verification success — reference: {resp['data']['reference']}")
-            return TransactionsVerifyResponseModel(**resp)
+    def _verify_result(self, resp: Union[bytes, Dict], model: Type[BaseModel] = TransactionsVerifyResponseModel) -> TransactionsVerifyResponseModel:
+        result, body = decode_model(resp, model, "Verification successful")
+        if result is not None:
+            logger.info("Transaction Verification success — reference: %s", getattr(result.data, "reference", None))
+            return result
         else:
-            logger.warning(f"Transaction Verification failed: {resp.get('message')}")
+            logger.warning("Transaction Verification failed: %s", body.get("message"))
             raise TransactionError(
                 message="Transaction Verification failed.",
                 code=403,
                 context={
-                    "message": resp.get('message', '')
+                    "message": body.get('message', '')
                 }
             )
 
-    def list_transactions(self, params: Dict = None) -> ListTransactionsResponseModel:
-        path = "/transaction"
-
-        resp = self._get_request(path, params)
-
-        assert_success(
-            resp,
-            expected_message="Authorization URL created",
-            error_message="Transaction Authorization failed"
+    def _verify_timeout(self, reference: str) -> TransactionError:
+        return TransactionError(
+            message="Transaction Verification timed out.",
+            code=408,
+            context={
+                "reference": reference
+            }
         )
 
-        if resp.get("message") == "Transactions retrieved":
-            logger.info(f"Transactions retrieved successfully")
-            return ListTransactionsResponseModel(**resp)
+    def _list_result(self, resp: Union[bytes, Dict], model: Type[BaseModel] = ListTransactionsResponseModel) -> ListTransactionsResponseModel:
+        result, body = decode_model(resp, model, "Transactions retrieved")
+        if result is not None:
+            logger.info("Transactions retrieved successfully")
+            return result
         else:
-            logger.warning(f"Transactions retrieval failed: {resp.get('message')}")
+            logger.warning("Transactions retrieval failed: %s", body.get("message"))
             raise TransactionError(
                 message="Transactions retrieval failed.",
                 code=403,
                 context={
-                    "message": resp.get('message', '')
+                    "message": body.get('message', '')
                 }
             )
 
-    def fetch_transaction(self, id: int) -> ListTransactionResponseModel:
-        path = f"/transaction/{id}"
-
-        resp = self._get_request(path)
+    def _batch_result(self, resp: Union[bytes, Dict], fields: Fields, keep_raw: bool) -> TransactionBatch:
+        if fields:
+            raise ValueError("fields and compact cannot be combined")
+        body = as_dict(resp)
+        items, _ = self._page_result(body, {})
+        return TransactionBatch(items, keep_raw=keep_raw, meta=body.get("meta"))
+
+    def _page_result(self, resp: Union[bytes, Dict], params: Dict) -> Tuple[List[Dict], Optional[Dict]]:
+        """
+        Split a raw `/transaction` page into its items and the params for the next page.
+
+        Cursor pagination (`meta.next`) is followed when Paystack returns it,
+        otherwise `meta.page`/`meta.pageCount` are used. The returned params
+        are None once the last page has been reached.
+        """
+        resp = as_dict(resp)
+        if resp.get("message") != "Transactions retrieved":
+            logger.warning("Transactions retrieval failed: %s", resp.get("message"))
+            raise TransactionError(
+                message="Transactions retrieval failed.",
+                code=403,
+                context={
+                    "message": resp.get('message', '')
+                }
+            )
 
-        assert_success(
-            resp,
-            expected_message="Authorization URL created",
-            error_message="Transaction Authorization failed"
-        )
-                
-        if resp.get("message") == "Transaction retrieved":
-            logger.info(f"Transaction retrieved successfully")
-            return ListTransactionResponseModel(**resp)
+        items = resp.get("data") or []
+        meta = resp.get("meta") or {}
+        logger.debug("Transactions page retrieved — page: %s, items: %s", meta.get("page"), len(items))
+
+        if not items:
+            return items, None
+        if meta.get("next"):
+            return items, {**params, "next": meta["next"]}
+        if meta.get("page") is not None and meta.get("pageCount") is not None:
+            page = int(meta["page"])
+            if page < int(meta["pageCount"]):
+                return items, {**params, "page": page + 1}
+        return items, None
+
+    def _fetch_result(self, resp: Union[bytes, Dict], model: Type[BaseModel] = ListTransactionResponseModel) -> ListTransactionResponseModel:
+        result, body = decode_model(resp, model, "Transaction retrieved")
+        if result is not None:
+            logger.info("Transaction retrieved successfully")
+            return result
         else:
-            logger.warning(f"Transaction retrieval failed: {resp.get('message')}")
+            logger.warning("Transaction retrieval failed: %s", body.get("message"))
             raise TransactionError(
                 message="Transaction retrieval failed.",
                 code=403,
                 context={
-                    "message": resp.get('message', '')
+                    "message": body.get('message', '')
                 }
             )
-    
-    def charge_authorization(self, payload: ChargeAuthorizationPayloadModel) -> ChargeAuthorizationResponseModel:
-        path = "/transaction/charge_authorization"
-        data = payload.model_dump()
 
-        resp = self._post_request(data, path)
-        
-        if resp.get("message") == "Charge attempted":
+    def _charge_result(self, resp: Union[bytes, Dict]) -> ChargeAuthorizationResponseModel:
+        result, body = decode_model(resp, ChargeAuthorizationResponseModel, "Charge attempted")
+        if result is not None:
             logger.info("Charge attempted successfully")
-            return ChargeAuthorizationResponseModel(**resp)
+            return result
         else:
-            logger.warning(f"Charge attempt failed: {resp.get('message')}")
+            logger.warning("Charge attempt failed: %s", body.get("message"))
             raise TransactionError(
                 message="Charge attempt failed.",
                 code=403,
                 context={
-                    "message": resp.get('message', '')
+                    "message": body.get('message', '')
                 }
             )
-    
-    def view_transaction_timeline(self, id_or_ref: Union[str, int]) -> Dict:
-        path = f"/transaction/timeline/{id_or_ref}"
-
-        resp = self._get_request(path)
 
+    def _timeline_result(self, resp: Union[bytes, Dict]) -> Dict:
+        resp = as_dict(resp)
         if resp.get("message") == "Timeline retrieved":
-            logger.info(f"Transaction Timeline retrieved successfully")
+            logger.info("Transaction Timeline retrieved successfully")
             return resp
         else:
-            logger.warning(f"Transaction Timeline retrieval failed: {resp.get('message')}")
+            logger.warning("Transaction Timeline retrieval failed: %s", resp.get("message"))
             raise TransactionError(
                 message="Transaction Timeline retrieval failed.",
                 code=403,
@@ -143,65 +266,524 @@ class TransactionHandler():
                 }
             )
 
-    def transaction_totals(self, params: Dict = None) -> TransactionsTotalResponseModel:
-        path = f"/transaction/totals"
-
-        resp = self._get_request(path, params=params)
-        
-        if resp.get("message") == "Transaction totals":
-            logger.info(f"Transactions totals retrieved successfully")
-            return TransactionsTotalResponseModel(**resp)
+    def _totals_result(self, resp: Union[bytes, Dict]) -> TransactionsTotalResponseModel:
+        result, body = decode_model(resp, TransactionsTotalResponseModel, "Transaction totals")
+        if result is not None:
+            logger.info("Transactions totals retrieved successfully")
+            return result
         else:
-            logger.warning(f"Transactions totals retrieval failed: {resp.get('message')}")
+            logger.warning("Transactions totals retrieval failed: %s", body.get("message"))
             raise TransactionError(
                 message="Transactions totals retrieval failed.",
                 code=403,
                 context={
-                    "message": resp.get('message', '')
+                    "message": body.get('message', '')
                 }
             )
 
-    
-    def export_transactions(self, params: Dict = None) -> ExportTransactionsResponseModel:
-        path = f"/transaction/export"
-
-        resp = self._get_request(path, params=params)
-        
-        
-        if resp.get("message") == "Export successful":
-            logger.info(f"Transactions Export successful")
-            return ExportTransactionsResponseModel(**resp)
+    def _export_result(self, resp: Union[bytes, Dict]) -> ExportTransactionsResponseModel:
+        result, body = decode_model(resp, ExportTransactionsResponseModel, "Export successful")
+        if result is not None:
+            logger.info("Transactions Export successful")
+            return result
         else:
-            logger.warning(f"Transactions Export failed: {resp.get('message')}")
+            logger.warning("Transactions Export failed: %s", body.get("message"))
             raise TransactionError(
                 message="Transactions Export failed.",
                 code=403,
                 context={
-                    "message": resp.get('message', '')
+                    "message": body.get('message', '')
                 }
             )
 
-    
-    def partial_debit(self, payload: PartialDebitPayload) -> PartialDebitResponseModel:
-        path = f"/transaction/partial_debit"
-        data = payload.model_dump()
+    def _export_url(self, export: ExportTransactionsResponseModel) -> str:
+        if self._download is None or export.data.path is None:
+            raise TransactionError(
+                message="Transactions Export download failed.",
+                code=403,
+                context={
+                    "message": "No download link" if export.data.path is None else "Downloads not supported by this integration"
+                }
+            )
+        return str(export.data.path)
 
-        resp = self._post_request(data, path)
-        
-        if resp.get("message") == "Charge attempted":
-            logger.info(f"Partial Debit successful")
-            return PartialDebitResponseModel(**resp)
+    def _export_row(self, row: Dict[str, str], model: Optional[Type[BaseModel]]) -> Any:
+        return model.model_validate(row) if model is not None else row
+
+    def _partial_debit_result(self, resp: Union[bytes, Dict]) -> PartialDebitResponseModel:
+        result, body = decode_model(resp, PartialDebitResponseModel, "Charge attempted")
+        if result is not None:
+            logger.info("Partial Debit successful")
+            return result
         else:
-            logger.warning(f"Partial Debit failed: {resp.get('message')}")
+            logger.warning("Partial Debit failed: %s", body.get("message"))
             raise TransactionError(
                 message="Partial Debit failed.",
                 code=403,
                 context={
-                    "message": resp.get('message', '')
+                    "message": body.get('message', '')
                 }
             )
 
 
+class TransactionHandler(_BaseTransactionHandler):
+
+    def __init__(self,
+            post_request: Callable[..., Dict],
+            get_request: Callable[[str, Optional[Dict]], Dict],
+            post_raw_request: Callable[..., bytes] = None,
+            get_raw_request: Callable[[str, Optional[Dict]], bytes] = None,
+            lazy: bool = False,
+            cache: ResponseCache = None,
+            download: Callable[[str], Iterator[bytes]] = None,
+            instrumentation: Instrumentation = None
+        ):
+        super().__init__(post_request, get_request, post_raw_request, get_raw_request, lazy, cache, download, instrumentation)
+
+    @instrumented("initialize_transaction")
+    def initialize_transaction(self, payload: TransactionsInitPayloadModel, idempotency_key: str = None) -> TransactionsInitResponseModel:
+        path = "/transaction/initialize"
+        data = self._body(payload)
+
+        resp = self._post_request(data, path, idempotency_key=idempotency_key, guard_key=payload.reference)
+        return self._initialize_result(resp)
+
+    @instrumented("verify_transaction")
+    def verify_transaction(self, reference: str, fields: Fields = None) -> TransactionsVerifyResponseModel:
+        path = f"/transaction/verify/{reference}"
+        model = self._response_model(TransactionsVerifyResponseModel, TransactionVerifyData, fields)
+        key = self._cache_key(reference, fields)
+
+        cached = self._cached("verify_transaction", key, model)
+        if cached is not None:
+            return cached
+
+        resp = self._get_request(path)
+        return self._cache_result("verify_transaction", key, self._verify_result(resp, model))
+
+    def _verify_outcome(self, reference: str) -> VerifyOutcome:
+        try:
+            return reference, self.verify_transaction(reference)
+        except Exception as e:
+            return reference, e
+
+    def verify_many(self,
+            references: Iterable[str],
+            concurrency: int = 10,
+            ordered: bool = True,
+            timeout: float = None
+        ) -> Iterator[VerifyOutcome]:
+        """
+        Verify many references concurrently on a pool of `concurrency` threads.
+
+        Yields `(reference, result)` pairs where result is either the verify
+        response or the exception raised for that reference, so one failure
+        never aborts the batch. Pairs come in input order when `ordered` is
+        True, otherwise as they complete. `timeout` is a deadline in seconds
+        for the whole batch, counted from the first item requested; references
+        not verified by then yield a TransactionError with code 408.
+        """
+        references = list(references)
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            futures = {pool.submit(self._verify_outcome, ref): ref for ref in references}
+            deadline = time.monotonic() + timeout if timeout is not None else None
+
+            if ordered:
+                for future, ref in futures.items():
+                    try:
+                        yield future.result(timeout=_remaining(deadline))
+                    except FutureTimeoutError:
+                        yield ref, self._verify_timeout(ref)
+            else:
+                done = set()
+                try:
+                    for future in as_completed(futures, timeout=_remaining(deadline)):
+                        done.add(future)
+                        yield future.result()
+                except FutureTimeoutError:
+                    for future, ref in futures.items():
+                        if future not in done:
+                            yield ref, self._verify_timeout(ref)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @instrumented("list_transactions")
+    def list_transactions(self,
+            params: Dict = None,
+            fields: Fields = None,
+            compact: bool = False,
+            keep_raw: bool = False
+        ) -> Union[ListTransactionsResponseModel, TransactionBatch]:
+        """
+        One page of transactions. With `compact=True` the page comes back as
+        a TransactionBatch (its `meta` holding the pagination meta); with
+        `keep_raw` too, each row keeps its JSON for `to_model()`.
+        """
+        path = "/transaction"
+        resp = self._get_request(path, params)
+        if compact:
+            return self._batch_result(resp, fields, keep_raw)
+
+        model = self._response_model(ListTransactionsResponseModel, ListTransactionsDataModel, fields)
+        return self._list_result(resp, model)
+
+    def iter_transactions(self,
+            params: Dict = None,
+            prefetch: bool = False,
+            fields: Fields = None,
+            compact: bool = False,
+            keep_raw: bool = False
+        ) -> Iterator[Union[ListTransactionsDataModel, CompactTransaction]]:
+        """
+        Yield every transaction matching `params`, following pagination.
+
+        Items are validated one at a time so at most one raw page (two with
+        `prefetch`) is held in memory. With `prefetch=True` the next page is
+        requested on a background thread while the current one is consumed.
+        `fields` yields slim projections holding only those fields, and
+        `compact=True` CompactTransaction tuples (see `keep_raw` on
+        `list_transactions`), which TransactionBatch can collect.
+        """
+        path = "/transaction"
+        params = dict(params or {})
+        make = self._item_factory(fields, compact, keep_raw)
+
+        if not prefetch:
+            while params is not None:
+                resp = self._get_request(path, params)
+                items, params = self._page_result(resp, params)
+                for item in items:
+                    yield make(item)
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(self._get_request, path, params)
+            while pending is not None:
+                items, params = self._page_result(pending.result(), params)
+                pending = pool.submit(self._get_request, path, params) if params is not None else None
+                for item in items:
+                    yield make(item)
+
+    @instrumented("fetch_transaction")
+    def fetch_transaction(self, id: int, fields: Fields = None) -> ListTransactionResponseModel:
+        path = f"/transaction/{id}"
+        model = self._response_model(ListTransactionResponseModel, ListTransactionsDataModel, fields)
+        key = self._cache_key(id, fields)
+
+        cached = self._cached("fetch_transaction", key, model)
+        if cached is not None:
+            return cached
+
+        resp = self._get_request(path)
+        return self._cache_result("fetch_transaction", key, self._fetch_result(resp, model))
+
+    @instrumented("charge_authorization")
+    def charge_authorization(self, payload: ChargeAuthorizationPayloadModel, idempotency_key: str = None) -> ChargeAuthorizationResponseModel:
+        path = "/transaction/charge_authorization"
+        data = self._body(payload)
+
+        resp = self._post_request(data, path, idempotency_key=idempotency_key, guard_key=payload.reference)
+        return self._charge_result(resp)
+
+    @instrumented("view_transaction_timeline")
+    def view_transaction_timeline(self, id_or_ref: Union[str, int]) -> Dict:
+        path = f"/transaction/timeline/{id_or_ref}"
+
+        cached = self._cached("view_transaction_timeline", str(id_or_ref))
+        if cached is not None:
+            return cached
+
+        resp = self._get_request(path)
+        return self._cache_result("view_transaction_timeline", str(id_or_ref), self._timeline_result(resp))
+
+    @instrumented("transaction_totals")
+    def transaction_totals(self, params: Dict = None) -> TransactionsTotalResponseModel:
+        path = f"/transaction/totals"
+
+        resp = self._get_request(path, params=params)
+        return self._totals_result(resp)
+
+    @instrumented("export_transactions")
+    def export_transactions(self, params: Dict = None) -> ExportTransactionsResponseModel:
+        path = f"/transaction/export"
+
+        resp = self._get_request(path, params=params)
+        return self._export_result(resp)
+
+    def stream_export(self, params: Dict = None, model: Type[BaseModel] = None, destination: str = None) -> Iterator[Union[Dict[str, str], BaseModel]]:
+        """
+        Request an export and yield its CSV rows while the file downloads.
+
+        Rows are dicts keyed by the CSV header, or `model` instances when a
+        model (matching the headers by name or alias) is given. With
+        `destination` the raw file is written there as it streams. Memory use
+        does not grow with the size of the export.
+        """
+        url = self._export_url(self.export_transactions(params))
+        parser = CsvRowParser()
+
+        with open(destination, "wb") if destination else contextlib.nullcontext() as fh:
+            for chunk in self._download(url):
+                if fh is not None:
+                    fh.write(chunk)
+                for row in parser.feed(chunk):
+                    yield self._export_row(row, model)
+        for row in parser.close():
+            yield self._export_row(row, model)
+
+    def download_export(self, destination: str, params: Dict = None, memory_map: bool = False) -> Union[str, mmap.mmap]:
+        """
+        Request an export and stream it to `destination`. Returns the path, or
+        a read-only memory map of the file when `memory_map` is set.
+        """
+        url = self._export_url(self.export_transactions(params))
+
+        with open(destination, "wb") as fh:
+            for chunk in self._download(url):
+                fh.write(chunk)
+
+        if not memory_map:
+            return destination
+        with open(destination, "rb") as fh:
+            return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @instrumented("partial_debit")
+    def partial_debit(self, payload: PartialDebitPayload, idempotency_key: str = None) -> PartialDebitResponseModel:
+        path = f"/transaction/partial_debit"
+        data = self._body(payload)
+
+        resp = self._post_request(data, path, idempotency_key=idempotency_key, guard_key=payload.reference)
+        return self._partial_debit_result(resp)
+
+
+class AsyncTransactionHandler(_BaseTransactionHandler):
+
+    def __init__(self,
+            post_request: Callable[..., Awaitable[Dict]],
+            get_request: Callable[[str, Optional[Dict]], Awaitable[Dict]],
+            post_raw_request: Callable[..., Awaitable[bytes]] = None,
+            get_raw_request: Callable[[str, Optional[Dict]], Awaitable[bytes]] = None,
+            lazy: bool = False,
+            cache: ResponseCache = None,
+            download: Callable[[str], AsyncIterator[bytes]] = None,
+            instrumentation: Instrumentation = None
+        ):
+        super().__init__(post_request, get_request, post_raw_request, get_raw_request, lazy, cache, download, instrumentation)
+
+    async def _cached_async(self, method: str, key: str, model: Type[BaseModel] = None) -> Optional[Union[BaseModel, Dict]]:
+        # SQLite backends may wait on the file lock, keep them off the event loop
+        if self._cache is None or isinstance(self._cache.backend, MemoryCache):
+            return self._cached(method, key, model)
+        return await asyncio.to_thread(self._cached, method, key, model)
+
+    async def _cache_result_async(self, method: str, key: str, result: Union[BaseModel, Dict]) -> Union[BaseModel, Dict]:
+        if self._cache is None or isinstance(self._cache.backend, MemoryCache):
+            return self._cache_result(method, key, result)
+        return await asyncio.to_thread(self._cache_result, method, key, result)
+
+    @instrumented("initialize_transaction")
+    async def initialize_transaction(self, payload: TransactionsInitPayloadModel, idempotency_key: str = None) -> TransactionsInitResponseModel:
+        path = "/transaction/initialize"
+        data = self._body(payload)
+
+        resp = await self._post_request(data, path, idempotency_key=idempotency_key, guard_key=payload.reference)
+        return self._initialize_result(resp)
+
+    @instrumented("verify_transaction")
+    async def verify_transaction(self, reference: str, fields: Fields = None) -> TransactionsVerifyResponseModel:
+        path = f"/transaction/verify/{reference}"
+        model = self._response_model(TransactionsVerifyResponseModel, TransactionVerifyData, fields)
+        key = self._cache_key(reference, fields)
+
+        cached = await self._cached_async("verify_transaction", key, model)
+        if cached is not None:
+            return cached
+
+        resp = await self._get_request(path)
+        return await self._cache_result_async("verify_transaction", key, self._verify_result(resp, model))
+
+    async def verify_many(self,
+            references: Iterable[str],
+            concurrency: int = 10,
+            ordered: bool = True,
+            timeout: float = None
+        ) -> AsyncIterator[VerifyOutcome]:
+        """
+        Async counterpart of TransactionHandler.verify_many.
+
+        At most `concurrency` verify requests are in flight at once. Unfinished
+        requests are cancelled when the `timeout` deadline passes.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def verify(reference: str) -> VerifyOutcome:
+            async with semaphore:
+                try:
+                    return reference, await self.verify_transaction(reference)
+                except Exception as e:
+                    return reference, e
+
+        tasks = {asyncio.ensure_future(verify(ref)): ref for ref in references}
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        try:
+            if ordered:
+                for task, ref in tasks.items():
+                    done, _ = await asyncio.wait({task}, timeout=_remaining(deadline))
+                    yield task.result() if done else (ref, self._verify_timeout(ref))
+            else:
+                pending = set(tasks)
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending,
+                        timeout=_remaining(deadline),
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not done:
+                        break
+                    for task in done:
+                        yield task.result()
+                for task in pending:
+                    yield tasks[task], self._verify_timeout(tasks[task])
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @instrumented("list_transactions")
+    async def list_transactions(self,
+            params: Dict = None,
+            fields: Fields = None,
+            compact: bool = False,
+            keep_raw: bool = False
+        ) -> Union[ListTransactionsResponseModel, TransactionBatch]:
+        path = "/transaction"
+        resp = await self._get_request(path, params)
+        if compact:
+            return self._batch_result(resp, fields, keep_raw)
+
+        model = self._response_model(ListTransactionsResponseModel, ListTransactionsDataModel, fields)
+        return self._list_result(resp, model)
+
+    async def iter_transactions(self,
+            params: Dict = None,
+            prefetch: bool = False,
+            fields: Fields = None,
+            compact: bool = False,
+            keep_raw: bool = False
+        ) -> AsyncIterator[Union[ListTransactionsDataModel, CompactTransaction]]:
+        """
+        Async generator counterpart of TransactionHandler.iter_transactions.
+
+        With `prefetch=True` the next page request runs as a task on the event
+        loop while the current page is being consumed.
+        """
+        path = "/transaction"
+        params = dict(params or {})
+        make = self._item_factory(fields, compact, keep_raw)
+
+        if not prefetch:
+            while params is not None:
+                resp = await self._get_request(path, params)
+                items, params = self._page_result(resp, params)
+                for item in items:
+                    yield make(item)
+            return
+
+        pending = asyncio.ensure_future(self._get_request(path, params))
+        try:
+            while pending is not None:
+                items, params = self._page_result(await pending, params)
+                pending = asyncio.ensure_future(self._get_request(path, params)) if params is not None else None
+                for item in items:
+                    yield make(item)
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    @instrumented("fetch_transaction")
+    async def fetch_transaction(self, id: int, fields: Fields = None) -> ListTransactionResponseModel:
+        path = f"/transaction/{id}"
+        model = self._response_model(ListTransactionResponseModel, ListTransactionsDataModel, fields)
+        key = self._cache_key(id, fields)
+
+        cached = await self._cached_async("fetch_transaction", key, model)
+        if cached is not None:
+            return cached
+
+        resp = await self._get_request(path)
+        return await self._cache_result_async("fetch_transaction", key, self._fetch_result(resp, model))
+
+    @instrumented("charge_authorization")
+    async def charge_authorization(self, payload: ChargeAuthorizationPayloadModel, idempotency_key: str = None) -> ChargeAuthorizationResponseModel:
+        path = "/transaction/charge_authorization"
+        data = self._body(payload)
+
+        resp = await self._post_request(data, path, idempotency_key=idempotency_key, guard_key=payload.reference)
+        return self._charge_result(resp)
+
+    @instrumented("view_transaction_timeline")
+    async def view_transaction_timeline(self, id_or_ref: Union[str, int]) -> Dict:
+        path = f"/transaction/timeline/{id_or_ref}"
+
+        cached = await self._cached_async("view_transaction_timeline", str(id_or_ref))
+        if cached is not None:
+            return cached
+
+        resp = await self._get_request(path)
+        return await self._cache_result_async("view_transaction_timeline", str(id_or_ref), self._timeline_result(resp))
+
+    @instrumented("transaction_totals")
+    async def transaction_totals(self, params: Dict = None) -> TransactionsTotalResponseModel:
+        path = f"/transaction/totals"
+
+        resp = await self._get_request(path, params=params)
+        return self._totals_result(resp)
+
+    @instrumented("export_transactions")
+    async def export_transactions(self, params: Dict = None) -> ExportTransactionsResponseModel:
+        path = f"/transaction/export"
+
+        resp = await self._get_request(path, params=params)
+        return self._export_result(resp)
+
+    async def stream_export(self, params: Dict = None, model: Type[BaseModel] = None, destination: str = None) -> AsyncIterator[Union[Dict[str, str], BaseModel]]:
+        """
+        Async generator counterpart of TransactionHandler.stream_export.
+        """
+        url = self._export_url(await self.export_transactions(params))
+        parser = CsvRowParser()
+
+        with open(destination, "wb") if destination else contextlib.nullcontext() as fh:
+            async for chunk in self._download(url):
+                if fh is not None:
+                    fh.write(chunk)
+                for row in parser.feed(chunk):
+                    yield self._export_row(row, model)
+        for row in parser.close():
+            yield self._export_row(row, model)
+
+    async def download_export(self, destination: str, params: Dict = None, memory_map: bool = False) -> Union[str, mmap.mmap]:
+        url = self._export_url(await self.export_transactions(params))
+
+        with open(destination, "wb") as fh:
+            async for chunk in self._download(url):
+                fh.write(chunk)
+
+        if not memory_map:
+            return destination
+        with open(destination, "rb") as fh:
+            return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @instrumented("partial_debit")
+    async def partial_debit(self, payload: PartialDebitPayload, idempotency_key: str = None) -> PartialDebitResponseModel:
+        path = f"/transaction/partial_debit"
+        data = self._body(payload)
+
+        resp = await self._post_request(data, path, idempotency_key=idempotency_key, guard_key=payload.reference)
+        return self._partial_debit_result(resp)
+
+
 
 if __name__ == "__main__":
     with TransactionHandler() as paystack:
@@ -30,7 +30,7 @@ def assert_success(
         context = {"message": actual_message}
         if extra_context:
             context.update(extra_context)
-        logger.warning(f"{error_message}: {actual_message}")
+        logger.warning("%s: %s", error_message, actual_message)
         raise TransactionError(
             message=error_message,
             code=error_code,
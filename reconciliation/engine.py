@@ -0,0 +1,326 @@
+import glob
+import math
+import os
+import pickle
+import shutil
+import tempfile
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from logger.logger import get_logger
+from reconciliation.records import LedgerRecord
+from transport import codec
+from typing import Callable, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+
+logger = get_logger(__name__)
+
+CATEGORIES = (
+    "matched",
+    "amount_mismatch",
+    "duplicate",
+    "fuzzy_matched",
+    "missing_in_ledger",
+    "missing_in_provider"
+)
+
+PROVIDER, LEDGER = "provider", "ledger"
+
+_FIELDS = LedgerRecord._fields
+
+
+def _partition(value: str, partitions: int) -> int:
+    # crc32 rather than hash(): str hashes are salted per process, and
+    # worker processes must agree on where a record belongs.
+    return zlib.crc32(value.encode()) % partitions
+
+
+class _PartitionWriter():
+    """
+    Buffers records per partition and appends them to pickle files in batches.
+    """
+
+    def __init__(self, directory: str, prefix: str, partitions: int, batch_size: int = 10_000):
+        self.directory = directory
+        self.prefix = prefix
+        self.partitions = partitions
+        self.batch_size = batch_size
+        self.__buffers: Dict[int, List] = defaultdict(list)
+
+    def path(self, index: int) -> str:
+        return os.path.join(self.directory, f"{self.prefix}-{index}.pkl")
+
+    def write(self, index: int, record: Tuple) -> None:
+        buffer = self.__buffers[index]
+        buffer.append(record)
+        if len(buffer) >= self.batch_size:
+            self._flush(index)
+
+    def _flush(self, index: int) -> None:
+        buffer = self.__buffers.pop(index, None)
+        if buffer:
+            with open(self.path(index), "ab") as fh:
+                pickle.dump(buffer, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def close(self) -> None:
+        for index in list(self.__buffers):
+            self._flush(index)
+
+
+def _read_partition(*paths: str) -> Iterator[Tuple]:
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, "rb") as fh:
+            while True:
+                try:
+                    yield from pickle.load(fh)
+                except EOFError:
+                    break
+
+
+class _Output():
+    """
+    One JSON-lines file per category, written by a single partition worker.
+    """
+
+    def __init__(self, directory: str, suffix: str):
+        self.directory = directory
+        self.suffix = suffix
+        self.__files: Dict[str, IO] = {}
+        self.counts: Dict[str, int] = defaultdict(int)
+
+    def emit(self, category: str, key: str, **sides) -> None:
+        fh = self.__files.get(category)
+        if fh is None:
+            fh = self.__files[category] = open(os.path.join(self.directory, f"{category}-{self.suffix}.jsonl"), "wb")
+        fh.write(codec.dumps({
+            "key": key,
+            **{side: [dict(zip(_FIELDS, r)) for r in records] if isinstance(records, list) else dict(zip(_FIELDS, records))
+               for side, records in sides.items()}
+        }) + b"\n")
+        self.counts[category] += 1
+
+    def close(self) -> Dict[str, int]:
+        for fh in self.__files.values():
+            fh.close()
+        return dict(self.counts)
+
+
+def _join_partition(workdir: str, index: int, fuzzy_partitions: int, amount_tolerance: int) -> Dict[str, int]:
+    """
+    Phase 1 for one key partition: hash join both sides on key. Records
+    that find no partner are handed to the fuzzy phase, partitioned by
+    amount and currency.
+    """
+    # Plain tuples (key, amount, currency, ...) throughout, this loop sees every record
+    by_key: Dict[str, Tuple[List, List]] = defaultdict(lambda: ([], []))
+    for side, records in ((0, _read_partition(os.path.join(workdir, f"{PROVIDER}-{index}.pkl"))),
+                          (1, _read_partition(os.path.join(workdir, f"{LEDGER}-{index}.pkl")))):
+        for record in records:
+            by_key[record[0]][side].append(record)
+
+    output = _Output(workdir, f"join-{index}")
+    leftovers = {
+        PROVIDER: _PartitionWriter(workdir, f"fuzzy-{PROVIDER}-j{index}", fuzzy_partitions),
+        LEDGER: _PartitionWriter(workdir, f"fuzzy-{LEDGER}-j{index}", fuzzy_partitions)
+    }
+
+    for key, (provider, ledger) in by_key.items():
+        if key and (len(provider) > 1 or len(ledger) > 1):
+            output.emit("duplicate", key, provider=provider, ledger=ledger)
+            continue
+        if key and provider and ledger:
+            p, l = provider[0], ledger[0]
+            if p[2] == l[2] and abs(p[1] - l[1]) <= amount_tolerance:
+                output.emit("matched", key, provider=p, ledger=l)
+            else:
+                output.emit("amount_mismatch", key, provider=p, ledger=l)
+            continue
+
+        # No partner on the other side, or no key at all
+        for side, records in ((PROVIDER, provider), (LEDGER, ledger)):
+            for record in records:
+                leftovers[side].write(_partition(f"{record[1]}:{record[2]}", fuzzy_partitions), record)
+
+    for writer in leftovers.values():
+        writer.close()
+    return output.close()
+
+
+def _time_match(
+    left: List[LedgerRecord],
+    right: List[LedgerRecord],
+    window: float,
+    compatible: Callable[[LedgerRecord, LedgerRecord], bool]
+) -> List[Tuple[LedgerRecord, LedgerRecord]]:
+    """
+    Greedily pair each left record with the earliest unused right record
+    within `window` seconds. Both lists must be sorted by timestamp.
+    """
+    pairs = []
+    used = [False] * len(right)
+    start = 0
+    for l in left:
+        while start < len(right) and right[start].timestamp < l.timestamp - window:
+            start += 1
+        i = start
+        while i < len(right) and right[i].timestamp <= l.timestamp + window:
+            if not used[i] and compatible(l, right[i]):
+                used[i] = True
+                pairs.append((l, right[i]))
+                break
+            i += 1
+    return pairs
+
+
+def _fuzzy_partition(workdir: str, index: int, window: float) -> Dict[str, int]:
+    """
+    Phase 2 for one amount/currency partition: pair unmatched records with
+    the same amount and currency made within `window` seconds, first where
+    both emails agree, then where either side has no email. Conflicting
+    emails never pair. Whatever is left is missing from the other side.
+    """
+    sides = {}
+    for side in (PROVIDER, LEDGER):
+        paths = glob.glob(os.path.join(workdir, f"fuzzy-{side}-j*-{index}.pkl"))
+        sides[side] = [LedgerRecord(*record) for record in _read_partition(*paths)]
+
+    output = _Output(workdir, f"fuzzy-{index}")
+    groups: Dict[Tuple, Tuple[List, List]] = defaultdict(lambda: ([], []))
+    for position, side in enumerate((PROVIDER, LEDGER)):
+        for record in sides[side]:
+            if math.isnan(record.timestamp):
+                output.emit("missing_in_ledger" if side == PROVIDER else "missing_in_provider", record.key, **{side: record})
+            else:
+                groups[(record.amount, record.currency)][position].append(record)
+
+    for provider, ledger in groups.values():
+        provider.sort(key=lambda r: r.timestamp)
+        ledger.sort(key=lambda r: r.timestamp)
+        paired = set()
+        for compatible in (lambda p, l: p.email and p.email == l.email,
+                           lambda p, l: not p.email or not l.email):
+            left = [r for r in provider if id(r) not in paired]
+            right = [r for r in ledger if id(r) not in paired]
+            for p, l in _time_match(left, right, window, compatible):
+                paired.update((id(p), id(l)))
+                output.emit("fuzzy_matched", p.key or l.key, provider=p, ledger=l)
+
+        for record in provider:
+            if id(record) not in paired:
+                output.emit("missing_in_ledger", record.key, provider=record)
+        for record in ledger:
+            if id(record) not in paired:
+                output.emit("missing_in_provider", record.key, ledger=record)
+
+    return output.close()
+
+
+class ReconciliationResult():
+    """
+    Counts per category, with the records of each category streamed back
+    from the work directory on demand.
+    """
+
+    def __init__(self, workdir: str, counts: Dict[str, int], owns_workdir: bool):
+        self.workdir = workdir
+        self.counts = {category: counts.get(category, 0) for category in CATEGORIES}
+        self.__owns_workdir = owns_workdir
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def iter(self, category: str) -> Iterator[Dict]:
+        if category not in CATEGORIES:
+            raise ValueError(f"Unknown category {category!r}, expected one of: {', '.join(CATEGORIES)}")
+        for path in sorted(glob.glob(os.path.join(self.workdir, f"{category}-*.jsonl"))):
+            with open(path, "rb") as fh:
+                for line in fh:
+                    yield codec.loads(line)
+
+    def close(self) -> None:
+        if self.__owns_workdir:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+class Reconciler():
+    """
+    Reconciles provider records against the internal ledger in bounded memory.
+
+    Both inputs are streamed once into `partitions` files on disk by a hash
+    of their key, then each partition is hash joined on its own in a pool of
+    `workers` processes (0 runs everything in-process), so memory holds one
+    partition at a time rather than both inputs. Records without a partner
+    go through a second, fuzzy pass partitioned by amount and currency.
+
+    Each run works in its own directory: a temporary one removed when the
+    result is closed, or a new subdirectory of `workdir` that is kept.
+
+    Results land in categories: matched, amount_mismatch (same key,
+    different amount or currency), duplicate (key seen more than once on
+    a side), fuzzy_matched, missing_in_ledger and missing_in_provider.
+
+        with Reconciler().run(from_paystack(mirror.iter()), from_rows(ledger_rows)) as result:
+            print(result.counts)
+            for mismatch in result.iter("amount_mismatch"):
+                ...
+    """
+
+    def __init__(self,
+            workdir: str = None,
+            partitions: int = 64,
+            workers: Optional[int] = None,
+            time_window: float = 3600.0,
+            amount_tolerance: int = 0
+        ):
+        self.workdir = workdir
+        self.partitions = partitions
+        self.workers = workers
+        self.time_window = time_window
+        self.amount_tolerance = amount_tolerance
+
+    def _map(self, fn: Callable, jobs: List[Tuple]) -> List[Dict[str, int]]:
+        if self.workers == 0:
+            return [fn(*job) for job in jobs]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(fn, *zip(*jobs)))
+
+    def run(self, provider: Iterable[LedgerRecord], ledger: Iterable[LedgerRecord]) -> ReconciliationResult:
+        # Partition files are appended to and results globbed by category, so
+        # every run gets a fresh directory, under `workdir` when one is given.
+        owns_workdir = self.workdir is None
+        if not owns_workdir:
+            os.makedirs(self.workdir, exist_ok=True)
+        workdir = tempfile.mkdtemp(prefix="reconcile-", dir=self.workdir)
+
+        try:
+            for side, records in ((PROVIDER, provider), (LEDGER, ledger)):
+                writer = _PartitionWriter(workdir, side, self.partitions)
+                count = 0
+                for record in records:
+                    # Keyless records can only ever be fuzzy matched; partition 0
+                    # sends them straight through the join as unmatched.
+                    writer.write(_partition(record.key, self.partitions) if record.key else 0, tuple(record))
+                    count += 1
+                writer.close()
+                logger.info("Partitioned %s %s records", count, side)
+
+            counts: Dict[str, int] = defaultdict(int)
+            for fn, jobs in (
+                (_join_partition, [(workdir, i, self.partitions, self.amount_tolerance) for i in range(self.partitions)]),
+                (_fuzzy_partition, [(workdir, i, self.time_window) for i in range(self.partitions)])
+            ):
+                for partial in self._map(fn, jobs):
+                    for category, count in partial.items():
+                        counts[category] += count
+        except BaseException:
+            if owns_workdir:
+                shutil.rmtree(workdir, ignore_errors=True)
+            raise
+
+        logger.info("Reconciliation finished: %s", dict(counts))
+        return ReconciliationResult(workdir, counts, owns_workdir)
@@ -0,0 +1,88 @@
+import math
+from transport import codec
+from transport.fields import get_field, to_epoch
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional
+
+
+class LedgerRecord(NamedTuple):
+    """
+    One money movement as the reconciler sees it, from either side.
+
+    Amounts are integers in the currency subunit (kobo, pesewas, cents) and
+    timestamps epoch seconds, NaN when unknown. A plain tuple so tens of
+    millions of them can be pickled to partition files cheaply.
+    """
+
+    key: str
+    amount: int
+    currency: str
+    timestamp: float = math.nan
+    email: str = ""
+    id: str = ""
+
+
+def from_paystack(transactions: Iterable[Any]) -> Iterator[LedgerRecord]:
+    """
+    Records from Paystack transactions: list/fetch models, ChargeData,
+    CompactTransactions, mirror rows or raw dicts. Paystack amounts are
+    already in subunits.
+    """
+    for item in transactions:
+        customer = get_field(item, "customer")
+        # Compact records carry NaN rather than None for a missing timestamp
+        timestamp = math.nan
+        for name in ("paid_at", "created_at", "transaction_date"):
+            timestamp = to_epoch(get_field(item, name))
+            if not math.isnan(timestamp):
+                break
+        yield LedgerRecord(
+            key=get_field(item, "reference") or "",
+            amount=int(get_field(item, "amount") or 0),
+            currency=get_field(item, "currency") or "",
+            timestamp=timestamp,
+            email=((get_field(customer, "email") if customer is not None else get_field(item, "customer_email")) or "").lower(),
+            id=str(get_field(item, "id") or "")
+        )
+
+
+def from_alatpay(statuses: Iterable[Dict], key: str = "orderId") -> Iterator[LedgerRecord]:
+    """
+    Records from BankTransfer.confirm_transaction_status responses, keyed by
+    `key` (orderId by default, falling back to transactionId). ALATPay
+    amounts are in major units and are converted to subunits.
+    """
+    for status in statuses:
+        data = codec.as_dict(status).get("data") or {}
+        customer = data.get("customer") or {}
+        yield LedgerRecord(
+            key=str(data.get(key) or data.get("transactionId") or ""),
+            amount=int(round(float(data.get("amount") or 0) * 100)),
+            currency=data.get("currency") or "",
+            timestamp=to_epoch(data.get("createdAt")),
+            email=(customer.get("email") or "").lower(),
+            id=str(data.get("transactionId") or data.get("id") or "")
+        )
+
+
+def from_rows(
+    rows: Iterable[Dict],
+    key: str = "reference",
+    amount: str = "amount",
+    currency: str = "currency",
+    timestamp: Optional[str] = "created_at",
+    email: Optional[str] = "email",
+    id: Optional[str] = "id"
+) -> Iterator[LedgerRecord]:
+    """
+    Records from ledger rows (dicts, e.g. a DB cursor or CSV reader), naming
+    the column that holds each field. Amounts must already be in subunits.
+    """
+    for row in rows:
+        yield LedgerRecord(
+            key=str(row.get(key) or ""),
+            amount=int(row.get(amount) or 0),
+            currency=row.get(currency) or "",
+            timestamp=to_epoch(row.get(timestamp)) if timestamp else math.nan,
+            email=(row.get(email) or "").lower() if email else "",
+            id=str(row.get(id) or "") if id else ""
+        )
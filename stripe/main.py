@@ -1,40 +1,64 @@
 import asyncio
 import httpx
-import logging
-
-LOGGING_CONFIG = {
-    "version": 1,
-    "handlers": {
-        "default": {
-            "class": "logging.StreamHandler",
-            "formatter": "http",
-            "stream": "ext://sys.stderr"
-        }
-    },
-    "formatters": {
-        "http": {
-            "format": "%(levelname)s [%(asctime)s] %(name)s - %(message)s",
-            "datefmt": "%Y-%m-%d %H:%M:%S",
+import os
+from dotenv import load_dotenv
+from logger.logger import get_logger
+from transport import codec
+from transport.transport import AsyncBaseIntegration, BaseIntegration
+from typing import Dict
+
+
+load_dotenv()
+logger = get_logger(__name__)
+
+
+def _stripe_settings(integration_name: str) -> Dict:
+    secret_key = os.getenv("STRIPE_SECRET_KEY")
+    base_url = os.getenv("STRIPE_BASE_URL")
+
+    if not all([secret_key, base_url]):
+        logger.error("Missing required environment variables for %s.", integration_name)
+        raise EnvironmentError(f"Missing required environment variables for {integration_name}")
+
+    return {
+        "base_url": base_url,
+        "headers": {
+            "Authorization": f"Bearer {secret_key}",
+            "Cache-Control": "no-cache"
         }
-    },
-    'loggers': {
-        'httpx': {
-            'handlers': ['default'],
-            'level': 'DEBUG',
-        },
-        'httpcore': {
-            'handlers': ['default'],
-            'level': 'DEBUG',
-        },
     }
-}
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("stripe.log"), logging.StreamHandler()]
-)
-logger = logging.getLogger(__name__)
+
+
+class StripeIntegration(BaseIntegration):
+
+    provider = "stripe"
+
+    def __init__(self, client: httpx.Client = None, **options):
+        super().__init__(
+            **_stripe_settings("StripeIntegration"),
+            client=client,
+            **options
+        )
+
+    def _post_request(self, payload: Dict, path: str, idempotency_key: str = None, guard_key: str = None) -> Dict:
+        # Stripe takes form encoded bodies rather than JSON
+        return codec.loads(self._post_content(path, idempotency_key=idempotency_key, guard_key=guard_key, data=payload))
+
+
+class AsyncStripeIntegration(AsyncBaseIntegration):
+
+    provider = "stripe"
+
+    def __init__(self, client: httpx.AsyncClient = None, **options):
+        super().__init__(
+            **_stripe_settings("AsyncStripeIntegration"),
+            client=client,
+            **options
+        )
+
+    async def _post_request(self, payload: Dict, path: str, idempotency_key: str = None, guard_key: str = None) -> Dict:
+        return codec.loads(await self._post_content(path, idempotency_key=idempotency_key, guard_key=guard_key, data=payload))
+
 
 def main():
     pass
@@ -0,0 +1,64 @@
+import httpx
+import logging
+import os
+import pytest
+
+# Set before the integrations read them; load_dotenv never overrides these
+os.environ.setdefault("PAYSTACK_TEST_SECRET_KEY", "sk_test_suite")
+os.environ.setdefault("PAYSTACK_BASE_URL", "https://api.paystack.test")
+os.environ.setdefault("ALAT_PAY_PRIMARY_KEY", "alat-test")
+os.environ.setdefault("ALAT_PAY_BUSINESS_ID", "biz-00001")
+os.environ.setdefault("ALAT_PAY_BASE_URL", "https://apibox.alatpay.test")
+
+from alatpay.main import AlatPayIntegration, AsyncAlatPayIntegration
+from logger import logger as logging_setup
+from paystack.main import AsyncPayStackIntegration, PayStackIntegration
+
+
+@pytest.fixture
+def paystack():
+    """
+    Build a PayStackIntegration whose requests are answered by `handler`.
+    """
+    def make(handler, **options):
+        return PayStackIntegration(client=httpx.Client(transport=httpx.MockTransport(handler)), **options)
+    return make
+
+
+@pytest.fixture
+def async_paystack():
+    def make(handler, **options):
+        return AsyncPayStackIntegration(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), **options)
+    return make
+
+
+@pytest.fixture
+def alatpay():
+    def make(handler, **options):
+        return AlatPayIntegration(client=httpx.Client(transport=httpx.MockTransport(handler)), **options)
+    return make
+
+
+@pytest.fixture
+def async_alatpay():
+    def make(handler, **options):
+        return AsyncAlatPayIntegration(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), **options)
+    return make
+
+
+
+@pytest.fixture
+def restore_loggers():
+    """
+    Put the library loggers back as they were after a test reconfigures
+    them, stopping any queue listener it started.
+    """
+    saved = {}
+    for name in logging_setup._LOGGERS:
+        logger = logging.getLogger(name)
+        saved[name] = (logger.handlers[:], logger.level, logger.propagate)
+    yield
+    logging_setup._stop_listener()
+    for name, (handlers, level, propagate) in saved.items():
+        logger = logging.getLogger(name)
+        logger.handlers, logger.level, logger.propagate = handlers, level, propagate
@@ -0,0 +1,127 @@
+import httpx
+import math
+import pytest
+import statistics
+from benchmarks.server import transaction
+from collections import defaultdict
+from paystack import analytics
+from paystack.analytics import ANALYTICS_FIELDS, TransactionColumns
+from paystack.models import CompactTransaction
+
+
+def _ledger(count: int = 200):
+    return [
+        {
+            **transaction(i, ("success", "success", "failed", "abandoned")[i % 4]),
+            "amount": 1000 + (i * 37) % 900,
+            "channel": ("card", "bank", "ussd")[i % 3],
+            "currency": ("NGN", "USD")[i % 5 == 0],
+            "customer": {**transaction(i)["customer"], "id": 100000 + i % 7}
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def backend(request, monkeypatch):
+    if request.param == "pure":
+        monkeypatch.setattr(analytics, "np", None)
+    elif analytics.np is None:
+        pytest.skip("numpy is not installed")
+    return request.param
+
+
+@pytest.fixture
+def columns(paystack):
+    ledger = _ledger()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={
+            "status": True,
+            "message": "Transactions retrieved",
+            "data": ledger,
+            "meta": {"total": len(ledger), "perPage": len(ledger), "page": 1, "pageCount": 1}
+        })
+
+    with paystack(handler) as integration:
+        return TransactionColumns(integration.transactions.iter_transactions(fields=ANALYTICS_FIELDS)), ledger
+
+
+def _expected(ledger, key, status="success"):
+    groups = defaultdict(lambda: {"count": 0, "amount": 0, "fees": 0})
+    for item in ledger:
+        if status is None or item["status"] == status:
+            group = groups[key(item)]
+            group["count"] += 1
+            group["amount"] += item["amount"]
+            group["fees"] += item["fees"]
+    return dict(groups)
+
+
+def test_group_by_matches_a_plain_loop(backend, columns):
+    columns, ledger = columns
+    assert columns.group_by("channel") == _expected(ledger, lambda item: item["channel"])
+    assert columns.group_by("customer", status=None) == _expected(ledger, lambda item: item["customer"]["id"], None)
+    assert columns.group_by("channel", "currency", status="failed") == _expected(
+        ledger, lambda item: (item["channel"], item["currency"]), "failed"
+    )
+    assert columns.group_by("day") == _expected(ledger, lambda item: "2024-01-01")
+    assert set(columns.group_by("hour")) == {"2024-01-01T00:00:00Z", "2024-01-01T01:00:00Z", "2024-01-01T02:00:00Z", "2024-01-01T03:00:00Z"}
+    assert columns.group_by("channel", status="reversed") == {}
+
+
+def test_totals_and_percentiles(backend, columns):
+    columns, ledger = columns
+    successes = [item["amount"] for item in ledger if item["status"] == "success"]
+
+    totals = columns.totals()
+    assert totals.total_transactions == len(successes)
+    assert totals.total_volume == sum(successes)
+
+    overall = columns.percentiles(q=(50, 90))
+    assert overall[50] == pytest.approx(statistics.quantiles(successes, n=100, method="inclusive")[49])
+    assert overall[90] == pytest.approx(statistics.quantiles(successes, n=100, method="inclusive")[89])
+
+    by_channel = columns.percentiles(q=(50,), by="channel")
+    for channel in ("card", "bank", "ussd"):
+        amounts = [item["amount"] for item in ledger if item["status"] == "success" and item["channel"] == channel]
+        assert by_channel[channel][50] == pytest.approx(statistics.median(amounts))
+
+
+def test_breakdown(backend, columns):
+    columns, _ = columns
+    breakdown = columns.breakdown(top_customers=3)
+    assert len(breakdown["by_customer"]) == 3
+    amounts = [group["amount"] for group in breakdown["by_customer"].values()]
+    assert amounts == sorted(amounts, reverse=True)
+
+
+def test_backends_agree(monkeypatch, columns):
+    if analytics.np is None:
+        pytest.skip("numpy is not installed")
+    columns, _ = columns
+    groups = columns.group_by("hour_of_day", "status", status=None)
+    percentiles = columns.percentiles(by=("currency", "channel"))
+
+    monkeypatch.setattr(analytics, "np", None)
+    assert columns.group_by("hour_of_day", "status", status=None) == groups
+    pure = columns.percentiles(by=("currency", "channel"))
+    assert pure.keys() == percentiles.keys()
+    for label, values in percentiles.items():
+        assert pure[label] == pytest.approx(values)
+
+
+def test_accepts_dicts_and_compact_records(backend):
+    ledger = _ledger(20)
+    from_dicts = TransactionColumns(ledger)
+    from_compact = TransactionColumns(CompactTransaction.from_item(item) for item in ledger)
+    assert from_dicts.group_by("customer", "channel") == from_compact.group_by("customer", "channel")
+    assert len(from_compact) == 20
+
+
+def test_empty_and_unknown_keys(backend):
+    columns = TransactionColumns()
+    assert columns.group_by("currency") == {}
+    assert math.isnan(columns.percentiles()[50])
+    with pytest.raises(ValueError):
+        columns.group_by("merchant")
@@ -0,0 +1,61 @@
+import asyncio
+import httpx
+import pytest
+from alatpay.exceptions import AlatException
+from benchmarks.scenarios import _ACCOUNT, _CARD, _CARD_INIT, _USER
+from benchmarks.server import MockGateway
+from transport.exceptions import ErrorCode
+
+
+def test_async_card_and_bank_transfer_flows(async_alatpay):
+    gateway = MockGateway()
+
+    async def main():
+        async with async_alatpay(gateway._handle_async) as integration:
+            initiated = await integration.card_transactions.initiate_card_payment(_CARD)
+            authenticated = await integration.card_transactions.authenticate_card(_USER, _CARD_INIT)
+            account = await integration.bank_transfer.generate_virtual_account(_ACCOUNT)
+            status = await integration.bank_transfer.confirm_transaction_status(account.data.transactionId)
+        return initiated, authenticated, account, status
+
+    initiated, authenticated, account, status = asyncio.run(main())
+    assert initiated.transactionId == "txn-00001"
+    assert authenticated.gatewayRecommendation == "PROCEED"
+    assert account.data.virtualBankAccountNumber == "1234567890"
+    assert status["data"]["status"] == "completed"
+    assert gateway.requests == 4
+
+
+def test_async_rejected_card_raises_without_sending(async_alatpay):
+    sent = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={})
+
+    async def main():
+        async with async_alatpay(handler) as integration:
+            await integration.card_transactions.authenticate_card(
+                _USER, _CARD_INIT.model_copy(update={"gatewayRecommendation": "DO_NOT_PROCEED"})
+            )
+
+    with pytest.raises(AlatException) as info:
+        asyncio.run(main())
+    assert info.value.code == 400
+    assert info.value.error_code == ErrorCode.DECLINED
+    assert sent == []
+
+
+def test_async_post_status_error_becomes_alat_exception(async_alatpay):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401, json={"message": "Invalid subscription key"})
+
+    async def main():
+        async with async_alatpay(handler) as integration:
+            await integration.bank_transfer.generate_virtual_account(_ACCOUNT)
+
+    with pytest.raises(AlatException) as info:
+        asyncio.run(main())
+    assert str(info.value) == "Invalid subscription key (Error code: 401)"
+    assert info.value.error_code == ErrorCode.AUTHENTICATION
+    assert not info.value.is_retryable()
@@ -0,0 +1,71 @@
+import asyncio
+import httpx
+import pytest
+from benchmarks.server import transaction
+from paystack.errors.errors import TransactionError
+from paystack.models import TransactionsInitPayloadModel, TransactionsVerifyResponseModel
+
+
+def test_async_verify_and_initialize(async_paystack):
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path, request.headers["authorization"]))
+        if request.url.path == "/transaction/initialize":
+            return httpx.Response(200, json={
+                "status": True,
+                "message": "Authorization URL created",
+                "data": {"authorization_url": "https://checkout.paystack.com/x", "access_code": "x", "reference": "ref-1"}
+            })
+        return httpx.Response(200, json={"status": True, "message": "Verification successful", "data": transaction(1)})
+
+    async def main():
+        integration = async_paystack(handler)
+        async with integration:
+            verified = await integration.transactions.verify_transaction("ref-1")
+            created = await integration.transactions.initialize_transaction(
+                TransactionsInitPayloadModel(amount="5000", email="ada@example.com", reference="ref-1")
+            )
+        return verified, created
+
+    verified, created = asyncio.run(main())
+    assert isinstance(verified, TransactionsVerifyResponseModel)
+    assert verified.data.id == transaction(1)["id"]
+    assert created.data.access_code == "x"
+    assert seen == [
+        ("GET", "/transaction/verify/ref-1", "Bearer sk_test_suite"),
+        ("POST", "/transaction/initialize", "Bearer sk_test_suite")
+    ]
+
+
+def test_async_failure_raises_transaction_error(async_paystack):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"status": False, "message": "Transaction reference not found"})
+
+    async def main():
+        async with async_paystack(handler) as integration:
+            await integration.transactions.verify_transaction("missing")
+
+    with pytest.raises(TransactionError) as info:
+        asyncio.run(main())
+    assert info.value.code == 403
+    assert info.value.context["message"] == "Transaction reference not found"
+
+
+def test_async_calls_run_concurrently(async_paystack):
+    in_flight, peak = 0, 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"status": True, "message": "Verification successful", "data": transaction(1)})
+
+    async def main():
+        async with async_paystack(handler) as integration:
+            await asyncio.gather(*(integration.transactions.verify_transaction(f"ref-{i}") for i in range(5)))
+
+    asyncio.run(main())
+    assert peak == 5
@@ -0,0 +1,59 @@
+import json
+import pytest
+from benchmarks import run
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.server import MockGateway
+
+
+@pytest.mark.parametrize("mode", run.MODES)
+def test_every_scenario_runs_in_every_mode(mode):
+    gateway = MockGateway(page_size=3)
+    for scenario in SCENARIOS:
+        result = run.Runner(gateway, mode, concurrency=2).run(scenario, requests=3, warmup=1, alloc_requests=1, profile_requests=1)
+        assert result["scenario"] == scenario.name
+        assert result["concurrency"] == (1 if mode == "sync" else 2)
+        assert result["latency_ms"]["p50"] <= result["latency_ms"]["max"]
+        assert set(result["cpu"]) == set(run.CPU_CATEGORIES)
+        assert sum(category["share"] for category in result["cpu"].values()) == pytest.approx(1, abs=0.01)
+    # warmup, timed, traced and profiled calls all reached the stub
+    assert gateway.requests == len(SCENARIOS) * 6
+
+
+def _results(p50: float, p99: float, rps: float, page_size: int = 50) -> dict:
+    return {
+        "config": {"page_size": page_size, "latency_ms": 0.0},
+        "results": [{"scenario": "paystack.verify_transaction", "mode": "sync", "concurrency": 1,
+                     "latency_ms": {"p50": p50, "p99": p99}, "throughput_rps": rps}]
+    }
+
+
+def test_compare_flags_regressions_past_the_threshold():
+    baseline = _results(1.0, 2.0, 1000)
+    assert run.compare(_results(1.05, 2.1, 960), baseline, 0.1) == []
+
+    regressions = run.compare(_results(1.2, 2.0, 800), baseline, 0.1)
+    assert regressions == [
+        "paystack.verify_transaction [sync] p50 1.000ms -> 1.200ms",
+        "paystack.verify_transaction [sync] throughput 1000 -> 800 req/s"
+    ]
+    # Runs with a different config are not comparable
+    assert run.compare(_results(5.0, 9.0, 10, page_size=100), baseline, 0.1) == []
+
+
+def test_cli_writes_results_and_compares(tmp_path, capsys, restore_loggers):
+    output = tmp_path / "results.json"
+    argv = ["--mode", "sync", "--requests", "3", "--warmup", "1", "--alloc-requests", "1", "--profile-requests", "1",
+            "--scenario", "verify_transaction", "--log-level", "OFF"]
+
+    assert run.main(argv + ["--output", str(output)]) == 0
+    results = json.loads(output.read_text())
+    assert {result["scenario"] for result in results["results"]} == {"paystack.verify_transaction"}
+    assert results["environment"]["python"]
+
+    # An impossibly fast baseline makes any real run a regression
+    for result in results["results"]:
+        result["latency_ms"] = {"p50": 1e-9, "p99": 1e-9}
+        result["throughput_rps"] = 1e12
+    output.write_text(json.dumps(results))
+    assert run.main(argv + ["--baseline", str(output)]) == 1
+    assert "REGRESSION paystack.verify_transaction [sync]" in capsys.readouterr().out
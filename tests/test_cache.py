@@ -0,0 +1,150 @@
+import asyncio
+import httpx
+import pytest
+import threading
+import time
+from benchmarks.server import transaction
+from paystack.models import TransactionsVerifyResponseModel
+from transport.cache import MemoryCache, ResponseCache, SQLiteCache
+
+
+def _verifying(status: str, requests: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"status": True, "message": "Verification successful", "data": transaction(1, status)})
+    return handler
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        yield ResponseCache()
+        return
+    backend = SQLiteCache(str(tmp_path / "cache.db"))
+    yield ResponseCache(backend)
+    backend.close()
+
+
+def test_terminal_transactions_are_cached(paystack, cache):
+    requests = []
+    with paystack(_verifying("success", requests), cache=cache) as integration:
+        first = integration.transactions.verify_transaction("ref-1")
+        second = integration.transactions.verify_transaction("ref-1")
+
+    assert len(requests) == 1
+    assert isinstance(second, TransactionsVerifyResponseModel)
+    assert second == first
+    assert cache.stats()["by_method"]["verify_transaction"] == {"hits": 1, "misses": 1, "stores": 1}
+
+
+def test_pending_transactions_always_hit_paystack(paystack, cache):
+    requests = []
+    with paystack(_verifying("ongoing", requests), cache=cache) as integration:
+        integration.transactions.verify_transaction("ref-1")
+        integration.transactions.verify_transaction("ref-1")
+    assert len(requests) == 2
+
+
+def test_views_are_cached_separately(paystack, cache):
+    requests = []
+    with paystack(_verifying("success", requests), cache=cache) as integration:
+        integration.transactions.verify_transaction("ref-1")
+        slim = integration.transactions.verify_transaction("ref-1", fields=["status", "amount"])
+        integration.transactions.verify_transaction("ref-1", fields=["amount", "status"])
+
+    assert len(requests) == 2
+    assert slim.data.model_dump() == {"amount": transaction(1)["amount"], "status": "success"}
+
+
+def test_methods_without_ttl_are_not_cached():
+    cache = ResponseCache(ttls={"verify_transaction": 0})
+    cache.put("verify_transaction", "ref-1", {"data": {}})
+    cache.put("transaction_totals", "all", {"data": {}})
+    assert cache.get("verify_transaction", "ref-1") is None
+    assert cache.get("transaction_totals", "all") is None
+
+
+def test_memory_cache_expires_and_evicts():
+    backend = MemoryCache(max_size=2)
+    backend.set("a", 1, ttl=60)
+    backend.set("b", 2, ttl=60)
+    backend.get("a")
+    backend.set("c", 3, ttl=60)
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+    assert backend.evictions == 1
+
+    backend.set("d", 4, ttl=0.01)
+    time.sleep(0.02)
+    assert backend.get("d") is None
+
+
+def test_sqlite_cache_is_shared_and_bounded(tmp_path):
+    path = str(tmp_path / "cache.db")
+    first, second = SQLiteCache(path, max_size=2), SQLiteCache(path, max_size=2)
+    first.set("a", b"1", ttl=60)
+    assert second.get("a") == b"1"
+
+    first.set("b", b"2", ttl=60)
+    first.set("c", b"3", ttl=60)
+    assert first.get("a") is None
+    assert first.evictions == 1
+
+    first.set("d", b"4", ttl=-1)
+    assert second.get("d") is None
+    first.close()
+    second.close()
+
+
+def test_cached_dicts_are_copies():
+    cache = ResponseCache(ttls={"view_transaction_timeline": 60})
+    cache.put("view_transaction_timeline", "ref-1", {"data": {"success": True}})
+    cache.get("view_transaction_timeline", "ref-1")["data"]["success"] = False
+    assert cache.get("view_transaction_timeline", "ref-1") == {"data": {"success": True}}
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_cached_models_are_copies(paystack, cache, lazy):
+    with paystack(_verifying("success", []), cache=cache, lazy=lazy) as integration:
+        first = integration.transactions.verify_transaction("ref-1")
+        first.data.amount = 1
+        second = integration.transactions.verify_transaction("ref-1")
+        second.data.amount = 2
+        third = integration.transactions.verify_transaction("ref-1")
+
+    assert third.data.amount == transaction(1)["amount"]
+    assert third is not second
+
+
+def test_async_sqlite_lookups_run_off_the_loop(async_paystack, tmp_path):
+    threads = []
+
+    class RecordingCache(SQLiteCache):
+        def get(self, key):
+            threads.append(threading.get_ident())
+            return super().get(key)
+
+        def set(self, key, value, ttl):
+            threads.append(threading.get_ident())
+            super().set(key, value, ttl)
+
+    backend = RecordingCache(str(tmp_path / "cache.db"))
+    sync = _verifying("success", [])
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return sync(request)
+
+    async def main():
+        async with async_paystack(handler, cache=ResponseCache(backend)) as integration:
+            first = await integration.transactions.verify_transaction("ref-1")
+            second = await integration.transactions.verify_transaction("ref-1")
+        return threading.get_ident(), first, second
+
+    try:
+        loop_thread, first, second = asyncio.run(main())
+    finally:
+        backend.close()
+
+    assert second == first
+    assert len(threads) == 3
+    assert loop_thread not in threads
@@ -0,0 +1,183 @@
+import asyncio
+import httpx
+import logging
+import pytest
+import time
+from transport.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerRegistry, CircuitState
+from transport.exceptions import ErrorCode, GatewayUnavailable
+from transport.retry import RetryPolicy
+
+
+CONFIG = CircuitBreakerConfig(window_size=4, minimum_calls=2, open_duration=0.05, half_open_max_calls=1)
+ONCE = RetryPolicy(max_attempts=1)
+ROUTE = "/transaction/verify/{reference}"
+
+
+def _ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"status": True, "message": "Verification successful", "data": {}})
+
+
+def _status(status: int):
+    def handler(request: httpx.Request) -> httpx.Response:
+        handler.calls += 1
+        return httpx.Response(status, json={"message": "nope"})
+    handler.calls = 0
+    return handler
+
+
+def _trip(integration) -> None:
+    for _ in range(CONFIG.minimum_calls):
+        with pytest.raises(httpx.HTTPStatusError):
+            integration._get_request("/transaction/verify/ref-1")
+
+
+def test_opens_after_failures_and_fails_fast(paystack):
+    registry = CircuitBreakerRegistry(CONFIG)
+    handler = _status(503)
+
+    with paystack(handler, circuit_breakers=registry, retry_policy=ONCE) as integration:
+        _trip(integration)
+        with pytest.raises(GatewayUnavailable) as info:
+            integration._get_request("/transaction/verify/ref-2")
+
+    assert handler.calls == 2
+    assert info.value.route == ROUTE
+    assert info.value.error_code == ErrorCode.UNAVAILABLE
+    assert info.value.is_retryable()
+    assert not registry.is_available("paystack")
+    assert registry.is_available("alatpay")
+    assert registry.stats("paystack")[f"paystack {ROUTE}"]["rejected"] == 1
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_shed_calls_are_not_logged_as_errors(paystack, async_paystack, caplog, mode):
+    registry = CircuitBreakerRegistry(CONFIG)
+    logger = logging.getLogger("transport.transport")
+    logger.addHandler(caplog.handler)
+    caplog.set_level(logging.DEBUG, logger="transport.transport")
+
+    async def main():
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(503, json={"message": "nope"})
+
+        async with async_paystack(handler, circuit_breakers=registry, retry_policy=ONCE) as integration:
+            for _ in range(CONFIG.minimum_calls):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await integration._get_request("/transaction/verify/ref-1")
+            caplog.clear()
+            with pytest.raises(GatewayUnavailable):
+                await integration._get_request("/transaction/verify/ref-2")
+
+    try:
+        if mode == "sync":
+            with paystack(_status(503), circuit_breakers=registry, retry_policy=ONCE) as integration:
+                _trip(integration)
+                caplog.clear()
+                with pytest.raises(GatewayUnavailable):
+                    integration._get_request("/transaction/verify/ref-2")
+        else:
+            asyncio.run(main())
+    finally:
+        logger.removeHandler(caplog.handler)
+
+    assert not [record for record in caplog.records if record.levelno >= logging.WARNING]
+    assert any("shed" in record.getMessage() for record in caplog.records)
+
+
+def test_client_errors_do_not_open(paystack):
+    registry = CircuitBreakerRegistry(CONFIG)
+    with paystack(_status(400), circuit_breakers=registry, retry_policy=ONCE) as integration:
+        for _ in range(5):
+            with pytest.raises(httpx.HTTPStatusError):
+                integration._get_request("/transaction/verify/ref-1")
+    assert registry.get("paystack", ROUTE).state == CircuitState.CLOSED
+
+
+def test_half_open_trial_closes_or_reopens():
+    breaker = CircuitBreaker("paystack", ROUTE, CONFIG)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record(0.01, failed=True)
+    assert breaker.state == CircuitState.OPEN
+
+    time.sleep(CONFIG.open_duration)
+    breaker.before_call()
+    with pytest.raises(GatewayUnavailable):
+        breaker.before_call()
+    breaker.record(0.01, failed=True)
+    assert breaker.state == CircuitState.OPEN
+
+    time.sleep(CONFIG.open_duration)
+    breaker.before_call()
+    breaker.record(0.01, failed=False)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_slow_calls_open_the_circuit():
+    breaker = CircuitBreaker("paystack", ROUTE, CONFIG.model_copy(update={"slow_call_duration": 1.0}))
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record(2.0, failed=False)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_release_hands_back_the_half_open_slot():
+    breaker = CircuitBreaker("paystack", ROUTE, CONFIG)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record(0.01, failed=True)
+    time.sleep(CONFIG.open_duration)
+
+    breaker.before_call()
+    breaker.release()
+    breaker.before_call()
+    breaker.record(0.01, failed=False)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_cancelled_trial_call_does_not_wedge_the_breaker(async_paystack):
+    registry = CircuitBreakerRegistry(CONFIG)
+    mode = "fail"
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if mode == "fail":
+            return httpx.Response(503, json={"message": "down"})
+        if mode == "hang":
+            await asyncio.sleep(10)
+        return _ok(request)
+
+    async def main():
+        nonlocal mode
+        async with async_paystack(handler, circuit_breakers=registry, retry_policy=ONCE) as integration:
+            for _ in range(2):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await integration._get_request("/transaction/verify/ref-1")
+            await asyncio.sleep(CONFIG.open_duration)
+
+            mode = "hang"
+            trial = asyncio.ensure_future(integration._get_request("/transaction/verify/ref-1"))
+            await asyncio.sleep(0.01)
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+
+            mode = "ok"
+            await integration._get_request("/transaction/verify/ref-1")
+
+    asyncio.run(main())
+    assert registry.get("paystack", ROUTE).state == CircuitState.CLOSED
+
+
+def test_breakers_are_per_route(paystack):
+    registry = CircuitBreakerRegistry(CONFIG)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/transaction/verify/"):
+            return httpx.Response(503, json={"message": "down"})
+        return _ok(request)
+
+    with paystack(handler, circuit_breakers=registry, retry_policy=ONCE) as integration:
+        _trip(integration)
+        integration._get_request("/transaction/timeline/ref-1")
+
+    assert registry.get("paystack", "/transaction/timeline/{id_or_ref}").state == CircuitState.CLOSED
@@ -0,0 +1,55 @@
+import pytest
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.server import MockGateway, transaction
+from datetime import datetime, timezone
+from paystack.models import TransactionsVerifyResponseModel
+from pydantic import BaseModel
+from transport import codec
+
+
+def _plain(result):
+    return result.model_dump() if isinstance(result, BaseModel) else result
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(codec, "orjson", None)
+    elif codec.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_roundtrip(backend):
+    value = {"id": 1, "name": "Ada Ọbị", "amount": 50.5, "tags": [None, True], "nested": {"a": []}}
+    assert codec.loads(codec.dumps(value)) == value
+    assert codec.loads(codec.dumps(value).decode()) == value
+
+
+def test_dates_encode_the_same_with_either_backend(backend):
+    when = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert codec.loads(codec.dumps({"when": when, "day": when.date()})) == {"when": "2024-01-01T00:00:00+00:00", "day": "2024-01-01"}
+
+
+def test_decode_model_bytes_and_dict(backend):
+    body = {"status": True, "message": "Verification successful", "data": transaction(1)}
+
+    from_bytes, undecoded = codec.decode_model(codec.dumps(body), TransactionsVerifyResponseModel, "Verification successful")
+    from_dict, _ = codec.decode_model(body, TransactionsVerifyResponseModel, "Verification successful")
+    assert undecoded == {}
+    assert from_bytes == from_dict
+
+    failed = {"status": False, "message": "Transaction reference not found"}
+    result, decoded = codec.decode_model(codec.dumps(failed), TransactionsVerifyResponseModel, "Verification successful")
+    assert result is None
+    assert decoded == failed
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda scenario: scenario.name)
+def test_fast_json_matches_dict_path(scenario, paystack, alatpay):
+    make = paystack if scenario.provider == "paystack" else alatpay
+    results = []
+    for fast_json in (False, True):
+        with make(MockGateway(page_size=5)._handle, fast_json=fast_json) as integration:
+            results.append(_plain(scenario.call(integration)))
+    assert results[0] == results[1]
@@ -0,0 +1,115 @@
+import asyncio
+import httpx
+import math
+import pytest
+import sys
+from benchmarks.server import BASE_TIME, transaction
+from paystack.models import CompactTransaction, ListTransactionsDataModel, TransactionBatch
+
+
+def _ledger(count: int = 7):
+    return [transaction(i, ("success", "failed")[i % 2]) for i in range(count)]
+
+
+def _paged(ledger: list, per_page: int = 3):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        return httpx.Response(200, json={
+            "status": True,
+            "message": "Transactions retrieved",
+            "data": ledger[(page - 1) * per_page:page * per_page],
+            "meta": {"total": len(ledger), "perPage": per_page, "page": page, "pageCount": -(-len(ledger) // per_page)}
+        })
+    return handler
+
+
+def test_from_item_and_back():
+    item = transaction(3)
+    record = CompactTransaction.from_item(item)
+    assert record.id == item["id"]
+    assert record.reference == item["reference"]
+    assert record.amount == item["amount"]
+    assert record.customer_id == item["customer"]["id"]
+    assert record.created_at == (BASE_TIME.timestamp() + 180)
+    assert record.status is sys.intern("success")
+    with pytest.raises(ValueError):
+        record.to_model()
+
+    model = ListTransactionsDataModel(**item)
+    assert CompactTransaction.from_item(model) == record
+
+    empty = CompactTransaction.from_item({"id": 1, "status": "abandoned"})
+    assert (empty.amount, empty.customer_id, empty.customer_email) == (0, 0, None)
+    assert math.isnan(empty.created_at) and math.isnan(empty.paid_at)
+
+
+def test_batch_stores_columns():
+    ledger = _ledger()
+    batch = TransactionBatch(ledger, keep_raw=True)
+
+    assert len(batch) == len(ledger)
+    assert list(batch.amount) == [item["amount"] for item in ledger]
+    assert batch.column("status") == [item["status"] for item in ledger]
+    assert batch.labels["status"] == ["success", "failed"]
+    assert batch[-1] == batch[len(ledger) - 1]
+    with pytest.raises(IndexError):
+        batch[len(ledger)]
+
+    assert list(batch) == [batch[i] for i in range(len(ledger))]
+    assert [model.reference for model in batch.to_models()] == [item["reference"] for item in ledger]
+    assert TransactionBatch(batch).raw is None
+    with pytest.raises(ValueError):
+        next(TransactionBatch(ledger).to_models())
+
+
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_list_transactions_compact(paystack, fast_json):
+    ledger = _ledger()
+    with paystack(_paged(ledger), fast_json=fast_json) as integration:
+        batch = integration.transactions.list_transactions(compact=True)
+        full = integration.transactions.list_transactions(compact=True, keep_raw=True)
+        models = integration.transactions.list_transactions()
+
+    assert isinstance(batch, TransactionBatch)
+    assert batch.meta["pageCount"] == 3
+    assert list(batch.id) == [item["id"] for item in ledger[:3]]
+    assert batch.raw is None
+    assert list(full.to_models()) == models.data
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_iter_transactions_compact(paystack, prefetch):
+    ledger = _ledger()
+    with paystack(_paged(ledger)) as integration:
+        records = list(integration.transactions.iter_transactions(compact=True, keep_raw=True, prefetch=prefetch))
+        models = list(integration.transactions.iter_transactions(prefetch=prefetch))
+
+    assert all(isinstance(record, CompactTransaction) for record in records)
+    assert [record.to_model() for record in records] == models
+    assert list(TransactionBatch(records).id) == [item["id"] for item in ledger]
+
+
+def test_fields_and_compact_cannot_be_combined(paystack):
+    with paystack(_paged(_ledger())) as integration:
+        with pytest.raises(ValueError):
+            integration.transactions.list_transactions(fields=("id",), compact=True)
+        with pytest.raises(ValueError):
+            list(integration.transactions.iter_transactions(fields=("id",), compact=True))
+
+
+def test_async_compact(async_paystack):
+    ledger = _ledger()
+    sync = _paged(ledger)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return sync(request)
+
+    async def main():
+        async with async_paystack(handler) as integration:
+            batch = await integration.transactions.list_transactions(compact=True)
+            records = [record async for record in integration.transactions.iter_transactions(compact=True)]
+            return batch, records
+
+    batch, records = asyncio.run(main())
+    assert len(batch) == 3
+    assert [record.id for record in records] == [item["id"] for item in ledger]
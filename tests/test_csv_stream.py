@@ -0,0 +1,163 @@
+import asyncio
+import csv
+import httpx
+import io
+import pytest
+from transport.csv_stream import CsvRowParser
+from transport.retry import RetryPolicy
+
+
+ROWS = [
+    {"id": "1", "reference": "ref-1", "note": "plain", "amount": "5000"},
+    {"id": "2", "reference": "ref-2", "note": "two\nlines, and a comma", "amount": "6000"},
+    {"id": "3", "reference": "ref-3", "note": 'say "hi"\r\nthen   \x0b \x1c \x85 go', "amount": "7000"},
+    {"id": "4", "reference": "ref-4", "note": "Ọbị ₦", "amount": "8000"}
+]
+
+EXPORT_URL = "https://files.paystack.test/exports/transactions.csv"
+
+# Bigger than the 64KiB download chunk, so drops land after progress was made
+LARGE = ROWS * 2000
+CHUNK = 64 * 1024
+
+
+def _csv(rows=ROWS, lineterminator: str = "\r\n") -> bytes:
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(rows[0]), lineterminator=lineterminator)
+    writer.writeheader()
+    writer.writerows(rows)
+    return out.getvalue().encode("utf-8")
+
+
+def _parse(data: bytes, size: int):
+    parser = CsvRowParser()
+    rows = []
+    for start in range(0, len(data), size):
+        rows.extend(parser.feed(data[start:start + size]))
+    return rows + parser.close()
+
+
+@pytest.mark.parametrize("lineterminator", ["\r\n", "\n"])
+def test_every_chunk_size_gives_the_same_rows(lineterminator):
+    data = _csv(lineterminator=lineterminator)
+    for size in range(1, len(data) + 1):
+        assert _parse(data, size) == ROWS, size
+
+
+def test_bom_and_missing_final_newline():
+    data = b"\xef\xbb\xbf" + _csv().rstrip(b"\r\n")
+    assert _parse(data, 7) == ROWS
+
+
+def test_stray_quote_in_unquoted_field():
+    data = b'a,b\n1,5" screen\n2,ok\n3,x "y" z\n4,"quoted, ""really"""\n'
+    expected = [
+        {"a": "1", "b": '5" screen'},
+        {"a": "2", "b": "ok"},
+        {"a": "3", "b": 'x "y" z'},
+        {"a": "4", "b": 'quoted, "really"'}
+    ]
+    for size in range(1, len(data) + 1):
+        assert _parse(data, size) == expected, size
+
+
+def test_unterminated_quote_is_flushed_on_close():
+    parser = CsvRowParser()
+    rows = parser.feed(b'id,note\n1,"never closed\n')
+    assert rows == []
+    assert parser.close() == [{"id": "1", "note": "never closed\n"}]
+
+
+class _Dropping(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """
+    Body that sends `data` up to `drop_at` bytes, then loses the connection.
+    """
+
+    def __init__(self, data: bytes, drop_at: int = None):
+        self.data = data
+        self.drop_at = drop_at
+
+    def _chunks(self):
+        end = len(self.data) if self.drop_at is None else self.drop_at
+        for start in range(0, end, 1000):
+            yield self.data[start:min(start + 1000, end)]
+
+    def __iter__(self):
+        yield from self._chunks()
+        if self.drop_at is not None:
+            raise httpx.ReadError("connection reset")
+
+    async def __aiter__(self):
+        for chunk in self._chunks():
+            yield chunk
+        if self.drop_at is not None:
+            raise httpx.ReadError("connection reset")
+
+
+def _exporter(data: bytes, drops: list, ranges: list, honour_range: bool = True):
+    """
+    Serve the export link and the file, dropping the connection at each
+    offset in `drops` (in order) and recording the Range headers received.
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/transaction/export":
+            return httpx.Response(200, json={"status": True, "message": "Export successful", "data": {"path": EXPORT_URL}})
+
+        ranges.append(request.headers.get("range"))
+        offset = int(request.headers["range"][6:-1]) if "range" in request.headers else 0
+        if not honour_range:
+            offset = 0
+        if offset >= len(data):
+            return httpx.Response(416)
+        drop_at = drops.pop(0) - offset if drops else None
+        return httpx.Response(206 if offset else 200, stream=_Dropping(data[offset:], drop_at))
+    return handler
+
+
+@pytest.mark.parametrize("honour_range", [True, False])
+def test_stream_export_resumes_after_drops(paystack, tmp_path, honour_range):
+    data = _csv(LARGE)
+    ranges = []
+    handler = _exporter(data, [CHUNK + 5000, 2 * CHUNK + 5000], ranges, honour_range)
+    destination = tmp_path / "export.csv"
+
+    with paystack(handler, retry_policy=RetryPolicy(base_delay=0)) as integration:
+        rows = list(integration.transactions.stream_export(destination=str(destination)))
+
+    assert rows == LARGE
+    assert destination.read_bytes() == data
+    # Bytes buffered short of a full chunk when the line drops are fetched again
+    assert ranges == [None, f"bytes={CHUNK}-", f"bytes={2 * CHUNK}-"]
+
+
+def test_download_gives_up_after_repeated_drops_without_progress(paystack, tmp_path):
+    data = _csv()
+    handler = _exporter(data, [10, 10, 10, 10], [])
+
+    with paystack(handler, retry_policy=RetryPolicy(base_delay=0, max_attempts=3)) as integration:
+        with pytest.raises(httpx.ReadError):
+            integration.transactions.download_export(str(tmp_path / "export.csv"))
+
+
+def test_download_export_memory_map(paystack, tmp_path):
+    data = _csv()
+    with paystack(_exporter(data, [], []), retry_policy=RetryPolicy(base_delay=0)) as integration:
+        mapped = integration.transactions.download_export(str(tmp_path / "export.csv"), memory_map=True)
+    assert mapped[:] == data
+    mapped.close()
+
+
+def test_async_stream_export_resumes(async_paystack):
+    data = _csv(LARGE)
+    ranges = []
+    sync = _exporter(data, [CHUNK + 5000], ranges)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return sync(request)
+
+    async def main():
+        async with async_paystack(handler, retry_policy=RetryPolicy(base_delay=0)) as integration:
+            return [row async for row in integration.transactions.stream_export()]
+
+    assert asyncio.run(main()) == LARGE
+    assert ranges == [None, f"bytes={CHUNK}-"]
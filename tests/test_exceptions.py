@@ -0,0 +1,139 @@
+import asyncio
+import copy
+import httpx
+import pickle
+import pytest
+from alatpay.exceptions import AlatException
+from alatpay.models import InitPayloadModel
+from paystack.errors.errors import TransactionError
+from transport.exceptions import (
+    ErrorCode,
+    GatewayUnavailable,
+    IdempotencyConflict,
+    classify,
+    classify_error,
+    is_retryable,
+    mask_value
+)
+
+
+_CARD = InitPayloadModel(cardNumber="5399831234567890", currency="NGN")
+
+
+def _responding(status: int, **options):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status, **options)
+    return handler
+
+
+@pytest.mark.parametrize("status, message, expected", [
+    (403, "Transaction reference not found", ErrorCode.NOT_FOUND),
+    (400, "Card declined by issuer", ErrorCode.DECLINED),
+    (400, "Token has expired", ErrorCode.EXPIRED),
+    (400, "Invalid key", ErrorCode.AUTHENTICATION),
+    (400, "Duplicate transaction reference", ErrorCode.DUPLICATE),
+    (400, "Something else", ErrorCode.INVALID_REQUEST),
+    (429, None, ErrorCode.RATE_LIMITED),
+    (502, None, ErrorCode.GATEWAY_ERROR),
+    (418, None, ErrorCode.UNKNOWN),
+    (None, None, ErrorCode.UNKNOWN)
+])
+def test_classify(status, message, expected):
+    assert classify(status, message) == expected
+
+
+def test_mask_value():
+    assert mask_value("5399831234567890") == "53****90"
+    assert mask_value("abc") == "ab****"
+    assert mask_value(123456789) == "12****89"
+    assert mask_value({"card": {"pan": "5399831234567890", "cvv": "123"}, "saved": True, "note": None, "ids": [1234567]}) == {
+        "card": {"pan": "53****90", "cvv": "12****"}, "saved": True, "note": None, "ids": ["12****67"]
+    }
+
+
+def test_context_is_masked_lazily():
+    error = TransactionError("Charge failed", 403, {"email": "ada@example.com", "message": "Declined"})
+    assert error.__dict__["_masked"] is None
+    assert error.masked_context == {"email": "ad****om", "message": "De****ed"}
+    assert "ada@example.com" not in repr(error)
+    assert str(error) == "Charge failed (Error code: 403)"
+    assert error.error_code == ErrorCode.DECLINED
+    assert not error.is_retryable()
+
+
+@pytest.mark.parametrize("error", [
+    AlatException("Couldn't Initiate Card Payment", 400, {"message": "Card expired"}),
+    TransactionError("Transaction Verification failed.", 403, {"message": "Transaction reference not found"}),
+    GatewayUnavailable("paystack", "/transaction/verify/{reference}", 12.5),
+    IdempotencyConflict("order-1", 3.0)
+])
+def test_errors_survive_pickle_and_copy(error):
+    error.error_code  # computed state is carried over as well
+    for clone in (pickle.loads(pickle.dumps(error)), copy.copy(error), copy.deepcopy(error)):
+        assert type(clone) is type(error)
+        assert clone.args == error.args
+        assert clone.__dict__ == error.__dict__
+        assert str(clone) == str(error)
+        assert clone.error_code == error.error_code
+
+
+def test_unavailable_and_conflict_are_retryable():
+    assert GatewayUnavailable("paystack", "/transaction", 1).is_retryable()
+    assert IdempotencyConflict("order-1", 1).error_code == ErrorCode.IN_FLIGHT
+    assert is_retryable(httpx.ConnectTimeout("timed out"))
+    assert classify_error(httpx.ConnectError("refused")) == ErrorCode.NETWORK
+    assert classify_error(ValueError()) == ErrorCode.UNKNOWN
+
+
+@pytest.mark.parametrize("options", [
+    {"text": "<html><body><h1>502 Bad Gateway</h1></body></html>", "headers": {"Content-Type": "text/html"}},
+    {},
+    {"json": ["not", "an", "object"]}
+])
+def test_alatpay_non_json_error_bodies(alatpay, options):
+    with alatpay(_responding(502, **options)) as integration:
+        with pytest.raises(AlatException) as raised:
+            integration.card_transactions.initiate_card_payment(_CARD)
+
+    assert raised.value.message == "Bad Gateway"
+    assert raised.value.code == 502
+    assert raised.value.error_code == ErrorCode.GATEWAY_ERROR
+    assert raised.value.is_retryable()
+
+
+def test_alatpay_json_error_body(alatpay):
+    with alatpay(_responding(401, json={"status": False, "message": "Invalid subscription key"})) as integration:
+        with pytest.raises(AlatException) as raised:
+            integration.card_transactions.initiate_card_payment(_CARD)
+
+    assert raised.value.message == "Invalid subscription key"
+    assert raised.value.context == {"status": False, "message": "Invalid subscription key"}
+    assert raised.value.error_code == ErrorCode.AUTHENTICATION
+    assert not raised.value.is_retryable()
+
+
+def test_async_alatpay_html_error_body(async_alatpay):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503, text="<html>Service Unavailable</html>")
+
+    async def main():
+        async with async_alatpay(handler) as integration:
+            await integration.card_transactions.initiate_card_payment(_CARD)
+
+    with pytest.raises(AlatException) as raised:
+        asyncio.run(main())
+    assert raised.value.message == "Service Unavailable"
+    assert raised.value.error_code == ErrorCode.GATEWAY_ERROR
+
+
+def test_paystack_errors_are_classified(paystack):
+    body = {"status": False, "message": "Transaction reference not found"}
+    with paystack(_responding(200, json=body)) as integration:
+        with pytest.raises(TransactionError) as raised:
+            integration.transactions.verify_transaction("missing")
+    assert raised.value.error_code == ErrorCode.NOT_FOUND
+
+    with paystack(_responding(401, json={"status": False, "message": "Invalid key"})) as integration:
+        with pytest.raises(httpx.HTTPStatusError) as raised:
+            integration.transactions.verify_transaction("ref-1")
+    assert classify_error(raised.value) == ErrorCode.AUTHENTICATION
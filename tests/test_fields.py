@@ -0,0 +1,32 @@
+import math
+import pytest
+from datetime import datetime, timezone
+from transport.fields import get_field, to_epoch
+
+
+class _Item():
+    amount = 5000
+
+
+def test_get_field():
+    assert get_field({"amount": 5000}, "amount") == 5000
+    assert get_field(_Item(), "amount") == 5000
+    assert get_field({}, "amount") is None
+    assert get_field(_Item(), "currency") is None
+
+
+@pytest.mark.parametrize("value", [
+    "2024-01-02T03:04:05Z",
+    "2024-01-02T03:04:05+00:00",
+    "2024-01-02T03:04:05",
+    datetime(2024, 1, 2, 3, 4, 5),
+    datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    1704164645
+])
+def test_to_epoch(value):
+    assert to_epoch(value) == 1704164645.0
+
+
+@pytest.mark.parametrize("value", [None, "", "not a date"])
+def test_to_epoch_missing_is_nan(value):
+    assert math.isnan(to_epoch(value))
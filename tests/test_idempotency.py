@@ -0,0 +1,236 @@
+import asyncio
+import httpx
+import pytest
+import threading
+import time
+from paystack.models import TransactionsInitPayloadModel
+from transport.exceptions import ErrorCode, IdempotencyConflict
+from transport.idempotency import IdempotencyGuard, MemoryIdempotencyStore, SQLiteIdempotencyStore
+
+
+def _initialized(reference: str = "ref-1") -> dict:
+    return {
+        "status": True,
+        "message": "Authorization URL created",
+        "data": {"authorization_url": f"https://checkout.paystack.com/{reference}", "access_code": reference, "reference": reference}
+    }
+
+
+def _payload(reference: str = "ref-1") -> TransactionsInitPayloadModel:
+    return TransactionsInitPayloadModel(amount="5000", email="ada@example.com", reference=reference)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store_factory(request, tmp_path):
+    stores = []
+
+    def make(**options):
+        if request.param == "memory":
+            store = stores[0] if stores else MemoryIdempotencyStore(**options)
+        else:
+            store = SQLiteIdempotencyStore(str(tmp_path / "idempotency.db"), **options)
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        if hasattr(store, "close"):
+            store.close()
+
+
+def test_duplicate_key_replays_the_first_response(paystack, store_factory):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=_initialized(f"ref-{len(requests)}"))
+
+    guard = IdempotencyGuard(store_factory())
+    with paystack(handler, idempotency=guard) as integration:
+        first = integration.transactions.initialize_transaction(_payload("ref-a"), idempotency_key="order-1")
+        second = integration.transactions.initialize_transaction(_payload("ref-a"), idempotency_key="order-1")
+        third = integration.transactions.initialize_transaction(_payload("ref-c"), idempotency_key="order-2")
+
+    assert len(requests) == 2
+    assert second == first
+    assert third != first
+
+
+def test_key_reused_for_a_different_request_conflicts(paystack, store_factory):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=_initialized())
+
+    with paystack(handler, idempotency=IdempotencyGuard(store_factory())) as integration:
+        integration.transactions.initialize_transaction(_payload("ref-a"), idempotency_key="order-1")
+        with pytest.raises(IdempotencyConflict) as info:
+            integration.transactions.initialize_transaction(_payload("ref-b"), idempotency_key="order-1")
+
+    assert len(requests) == 1
+    assert info.value.mismatch
+    assert info.value.error_code == ErrorCode.INVALID_REQUEST
+    assert not info.value.is_retryable()
+
+
+def test_in_flight_key_reused_for_a_different_request_conflicts(store_factory):
+    guard = IdempotencyGuard(store_factory(), wait_timeout=2, poll_interval=0.01)
+    release = threading.Event()
+    sender = threading.Thread(target=guard.run, args=("key", lambda: release.wait(5) and b"body", b"request-a"))
+    sender.start()
+    time.sleep(0.02)
+
+    try:
+        started = time.monotonic()
+        with pytest.raises(IdempotencyConflict) as info:
+            guard.run("key", lambda: b"duplicate", b"request-b")
+        # Raised at once rather than after waiting out the first request
+        assert time.monotonic() - started < 1
+    finally:
+        release.set()
+        sender.join()
+
+    assert info.value.mismatch
+    assert guard.run("key", lambda: b"duplicate", b"request-a") == b"body"
+
+
+def test_reference_dedupes_locally(paystack, store_factory):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=_initialized())
+
+    with paystack(handler, idempotency=IdempotencyGuard(store_factory())) as integration:
+        integration.transactions.initialize_transaction(_payload())
+        integration.transactions.initialize_transaction(_payload())
+        integration.transactions.initialize_transaction(_payload("ref-2"))
+
+    assert len(requests) == 2
+
+
+def test_failure_releases_the_key(paystack, store_factory):
+    responses = [httpx.Response(400, json={"message": "Invalid amount"}), httpx.Response(200, json=_initialized())]
+
+    with paystack(lambda request: responses.pop(0), idempotency=IdempotencyGuard(store_factory())) as integration:
+        with pytest.raises(httpx.HTTPStatusError):
+            integration.transactions.initialize_transaction(_payload(), idempotency_key="order-1")
+        result = integration.transactions.initialize_transaction(_payload(), idempotency_key="order-1")
+
+    assert result.data.reference == "ref-1"
+    assert responses == []
+
+
+def test_store_is_shared_between_integrations(paystack, store_factory):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=_initialized())
+
+    with paystack(handler, idempotency=IdempotencyGuard(store_factory())) as first, \
+            paystack(handler, idempotency=IdempotencyGuard(store_factory())) as second:
+        first.transactions.initialize_transaction(_payload(), idempotency_key="order-1")
+        second.transactions.initialize_transaction(_payload(), idempotency_key="order-1")
+
+    assert len(requests) == 1
+
+
+def test_in_flight_duplicate_times_out_with_conflict(store_factory):
+    guard = IdempotencyGuard(store_factory(), wait_timeout=0.05, poll_interval=0.01)
+    release = threading.Event()
+    sender = threading.Thread(target=guard.run, args=("key", lambda: release.wait(5) and b"body"))
+    sender.start()
+    time.sleep(0.02)
+
+    try:
+        with pytest.raises(IdempotencyConflict) as info:
+            guard.run("key", lambda: b"duplicate")
+    finally:
+        release.set()
+        sender.join()
+
+    assert info.value.error_code == ErrorCode.IN_FLIGHT
+    assert guard.run("key", lambda: b"duplicate") == b"body"
+
+
+def test_lease_is_renewed_while_a_slow_send_runs(store_factory):
+    # The send outlives several leases; a duplicate must still wait for it
+    # rather than claim the key and send a second time.
+    guard = IdempotencyGuard(store_factory(lease=0.06), wait_timeout=2, poll_interval=0.01)
+    sends = []
+
+    def send(body: bytes):
+        def slow() -> bytes:
+            sends.append(body)
+            time.sleep(0.25)
+            return body
+        return slow
+
+    results = []
+    first = threading.Thread(target=lambda: results.append(guard.run("key", send(b"first"))))
+    first.start()
+    time.sleep(0.02)
+    results.append(guard.run("key", send(b"second")))
+    first.join()
+
+    assert sends == [b"first"]
+    assert results == [b"first", b"first"]
+
+
+def test_async_lease_is_renewed_and_duplicates_replay(async_paystack, store_factory):
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.25)
+        return httpx.Response(200, json=_initialized())
+
+    guard = IdempotencyGuard(store_factory(lease=0.06), wait_timeout=2, poll_interval=0.01)
+
+    async def main():
+        async with async_paystack(handler, idempotency=guard) as integration:
+            return await asyncio.gather(*(
+                integration.transactions.initialize_transaction(_payload(), idempotency_key="order-1") for _ in range(3)
+            ))
+
+    results = asyncio.run(main())
+    assert len(requests) == 1
+    assert results[0] == results[1] == results[2]
+
+
+def test_async_guard_keeps_sqlite_off_the_event_loop(tmp_path):
+    threads = []
+
+    class RecordingStore(SQLiteIdempotencyStore):
+        def claim(self, key, fingerprint=None):
+            threads.append(threading.get_ident())
+            return super().claim(key, fingerprint)
+
+        def refresh(self, key):
+            threads.append(threading.get_ident())
+            super().refresh(key)
+
+        def complete(self, key, body, fingerprint=None):
+            threads.append(threading.get_ident())
+            super().complete(key, body, fingerprint)
+
+    store = RecordingStore(str(tmp_path / "idempotency.db"), lease=0.03)
+    guard = IdempotencyGuard(store)
+
+    async def send() -> bytes:
+        await asyncio.sleep(0.05)
+        return b"body"
+
+    async def main():
+        return threading.get_ident(), await guard.run_async("key", send, b"request")
+
+    try:
+        loop_thread, body = asyncio.run(main())
+    finally:
+        store.close()
+
+    assert body == b"body"
+    assert len(threads) >= 3
+    assert loop_thread not in threads
@@ -0,0 +1,207 @@
+import asyncio
+import httpx
+import pytest
+from benchmarks.server import transaction
+from transport.cache import ResponseCache
+from transport.instrumentation import (
+    GatewayCall,
+    Instrumentation,
+    InstrumentationHook,
+    MetricsHook,
+    MetricsRegistry,
+    SpanHook,
+    current_call
+)
+from transport.retry import RetryPolicy
+
+
+class _Recorder(InstrumentationHook):
+
+    def __init__(self):
+        self.started = []
+        self.calls = []
+
+    def on_start(self, call: GatewayCall) -> None:
+        self.started.append(call.name)
+
+    def on_end(self, call: GatewayCall) -> None:
+        self.calls.append(call.as_dict())
+
+
+class _Span():
+
+    def __init__(self, name: str, attributes: dict):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.exception = None
+        self.ended = False
+
+    def set_attributes(self, attributes: dict) -> None:
+        self.attributes.update(attributes)
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.exception = exception
+
+    def set_status(self, status) -> None:
+        pass
+
+    def end(self) -> None:
+        self.ended = True
+
+
+class _Tracer():
+
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name: str, attributes: dict = None, **options) -> _Span:
+        span = _Span(name, attributes or {})
+        self.spans.append(span)
+        return span
+
+
+def _verifying(failures: int = 0, status: str = "success"):
+    def handler(request: httpx.Request) -> httpx.Response:
+        handler.calls += 1
+        if handler.calls <= failures:
+            return httpx.Response(503, json={"message": "Service unavailable"})
+        return httpx.Response(200, json={"status": True, "message": "Verification successful", "data": transaction(1, status)})
+    handler.calls = 0
+    return handler
+
+
+def test_operation_is_one_call_with_its_retries(paystack):
+    recorder = _Recorder()
+    instrumentation = Instrumentation([recorder])
+    with paystack(_verifying(failures=1), retry_policy=RetryPolicy(base_delay=0), instrumentation=instrumentation) as integration:
+        integration.transactions.verify_transaction("ref-1")
+
+    assert recorder.started == ["paystack.verify_transaction"]
+    [call] = recorder.calls
+    assert call["method"] == "GET"
+    assert call["route"] == "/transaction/verify/{reference}"
+    assert call["status"] == 200
+    assert call["attempts"] == 2
+    assert call["error"] is None
+    assert call["response_bytes"] > 0
+    assert call["duration"] >= call["phases"]["validate"] >= 0
+    # MockTransport emits no httpcore trace events
+    assert set(call["phases"]) <= {"pool_wait", "validate"}
+    assert current_call() is None
+
+
+def test_failed_calls_and_standalone_requests(paystack):
+    recorder = _Recorder()
+    with paystack(_verifying(failures=2), retry_policy=RetryPolicy(base_delay=0, max_attempts=2),
+                  instrumentation=Instrumentation([recorder])) as integration:
+        with pytest.raises(httpx.HTTPStatusError):
+            integration.transactions.verify_transaction("ref-1")
+        integration._get_request("/transaction/verify/ref-1")
+
+    failed, standalone = recorder.calls
+    assert failed["error"] == "HTTPStatusError"
+    assert failed["status"] == 503
+    assert failed["attempts"] == 2
+    assert standalone["operation"] == "/transaction/verify/{reference}"
+    assert standalone["status"] == 200
+    assert "validate" not in standalone["phases"]
+
+
+def test_cache_outcome_is_attached(paystack):
+    recorder = _Recorder()
+    with paystack(_verifying(), cache=ResponseCache(), instrumentation=Instrumentation([recorder])) as integration:
+        integration.transactions.verify_transaction("ref-1")
+        integration.transactions.verify_transaction("ref-1")
+
+    miss, hit = recorder.calls
+    assert (miss["cache"], miss["attempts"]) == ("miss", 1)
+    assert (hit["cache"], hit["attempts"], hit["status"]) == ("hit", 0, None)
+
+
+def test_metrics_render_as_prometheus_text(paystack):
+    metrics = MetricsHook()
+    instrumentation = Instrumentation([metrics])
+    with paystack(_verifying(failures=1), retry_policy=RetryPolicy(base_delay=0), cache=ResponseCache(),
+                  instrumentation=instrumentation) as integration:
+        integration.transactions.verify_transaction("ref-1")
+        integration.transactions.verify_transaction("ref-1")
+
+    calls = metrics.registry.get("gateway_calls_total")
+    assert calls.value("paystack", "verify_transaction", 200) == 1
+    assert calls.value("paystack", "verify_transaction", "cached") == 1
+    assert metrics.registry.get("gateway_retries_total").value("paystack", "verify_transaction") == 1
+
+    text = metrics.registry.render()
+    assert "# TYPE gateway_call_duration_seconds histogram" in text
+    assert 'gateway_cache_total{provider="paystack",operation="verify_transaction",result="hit"} 1' in text
+    assert 'gateway_call_duration_seconds_bucket{provider="paystack",operation="verify_transaction",le="+Inf"} 2' in text
+    assert 'gateway_call_duration_seconds_count{provider="paystack",operation="verify_transaction"} 2' in text
+
+
+def test_registry_rejects_conflicting_metrics():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests", ("route",))
+    assert registry.counter("requests_total", "Requests", ("route",)) is counter
+    with pytest.raises(ValueError):
+        registry.histogram("requests_total", "Requests", ("route",))
+    with pytest.raises(ValueError):
+        registry.counter("requests_total", "Requests", ("method",))
+
+    histogram = registry.histogram("size", "Size", buckets=(10, 100))
+    for value in (5, 50, 500):
+        histogram.observe(value)
+    assert histogram.samples()[()]["buckets"] == [(10, 1), (100, 2), (float("inf"), 3)]
+
+
+def test_spans_and_failing_hooks(paystack):
+
+    class Broken(InstrumentationHook):
+        def on_start(self, call):
+            raise RuntimeError("broken hook")
+
+        def on_end(self, call):
+            raise RuntimeError("broken hook")
+
+    tracer = _Tracer()
+    instrumentation = Instrumentation([Broken(), SpanHook(tracer)])
+    with paystack(_verifying(), instrumentation=instrumentation) as integration:
+        integration.transactions.verify_transaction("ref-1")
+
+    [span] = tracer.spans
+    assert span.name == "paystack.verify_transaction"
+    assert span.ended
+    assert span.exception is None
+    assert span.attributes["gateway.provider"] == "paystack"
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.attributes["url.template"] == "/transaction/verify/{reference}"
+
+
+def test_without_hooks_nothing_is_recorded(paystack):
+    instrumentation = Instrumentation()
+    assert not instrumentation.enabled
+    with paystack(_verifying(), instrumentation=instrumentation) as integration:
+        integration.transactions.verify_transaction("ref-1")
+
+    recorder = instrumentation.add_hook(_Recorder())
+    assert instrumentation.enabled
+    with paystack(_verifying(), instrumentation=instrumentation) as integration:
+        integration.transactions.verify_transaction("ref-1")
+    assert len(recorder.calls) == 1
+
+
+def test_async_calls_are_kept_apart(async_paystack):
+    recorder = _Recorder()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        reference = request.url.path.rsplit("/", 1)[1]
+        return httpx.Response(200, json={"status": True, "message": "Verification successful",
+                                         "data": {**transaction(1), "reference": reference}})
+
+    async def main():
+        async with async_paystack(handler, instrumentation=Instrumentation([recorder])) as integration:
+            await asyncio.gather(*(integration.transactions.verify_transaction(f"ref-{i}") for i in range(5)))
+
+    asyncio.run(main())
+    assert len(recorder.calls) == 5
+    assert all(call["attempts"] == 1 and call["status"] == 200 for call in recorder.calls)
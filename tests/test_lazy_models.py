@@ -0,0 +1,69 @@
+import httpx
+import pytest
+from benchmarks.server import transaction
+from datetime import datetime
+from paystack.models import ListTransactionsDataModel, TransactionsVerifyResponseModel
+from paystack.models.lazy import LazyModel, lazy_model, projected_model
+from pydantic import BaseModel, ValidationError
+
+
+def _verified(data: dict):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"status": True, "message": "Verification successful", "data": data})
+    return handler
+
+
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_lazy_matches_eager(paystack, fast_json):
+    with paystack(_verified(transaction(1)), fast_json=fast_json) as integration:
+        eager = integration.transactions.verify_transaction("ref-1")
+    with paystack(_verified(transaction(1)), fast_json=fast_json, lazy=True) as integration:
+        lazy = integration.transactions.verify_transaction("ref-1")
+
+    assert isinstance(lazy, TransactionsVerifyResponseModel)
+    assert isinstance(lazy.data, LazyModel)
+    assert lazy.data.to_model() == eager.data
+    assert lazy.data.customer == eager.data.customer
+    assert lazy.data.paid_at == eager.data.paid_at
+
+
+def test_deferred_fields_validate_on_first_read():
+    model = lazy_model(ListTransactionsDataModel)
+    item = model.model_validate(transaction(1))
+
+    assert isinstance(item.__dict__["paid_at"], str)
+    assert isinstance(item.paid_at, datetime)
+    assert isinstance(item.__dict__["paid_at"], datetime)
+    assert isinstance(item.customer, BaseModel)
+    assert item.customer.email == "customer1@example.com"
+
+
+def test_bad_nested_value_fails_only_when_read():
+    item = lazy_model(ListTransactionsDataModel).model_validate({**transaction(1), "paid_at": "not a date"})
+    assert item.amount == transaction(1)["amount"]
+    with pytest.raises(ValidationError):
+        item.paid_at
+
+
+def test_scalars_are_still_validated_up_front():
+    with pytest.raises(ValidationError):
+        lazy_model(ListTransactionsDataModel).model_validate({**transaction(1), "amount": "lots"})
+
+
+def test_projection_keeps_only_the_requested_fields():
+    projection = projected_model(ListTransactionsDataModel, ["reference", "amount"])
+    item = projection.model_validate(transaction(1))
+    assert item.model_dump() == {"amount": transaction(1)["amount"], "reference": transaction(1)["reference"]}
+    assert projected_model(ListTransactionsDataModel, ["amount", "reference"]) is projection
+
+    with pytest.raises(ValueError):
+        projected_model(ListTransactionsDataModel, ["amount", "nope"])
+
+
+def test_fetch_with_fields(paystack):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"status": True, "message": "Transaction retrieved", "data": transaction(2)})
+
+    with paystack(handler) as integration:
+        result = integration.transactions.fetch_transaction(4000000002, fields=["id", "status"])
+    assert result.data.model_dump() == {"id": 4000000002, "status": "success"}
@@ -0,0 +1,97 @@
+import httpx
+import logging
+import pytest
+from benchmarks.server import transaction
+from logger import logger as logging_setup
+from logger.logger import DuplicateFilter, SamplingFilter, apply_default_logging
+from paystack.errors.errors import TransactionError
+
+
+def _record(name: str = "paystack.transactions", level: int = logging.INFO, msg: str = "done %s", args=(1,), lineno: int = 1):
+    return logging.LogRecord(name, level, __file__, lineno, msg, args, None)
+
+
+def test_sampling_keeps_everything_above_its_level(monkeypatch):
+    sampler = SamplingFilter(rate=0.0)
+    assert not sampler.filter(_record())
+    assert not sampler.filter(_record(level=logging.DEBUG))
+    assert sampler.filter(_record(level=logging.WARNING))
+
+    monkeypatch.setattr(logging_setup.random, "random", lambda: 0.3)
+    assert SamplingFilter(rate=0.5).filter(_record())
+    assert not SamplingFilter(rate=0.2).filter(_record())
+
+
+def test_sampling_rates_match_the_longest_prefix():
+    sampler = SamplingFilter(rate=1.0, rates={"paystack": 0.0, "paystack.transactions": 1.0})
+    assert sampler.filter(_record("paystack.transactions.handler"))
+    assert not sampler.filter(_record("paystack.main"))
+    assert not sampler.filter(_record("paystack"))
+    # "paystackx" is not under "paystack"
+    assert sampler.filter(_record("paystackx"))
+
+
+def test_sampling_decides_once_per_record(monkeypatch):
+    draws = iter([0.1, 0.9])
+    monkeypatch.setattr(logging_setup.random, "random", lambda: next(draws))
+    sampler = SamplingFilter(rate=0.5)
+    record = _record()
+    # A second handler sees the same decision, not a fresh draw
+    assert sampler.filter(record) and sampler.filter(record)
+
+
+def test_duplicates_are_suppressed_and_counted(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(logging_setup.time, "monotonic", lambda: now[0])
+    dedup = DuplicateFilter(window=10, burst=2)
+
+    kept = [dedup.filter(_record(level=logging.ERROR, msg="declined %s", args=(i,))) for i in range(5)]
+    assert kept == [True, True, False, False, False]
+    # Another call site, or a record below the level, is not affected
+    assert dedup.filter(_record(level=logging.ERROR, msg="declined %s", args=(9,), lineno=2))
+    assert dedup.filter(_record(level=logging.INFO, msg="declined %s", args=(9,)))
+
+    now[0] += 10
+    record = _record(level=logging.ERROR, msg="declined %s", args=(5,))
+    assert dedup.filter(record)
+    assert record.getMessage() == "declined 5 (3 similar suppressed)"
+    assert record.suppressed == 3
+    # Shared by several handlers, the record is only counted once
+    assert dedup.filter(record)
+    assert dedup.filter(_record(level=logging.ERROR, msg="declined %s", args=(6,)))
+
+
+def test_duplicate_keys_are_bounded(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(logging_setup.time, "monotonic", lambda: now[0])
+    dedup = DuplicateFilter(window=1, max_keys=3)
+    for line in range(3):
+        dedup.filter(_record(level=logging.WARNING, lineno=line))
+
+    now[0] = 5
+    assert dedup.filter(_record(level=logging.WARNING, lineno=10))
+    assert len(dedup._DuplicateFilter__seen) == 1
+
+
+@pytest.mark.parametrize("use_queue", [False, True])
+def test_configured_filters_apply_to_gateway_logs(paystack, tmp_path, restore_loggers, use_queue):
+    log_file = tmp_path / "payments.log"
+    listener = apply_default_logging(log_file=str(log_file), use_queue=use_queue, flush_interval=0.01,
+                                     sample_rate=0.0, dedup_window=60)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "missing" in request.url.path:
+            return httpx.Response(200, json={"status": False, "message": "Transaction reference not found"})
+        return httpx.Response(200, json={"status": True, "message": "Verification successful", "data": transaction(1)})
+
+    with paystack(handler) as integration:
+        integration.transactions.verify_transaction("ref-1")
+        for i in range(3):
+            with pytest.raises(TransactionError):
+                integration.transactions.verify_transaction(f"missing-{i}")
+    if listener is not None:
+        listener.stop()
+
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 1
+    assert "Transaction Verification failed: Transaction reference not found" in lines[0]
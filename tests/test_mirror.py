@@ -0,0 +1,153 @@
+import asyncio
+import httpx
+import pytest
+import threading
+from benchmarks.server import BASE_TIME, transaction
+from datetime import datetime, timedelta
+from paystack.mirror import TransactionMirror
+from paystack.models import CompactTransaction, ListTransactionsDataModel
+
+
+def _ledger(count: int):
+    return [transaction(i, "success" if i % 3 else "failed") for i in range(count)]
+
+
+def _listing(ledger: list, requests: list):
+    """
+    Serve `ledger` from `/transaction` with perPage/page pagination and the
+    `from` filter, recording the params of every request.
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        requests.append(params)
+        items = ledger
+        if "from" in params:
+            since = datetime.fromisoformat(params["from"])
+            items = [item for item in items if datetime.fromisoformat(item["created_at"]) >= since]
+
+        per_page, page = int(params.get("perPage", 50)), int(params.get("page", 1))
+        page_count = max(1, -(-len(items) // per_page))
+        return httpx.Response(200, json={
+            "status": True,
+            "message": "Transactions retrieved",
+            "data": items[(page - 1) * per_page:page * per_page],
+            "meta": {"total": len(items), "perPage": per_page, "page": page, "pageCount": page_count}
+        })
+    return handler
+
+
+@pytest.fixture
+def synced(paystack, tmp_path):
+    ledger, requests = _ledger(25), []
+    integration = paystack(_listing(ledger, requests))
+    mirror = TransactionMirror(integration.transactions, str(tmp_path / "mirror.db"), per_page=10, overlap=120, batch_size=7)
+    assert mirror.staleness() is None
+    assert mirror.sync() == 25
+    yield mirror, ledger, requests
+    mirror.close()
+    integration.close()
+
+
+def test_full_sync_then_incremental(synced):
+    mirror, ledger, requests = synced
+    assert [params.get("page") for params in requests] == [None, "2", "3"]
+    assert mirror.count() == 25
+    assert mirror.staleness() < 5
+
+    requests.clear()
+    ledger[24] = {**ledger[24], "status": "reversed"}
+    ledger.append(transaction(25))
+    assert mirror.sync() == 4
+
+    newest = BASE_TIME + timedelta(minutes=24)
+    assert datetime.fromisoformat(requests[0]["from"]) == newest - timedelta(seconds=120)
+    assert "to" in requests[0]
+    assert mirror.count() == 26
+    assert mirror.get(transaction(24)["reference"]).status == "reversed"
+
+
+def test_queries_run_locally(synced):
+    mirror, ledger, requests = synced
+    before = len(requests)
+
+    newest = mirror.list(limit=3)
+    assert [item.id for item in newest] == [transaction(i)["id"] for i in (24, 23, 22)]
+    assert isinstance(newest[0], ListTransactionsDataModel)
+
+    failed = mirror.list(limit=100, status="failed")
+    assert sorted(item.id for item in failed) == sorted(transaction(i)["id"] for i in range(0, 25, 3))
+    assert mirror.count(amount_min=50010, amount_max=50014) == 5
+    assert mirror.count(from_=BASE_TIME + timedelta(minutes=20)) == 5
+    assert mirror.count(customer=100003) == 1
+    assert mirror.get("missing") is None
+
+    totals = mirror.totals()
+    successes = [item for item in ledger if item["status"] == "success"]
+    assert totals.total_transactions == len(successes)
+    assert totals.total_volume == sum(item["amount"] for item in successes)
+    assert len(requests) == before
+
+
+@pytest.mark.parametrize("keep_raw", [False, True])
+def test_iter_pages_through_everything_in_order(synced, keep_raw):
+    mirror, _, _ = synced
+    items = list(mirror.iter(batch_size=4, compact=True, keep_raw=keep_raw))
+
+    assert [item.id for item in items] == [transaction(i)["id"] for i in range(25)]
+    assert isinstance(items[0], CompactTransaction)
+    assert (items[0].raw is not None) == keep_raw
+    if keep_raw:
+        assert items[0].to_model() == mirror.get(transaction(0)["reference"])
+    assert [item.id for item in mirror.iter(batch_size=4, status="failed")] == [transaction(i)["id"] for i in range(0, 25, 3)]
+
+
+def test_async_sync(async_paystack, tmp_path):
+    ledger, requests = _ledger(12), []
+    sync_handler = _listing(ledger, requests)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return sync_handler(request)
+
+    async def main():
+        async with async_paystack(handler) as integration:
+            mirror = TransactionMirror(integration.transactions, str(tmp_path / "mirror.db"), per_page=5)
+            try:
+                return await mirror.sync_async(), mirror.count()
+            finally:
+                mirror.close()
+
+    assert asyncio.run(main()) == (12, 12)
+    assert len(requests) == 3
+
+
+def test_async_sync_writes_off_the_loop(async_paystack, tmp_path, monkeypatch):
+    threads = []
+    upsert, finish = TransactionMirror._upsert, TransactionMirror._finish_sync
+
+    def recording_upsert(self, items):
+        threads.append(threading.get_ident())
+        return upsert(self, items)
+
+    def recording_finish(self, started, count):
+        threads.append(threading.get_ident())
+        return finish(self, started, count)
+
+    monkeypatch.setattr(TransactionMirror, "_upsert", recording_upsert)
+    monkeypatch.setattr(TransactionMirror, "_finish_sync", recording_finish)
+    sync_handler = _listing(_ledger(12), [])
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return sync_handler(request)
+
+    async def main():
+        async with async_paystack(handler) as integration:
+            mirror = TransactionMirror(integration.transactions, str(tmp_path / "mirror.db"), per_page=5, batch_size=5)
+            try:
+                return threading.get_ident(), await mirror.sync_async()
+            finally:
+                mirror.close()
+
+    loop_thread, count = asyncio.run(main())
+    assert count == 12
+    assert len(threads) == 4
+    assert loop_thread not in threads
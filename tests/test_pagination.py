@@ -0,0 +1,123 @@
+import asyncio
+import httpx
+import pytest
+from benchmarks.server import transaction
+from paystack.errors.errors import TransactionError
+
+
+def _paged(pages: int, per_page: int = 3, requests: list = None):
+    """
+    Serve `pages` pages of transactions with page/pageCount meta.
+    """
+    def body(request: httpx.Request) -> dict:
+        if requests is not None:
+            requests.append(dict(request.url.params))
+        page = int(request.url.params.get("page", 1))
+        start = (page - 1) * per_page
+        return {
+            "status": True,
+            "message": "Transactions retrieved",
+            "data": [transaction(i) for i in range(start, start + per_page)],
+            "meta": {"total": pages * per_page, "perPage": per_page, "page": page, "pageCount": pages}
+        }
+    return body
+
+
+def test_follows_page_count(paystack):
+    seen = []
+    body = _paged(3, requests=seen)
+
+    with paystack(lambda request: httpx.Response(200, json=body(request))) as integration:
+        ids = [t.id for t in integration.transactions.iter_transactions({"perPage": 3, "status": "success"})]
+
+    assert ids == [transaction(i)["id"] for i in range(9)]
+    assert seen == [
+        {"perPage": "3", "status": "success"},
+        {"perPage": "3", "status": "success", "page": "2"},
+        {"perPage": "3", "status": "success", "page": "3"}
+    ]
+
+
+def test_follows_cursor(paystack):
+    cursors = {None: ("c1", 0), "c1": ("c2", 2), "c2": (None, 4)}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        following, start = cursors[request.url.params.get("next")]
+        return httpx.Response(200, json={
+            "status": True,
+            "message": "Transactions retrieved",
+            "data": [transaction(start), transaction(start + 1)],
+            "meta": {"next": following, "previous": None, "perPage": 2}
+        })
+
+    with paystack(handler) as integration:
+        references = [t.reference for t in integration.transactions.iter_transactions()]
+
+    assert references == [transaction(i)["reference"] for i in range(6)]
+
+
+def test_prefetch_yields_the_same_items(paystack):
+    body = _paged(4)
+    with paystack(lambda request: httpx.Response(200, json=body(request))) as integration:
+        plain = [t.id for t in integration.transactions.iter_transactions()]
+        prefetched = [t.id for t in integration.transactions.iter_transactions(prefetch=True)]
+    assert plain == prefetched
+    assert len(plain) == 12
+
+
+def test_empty_page_stops(paystack):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={
+            "status": True,
+            "message": "Transactions retrieved",
+            "data": [],
+            "meta": {"page": 1, "pageCount": 5}
+        })
+
+    with paystack(handler) as integration:
+        assert list(integration.transactions.iter_transactions()) == []
+    assert len(requests) == 1
+
+
+def test_failed_page_raises_after_earlier_items(paystack):
+    body = _paged(3)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("page") == "2":
+            return httpx.Response(200, json={"status": False, "message": "Invalid key"})
+        return httpx.Response(200, json=body(request))
+
+    with paystack(handler) as integration:
+        iterator = integration.transactions.iter_transactions()
+        first = [next(iterator) for _ in range(3)]
+        with pytest.raises(TransactionError) as info:
+            next(iterator)
+
+    assert [t.id for t in first] == [transaction(i)["id"] for i in range(3)]
+    assert info.value.context["message"] == "Invalid key"
+
+
+def test_fields_projection(paystack):
+    body = _paged(1)
+    with paystack(lambda request: httpx.Response(200, json=body(request))) as integration:
+        items = list(integration.transactions.iter_transactions(fields=["id", "amount"]))
+
+    assert [(t.id, t.amount) for t in items] == [(transaction(i)["id"], transaction(i)["amount"]) for i in range(3)]
+    assert not hasattr(items[0], "log")
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_async_iter_transactions(async_paystack, prefetch):
+    body = _paged(3)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=body(request))
+
+    async def main():
+        async with async_paystack(handler) as integration:
+            return [t.id async for t in integration.transactions.iter_transactions(prefetch=prefetch)]
+
+    assert asyncio.run(main()) == [transaction(i)["id"] for i in range(9)]
@@ -0,0 +1,101 @@
+import asyncio
+import httpx
+import pytest
+from alatpay.exceptions import AlatException
+from alatpay.poller import TransferPoller
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+
+FAST = {"rate": 1000, "initial_interval": 0.01, "max_interval": 0.02, "backoff": 1.0, "batch_window": 0.0}
+
+
+def _transfers(statuses: dict, polls: Counter):
+    """
+    Answer status checks from `statuses`: a transactionId maps to the
+    statuses returned on successive polls, the last one repeating.
+    """
+    async def handler(request: httpx.Request) -> httpx.Response:
+        transaction_id = request.url.path.rsplit("/", 1)[-1]
+        sequence = statuses[transaction_id]
+        status = sequence[min(polls[transaction_id], len(sequence) - 1)]
+        polls[transaction_id] += 1
+        if status == 500:
+            return httpx.Response(500, json={"message": "Internal error"})
+        return httpx.Response(200, json={"status": True, "message": "Success", "data": {"transactionId": transaction_id, "status": status}})
+    return handler
+
+
+def test_resolves_when_the_transfer_completes(async_alatpay):
+    polls = Counter()
+    seen = []
+
+    async def main():
+        handler = _transfers({"txn-1": ["pending", "pending", "completed"], "txn-2": [500, "failed"]}, polls)
+        async with async_alatpay(handler) as integration, TransferPoller(integration.bank_transfer, **FAST) as poller:
+            first = poller.watch("txn-1", callback=lambda transaction_id, outcome: seen.append(transaction_id))
+            second = poller.watch("txn-2")
+            assert poller.watch("txn-1") is first
+            results = await asyncio.wait_for(asyncio.gather(first, second), 5)
+            return results, poller.pending
+
+    (first, second), pending = asyncio.run(main())
+    assert first["data"]["status"] == "completed"
+    assert second["data"]["status"] == "failed"
+    assert polls == Counter({"txn-1": 3, "txn-2": 2})
+    assert seen == ["txn-1"]
+    assert pending == 0
+
+
+def test_expired_account_fails_with_408(async_alatpay):
+    polls = Counter()
+
+    async def main():
+        handler = _transfers({"txn-1": ["pending"]}, polls)
+        async with async_alatpay(handler) as integration, TransferPoller(integration.bank_transfer, **FAST) as poller:
+            expired = (datetime.now(timezone.utc) - timedelta(seconds=1)).isoformat()
+            await asyncio.wait_for(poller.watch("txn-1", expired_at=expired), 5)
+
+    with pytest.raises(AlatException) as info:
+        asyncio.run(main())
+    assert info.value.code == 408
+    assert info.value.context == {"transactionId": "txn-1", "status": "pending"}
+    assert polls["txn-1"] == 1
+
+
+def test_cancelled_watch_is_forgotten(async_alatpay):
+    polls = Counter()
+
+    async def main():
+        handler = _transfers({"txn-1": ["pending"], "txn-2": ["pending", "completed"]}, polls)
+        async with async_alatpay(handler) as integration, TransferPoller(integration.bank_transfer, **FAST) as poller:
+            abandoned = poller.watch("txn-1")
+            kept = poller.watch("txn-2")
+            abandoned.cancel()
+            await asyncio.sleep(0)
+            assert poller.pending == 1
+            await asyncio.wait_for(kept, 5)
+
+            # Watching the id again starts a fresh watch instead of handing
+            # back the cancelled future
+            again = poller.watch("txn-1")
+            assert not again.cancelled()
+            return poller.pending
+
+    assert asyncio.run(main()) == 1
+    assert polls["txn-1"] == 0
+
+
+def test_stop_cancels_unfinished_watches(async_alatpay):
+    async def main():
+        handler = _transfers({"txn-1": ["pending"]}, Counter())
+        async with async_alatpay(handler) as integration:
+            poller = TransferPoller(integration.bank_transfer, **FAST)
+            future = poller.watch("txn-1")
+            await asyncio.sleep(0.05)
+            await poller.stop()
+            return future, poller.pending
+
+    future, pending = asyncio.run(main())
+    assert future.cancelled()
+    assert pending == 0
@@ -0,0 +1,110 @@
+import httpx
+import io
+import logging
+import os
+import pytest
+import queue
+from benchmarks.server import transaction
+from logger import logger as logging_setup
+from logger.logger import BatchingQueueListener, BoundedQueueHandler, apply_default_logging
+
+
+def _record(msg: str, *args) -> logging.LogRecord:
+    return logging.LogRecord("paystack.test", logging.INFO, __file__, 1, msg, args, None)
+
+
+def _queued(handler: BoundedQueueHandler) -> list:
+    records = []
+    while not handler.queue.empty():
+        record = handler.queue.get_nowait()
+        records.append(record if record is None else record.msg)
+    return records
+
+
+class _CountingStream(logging.StreamHandler):
+
+    def __init__(self):
+        super().__init__(io.StringIO())
+        self.flushes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+
+def test_overflow_policies():
+    for overflow, kept in (("drop_new", ["0", "1"]), ("drop_old", ["2", "3"]), ("block", ["0", "1"])):
+        handler = BoundedQueueHandler(queue.Queue(maxsize=2), overflow=overflow, block_timeout=0.01)
+        for i in range(4):
+            handler.handle(_record(str(i)))
+        assert _queued(handler) == kept, overflow
+        assert handler.take_dropped() == 2
+        assert handler.dropped == 0
+
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(queue.Queue(), overflow="drop_random")
+
+
+def test_drop_old_keeps_the_stop_sentinel():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1), overflow="drop_old")
+    handler.queue.put_nowait(None)
+    handler.handle(_record("late"))
+    assert _queued(handler) == [None]
+    assert handler.dropped == 1
+
+
+def test_message_is_fixed_when_queued():
+    handler = BoundedQueueHandler(queue.Queue())
+    items = ["a"]
+    handler.handle(_record("items: %s", items))
+    items.append("b")
+    assert _queued(handler) == ["items: ['a']"]
+
+
+def test_listener_writes_in_batches_and_reports_drops():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=250))
+    target = _CountingStream()
+    listener = BatchingQueueListener(handler, target, batch_size=100, flush_interval=0.01)
+    for i in range(260):
+        handler.handle(_record(f"line {i}"))
+
+    listener.start()
+    listener.stop()
+    lines = target.stream.getvalue().splitlines()
+    # Drops are reported with the batch being written when they are noticed
+    assert lines.pop(100) == "10 log records dropped, the logging queue was full"
+    assert lines == [f"line {i}" for i in range(250)]
+    assert target.flushes == 3
+    # Stopping twice is harmless
+    listener.stop()
+
+
+def test_queued_logging_rotates_the_file(paystack, tmp_path, restore_loggers, capsys):
+    log_file = tmp_path / "payments.log"
+    listener = apply_default_logging(log_file=str(log_file), max_bytes=2000, backup_count=3,
+                                     use_queue=True, batch_size=8, flush_interval=0.01)
+    assert listener is logging_setup._listener
+    assert isinstance(logging.getLogger("paystack").handlers[0], BoundedQueueHandler)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"status": True, "message": "Verification successful", "data": transaction(1)})
+
+    with paystack(handler) as integration:
+        for i in range(80):
+            integration.transactions.verify_transaction(f"ref-{i}")
+    listener.stop()
+
+    rotated = sorted(path.name for path in tmp_path.iterdir())
+    assert rotated == ["payments.log", "payments.log.1", "payments.log.2", "payments.log.3"]
+    assert all(os.path.getsize(tmp_path / name) <= 2000 for name in rotated)
+    assert "Transaction Verification success" in log_file.read_text()
+    assert "Transaction Verification success" in capsys.readouterr().err
+
+
+def test_reconfiguring_stops_the_previous_listener(restore_loggers):
+    first = apply_default_logging(use_queue=True, flush_interval=0.01)
+    second = apply_default_logging(use_queue=True, flush_interval=0.01)
+    assert first._thread is None
+    assert second._thread is not None
+    assert apply_default_logging() is None
+    assert second._thread is None
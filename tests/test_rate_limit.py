@@ -0,0 +1,102 @@
+import asyncio
+import httpx
+import pytest
+import threading
+import time
+from email.utils import formatdate
+from transport.rate_limit import FileTokenBucket, RateLimiter, TokenBucket, parse_retry_after
+
+
+def test_bucket_allows_a_burst_then_spaces_calls():
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_pause_holds_every_caller():
+    bucket = TokenBucket(rate=100)
+    bucket.pause(2)
+    assert bucket.reserve() == pytest.approx(2, abs=0.05)
+    assert bucket.reserve() == pytest.approx(2, abs=0.05)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("3", 3.0),
+    ("-1", 0.0),
+    ("soon", None),
+    (None, None),
+    ("", None)
+])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after(formatdate(time.time() + 30, usegmt=True)) == pytest.approx(30, abs=2)
+
+
+def test_path_limit_applies_to_its_route_only():
+    limiter = RateLimiter(rate=1000, path_limits={"/transaction/verify/{reference}": (10, 1)})
+    assert limiter.reserve("/transaction/verify/{reference}") == 0
+    assert limiter.reserve("/transaction/verify/{reference}") == pytest.approx(0.1, abs=0.01)
+    assert limiter.reserve("/transaction") == 0
+
+
+def test_observe_pauses_on_retry_after_and_reset_headers():
+    limiter = RateLimiter(rate=1000)
+    limiter.observe("/transaction", httpx.Response(200))
+    assert limiter.reserve("/transaction") == 0
+
+    limiter.observe("/transaction", httpx.Response(429, headers={"Retry-After": "1"}))
+    assert limiter.reserve("/transaction") == pytest.approx(1, abs=0.05)
+
+    limiter = RateLimiter(rate=1000)
+    limiter.observe("/transaction", httpx.Response(200, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"}))
+    assert limiter.reserve("/transaction") == pytest.approx(2, abs=0.05)
+
+
+def test_file_buckets_share_one_budget(tmp_path):
+    first = RateLimiter(rate=10, capacity=1, name="paystack", state_dir=str(tmp_path))
+    second = RateLimiter(rate=10, capacity=1, name="paystack", state_dir=str(tmp_path))
+    other = RateLimiter(rate=10, capacity=1, name="alatpay", state_dir=str(tmp_path))
+
+    assert first.reserve("/transaction") == 0
+    assert second.reserve("/transaction") == pytest.approx(0.1, abs=0.02)
+    assert other.reserve("/transaction") == 0
+
+    with pytest.raises(ValueError):
+        RateLimiter(rate=10, state_dir=str(tmp_path))
+
+
+def test_async_acquire_reserves_file_buckets_off_the_loop(tmp_path, monkeypatch):
+    threads = []
+    reserve = FileTokenBucket.reserve
+
+    def recording(self, tokens=1.0):
+        threads.append(threading.get_ident())
+        return reserve(self, tokens)
+
+    monkeypatch.setattr(FileTokenBucket, "reserve", recording)
+    limiter = RateLimiter(rate=100, name="paystack", state_dir=str(tmp_path))
+
+    async def main():
+        await limiter.acquire_async("/transaction")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+    assert threads and loop_thread not in threads
+
+
+def test_integration_waits_for_tokens(paystack):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"status": True, "message": "Transaction totals", "data": {}})
+
+    with paystack(handler, rate_limiter=RateLimiter(rate=20, capacity=1)) as integration:
+        started = time.monotonic()
+        for _ in range(3):
+            integration._get_request("/transaction/totals")
+        elapsed = time.monotonic() - started
+
+    assert elapsed >= 0.09
@@ -0,0 +1,130 @@
+import httpx
+import os
+import pytest
+from benchmarks.server import BASE_TIME, transaction
+from datetime import timedelta
+from reconciliation.engine import CATEGORIES, Reconciler
+from reconciliation.records import from_alatpay, from_paystack, from_rows
+
+
+def _provider(count: int = 10):
+    return [transaction(i) for i in range(count)]
+
+
+def _ledger_rows(provider: list):
+    """
+    Ledger rows mirroring `provider`, with one of each kind of discrepancy:
+    0-5 match, 6 differs in amount, 7 is booked twice, 8 only has a
+    reference on the provider side (fuzzy matched by amount, time and
+    email), 9 is missing from the ledger, plus one row Paystack never saw.
+    """
+    rows = [
+        {"reference": item["reference"], "amount": item["amount"], "currency": "NGN", "created_at": item["created_at"], "email": item["customer"]["email"]}
+        for item in provider[:9]
+    ]
+    rows[6]["amount"] += 100
+    rows.append(dict(rows[7]))
+    rows[8] = {**rows[8], "reference": "", "created_at": (BASE_TIME + timedelta(minutes=8, seconds=30)).isoformat()}
+    rows.append({"reference": "ledger-only", "amount": 123, "currency": "NGN", "created_at": BASE_TIME.isoformat(), "email": ""})
+    return rows
+
+
+EXPECTED = {
+    "matched": 6,
+    "amount_mismatch": 1,
+    "duplicate": 1,
+    "fuzzy_matched": 1,
+    "missing_in_ledger": 1,
+    "missing_in_provider": 1
+}
+
+
+@pytest.fixture
+def provider_records(paystack):
+    provider = _provider()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={
+            "status": True,
+            "message": "Transactions retrieved",
+            "data": provider,
+            "meta": {"total": len(provider), "perPage": 50, "page": 1, "pageCount": 1}
+        })
+
+    with paystack(handler) as integration:
+        return list(from_paystack(integration.transactions.iter_transactions())), provider
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_every_category(provider_records, workers):
+    records, provider = provider_records
+    with Reconciler(partitions=4, workers=workers).run(records, from_rows(_ledger_rows(provider))) as result:
+        assert result.counts == EXPECTED
+        assert [entry["key"] for entry in result.iter("amount_mismatch")] == [provider[6]["reference"]]
+        assert [entry["key"] for entry in result.iter("missing_in_provider")] == ["ledger-only"]
+        assert [entry["key"] for entry in result.iter("missing_in_ledger")] == [provider[9]["reference"]]
+
+        duplicate = next(result.iter("duplicate"))
+        assert duplicate["key"] == provider[7]["reference"]
+        assert len(duplicate["ledger"]) == 2
+
+        fuzzy = next(result.iter("fuzzy_matched"))
+        assert fuzzy["provider"]["key"] == provider[8]["reference"]
+        assert fuzzy["ledger"]["key"] == ""
+
+        with pytest.raises(ValueError):
+            list(result.iter("unknown"))
+        workdir = result.workdir
+
+    assert not os.path.exists(workdir)
+
+
+def test_tolerance_and_window(provider_records):
+    records, provider = provider_records
+    rows = _ledger_rows(provider)
+
+    with Reconciler(partitions=2, workers=0, amount_tolerance=100).run(records, from_rows(rows)) as result:
+        assert result.counts["matched"] == 7
+        assert result.counts["amount_mismatch"] == 0
+
+    with Reconciler(partitions=2, workers=0, time_window=10).run(records, from_rows(rows)) as result:
+        assert result.counts["fuzzy_matched"] == 0
+        assert result.counts["missing_in_ledger"] == 2
+        assert result.counts["missing_in_provider"] == 2
+
+
+def test_conflicting_emails_never_fuzzy_match(provider_records):
+    records, provider = provider_records
+    rows = _ledger_rows(provider)
+    rows[8]["email"] = "someone.else@example.com"
+    with Reconciler(partitions=2, workers=0).run(records, from_rows(rows)) as result:
+        assert result.counts["fuzzy_matched"] == 0
+
+
+def test_reused_workdir_keeps_runs_apart(provider_records, tmp_path):
+    records, provider = provider_records
+    reconciler = Reconciler(workdir=str(tmp_path), partitions=4, workers=0)
+
+    first = reconciler.run(records, from_rows(_ledger_rows(provider)))
+    second = reconciler.run(records, from_rows(_ledger_rows(provider)))
+    first.close()
+    second.close()
+
+    assert first.workdir != second.workdir
+    assert first.counts == second.counts == EXPECTED
+    assert os.path.isdir(first.workdir) and os.path.isdir(second.workdir)
+    assert sum(1 for _ in second.iter("matched")) == 6
+
+
+def test_alatpay_amounts_are_converted_to_subunits():
+    status = {"status": True, "data": {"orderId": "order-1", "transactionId": "txn-1", "amount": 50.5, "currency": "NGN",
+                                       "createdAt": "2024-01-01T00:00:00Z", "customer": {"email": "Ada@Example.com"}}}
+    record = next(from_alatpay([status]))
+    assert record.key == "order-1"
+    assert record.amount == 5050
+    assert record.email == "ada@example.com"
+    assert record.timestamp == BASE_TIME.timestamp()
+
+    with Reconciler(partitions=2, workers=0).run([record], from_rows([{"reference": "order-1", "amount": 5050, "currency": "NGN"}])) as result:
+        assert result.counts["matched"] == 1
+        assert set(result.counts) == set(CATEGORIES)
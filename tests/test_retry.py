@@ -0,0 +1,156 @@
+import asyncio
+import httpx
+import pytest
+import time
+from paystack.errors.errors import TransactionError
+from paystack.models import TransactionsInitPayloadModel
+from transport.idempotency import IdempotencyGuard
+from transport.retry import RetryPolicy
+
+
+FAST = RetryPolicy(base_delay=0, max_attempts=3)
+
+_TOTALS = {
+    "status": True,
+    "message": "Transaction totals",
+    "data": {
+        "total_transactions": 1,
+        "total_volume": 5000,
+        "total_volume_by_currency": [{"currency": "NGN", "amount": 5000}],
+        "pending_transfers": 0,
+        "pending_transfers_by_currency": [{"currency": "NGN", "amount": 0}]
+    }
+}
+_INITIALIZED = {
+    "status": True,
+    "message": "Authorization URL created",
+    "data": {"authorization_url": "https://checkout.paystack.com/x", "access_code": "x", "reference": "ref-1"}
+}
+
+
+def _failing(times: int, body: dict, status: int = 503, requests: list = None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        handler.calls += 1
+        if handler.calls <= times:
+            return httpx.Response(status, json={"message": "Service unavailable"})
+        return httpx.Response(200, json=body)
+    handler.calls = 0
+    return handler
+
+
+def _payload() -> TransactionsInitPayloadModel:
+    return TransactionsInitPayloadModel(amount="5000", email="ada@example.com", reference="ref-1")
+
+
+def test_get_retried_until_it_succeeds(paystack):
+    handler = _failing(2, _TOTALS)
+    with paystack(handler, retry_policy=FAST) as integration:
+        integration.transactions.transaction_totals()
+    assert handler.calls == 3
+
+
+def test_get_gives_up_after_max_attempts(paystack):
+    handler = _failing(5, _TOTALS)
+    with paystack(handler, retry_policy=FAST) as integration:
+        with pytest.raises(httpx.HTTPStatusError):
+            integration.transactions.transaction_totals()
+    assert handler.calls == 3
+
+
+def test_client_errors_are_not_retried(paystack):
+    handler = _failing(5, _TOTALS, status=400)
+    with paystack(handler, retry_policy=FAST) as integration:
+        with pytest.raises(httpx.HTTPStatusError):
+            integration.transactions.transaction_totals()
+    assert handler.calls == 1
+
+
+def test_transport_errors_are_retried(paystack):
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise httpx.ConnectError("connection reset", request=request)
+        return httpx.Response(200, json=_TOTALS)
+
+    with paystack(handler, retry_policy=FAST) as integration:
+        integration.transactions.transaction_totals()
+    assert calls == 2
+
+
+def test_post_without_key_is_sent_once(paystack):
+    handler = _failing(1, _INITIALIZED)
+    with paystack(handler, retry_policy=FAST) as integration:
+        with pytest.raises(httpx.HTTPStatusError):
+            integration.transactions.initialize_transaction(_payload())
+    assert handler.calls == 1
+
+
+def test_post_with_caller_key_is_retried_with_the_header(paystack):
+    requests = []
+    handler = _failing(2, _INITIALIZED, requests=requests)
+    with paystack(handler, retry_policy=FAST) as integration:
+        integration.transactions.initialize_transaction(_payload(), idempotency_key="order-77")
+
+    assert handler.calls == 3
+    assert {request.headers["idempotency-key"] for request in requests} == {"order-77"}
+
+
+def test_reference_guard_key_is_not_sent_or_retried(paystack):
+    # The reference only dedupes locally; Paystack never saw it as an
+    # idempotency key, so a retried POST could charge twice.
+    requests = []
+    handler = _failing(1, _INITIALIZED, requests=requests)
+    with paystack(handler, retry_policy=FAST, idempotency=IdempotencyGuard()) as integration:
+        with pytest.raises(httpx.HTTPStatusError):
+            integration.transactions.initialize_transaction(_payload())
+
+    assert handler.calls == 1
+    assert "idempotency-key" not in requests[0].headers
+
+
+def test_retry_after_sets_the_minimum_delay():
+    policy = RetryPolicy(base_delay=0)
+    request = httpx.Request("GET", "https://api.paystack.test/transaction")
+    error = httpx.HTTPStatusError(
+        "busy", request=request, response=httpx.Response(429, headers={"Retry-After": "2"}, request=request)
+    )
+    assert policy.next_delay("GET", 0, time.monotonic(), error) == pytest.approx(2)
+
+
+def test_total_timeout_stops_retrying():
+    policy = RetryPolicy(base_delay=0, total_timeout=1)
+    error = httpx.ConnectError("reset")
+    assert policy.next_delay("GET", 0, time.monotonic(), error) == 0
+    assert policy.next_delay("GET", 0, time.monotonic() - 2, error) is None
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(base_delay=1, max_delay=3)
+    assert all(0 <= policy.backoff(attempt) <= 3 for attempt in range(10))
+
+
+def test_async_get_retried(async_paystack):
+    sync = _failing(2, _TOTALS)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return sync(request)
+
+    async def main():
+        async with async_paystack(handler, retry_policy=FAST) as integration:
+            await integration.transactions.transaction_totals()
+
+    asyncio.run(main())
+    assert sync.calls == 3
+
+
+def test_failure_body_is_not_retried(paystack):
+    handler = _failing(0, {"status": False, "message": "Invalid key"})
+    with paystack(handler, retry_policy=FAST) as integration:
+        with pytest.raises(TransactionError):
+            integration.transactions.transaction_totals()
+    assert handler.calls == 1
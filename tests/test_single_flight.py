@@ -0,0 +1,148 @@
+import asyncio
+import httpx
+import pytest
+import threading
+import time
+from paystack.main import AsyncPayStackIntegration
+from transport.single_flight import AsyncSingleFlight, SingleFlight, client_identity, request_key
+
+
+_TOTALS = {"status": True, "message": "Transaction totals", "data": {}}
+
+
+def test_request_key_ignores_param_order():
+    assert request_key("paystack", "/transaction", {"a": 1, "b": 2}) == request_key("paystack", "/transaction", {"b": "2", "a": "1"})
+    assert request_key("paystack", "/transaction") != request_key("alatpay", "/transaction")
+    first = client_identity("https://api.paystack.co", {"Authorization": "Bearer sk_a"})
+    assert first == client_identity("https://api.paystack.co", {"authorization": "Bearer sk_a"})
+    assert first != client_identity("https://api.paystack.co", {"Authorization": "Bearer sk_b"})
+    assert first != client_identity("https://api.paystack.test", {"Authorization": "Bearer sk_a"})
+
+
+def test_concurrent_identical_gets_share_one_request(paystack):
+    requests = []
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        release.wait(5)
+        return httpx.Response(200, json=_TOTALS)
+
+    flight = SingleFlight()
+    results = []
+    with paystack(handler, single_flight=flight) as integration:
+        threads = [
+            threading.Thread(target=lambda: results.append(integration._get_request("/transaction/totals", {"from": "2024-01-01"})))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        while flight.coalesced < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        integration._get_request("/transaction/totals", {"from": "2024-01-01"})
+
+    assert len(requests) == 2
+    assert results == [_TOTALS] * 5
+    # Every caller decodes its own copy
+    assert len({id(result) for result in results}) == 5
+
+
+def test_errors_reach_every_waiter():
+    flight = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def fail():
+        release.wait(5)
+        raise RuntimeError("gateway down")
+
+    def call():
+        try:
+            flight.do("key", fail)
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while flight.coalesced < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 3 and len({id(e) for e in errors}) == 1
+    assert flight.do("key", lambda: "fresh") == "fresh"
+
+
+def test_async_identical_gets_share_one_request(async_paystack):
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json=_TOTALS)
+
+    async def main():
+        async with async_paystack(handler, single_flight=AsyncSingleFlight()) as integration:
+            same = await asyncio.gather(*(integration._get_request("/transaction/totals") for _ in range(5)))
+            other = await integration._get_request("/transaction/totals", {"page": 2})
+        return same, other
+
+    same, other = asyncio.run(main())
+    assert same == [_TOTALS] * 5
+    assert other == _TOTALS
+    assert len(requests) == 2
+
+
+def test_accounts_sharing_a_flight_are_not_coalesced(monkeypatch):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={**_TOTALS, "data": {"account": request.headers["authorization"]}})
+
+    def make(secret: str, flight: AsyncSingleFlight) -> AsyncPayStackIntegration:
+        monkeypatch.setenv("PAYSTACK_TEST_SECRET_KEY", secret)
+        return AsyncPayStackIntegration(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), single_flight=flight)
+
+    async def main():
+        flight = AsyncSingleFlight()
+        async with make("sk_test_a", flight) as first, make("sk_test_b", flight) as second:
+            results = await asyncio.gather(
+                first._get_request("/transaction/verify/ref-1"),
+                second._get_request("/transaction/verify/ref-1")
+            )
+        return results, flight.coalesced
+
+    (first, second), coalesced = asyncio.run(main())
+    assert first["data"]["account"] == "Bearer sk_test_a"
+    assert second["data"]["account"] == "Bearer sk_test_b"
+    assert coalesced == 0
+
+
+def test_cancelling_the_leader_does_not_cancel_the_others():
+    flight = AsyncSingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return "body"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == "body"
+    assert calls == 1
+    assert flight.coalesced == 1
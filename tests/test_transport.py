@@ -0,0 +1,93 @@
+import asyncio
+import httpx
+import threading
+import time
+from alatpay.main import AlatPayIntegration
+from benchmarks.server import MockGateway, transaction
+from paystack.main import PayStackIntegration
+from transport.transport import AsyncTransport, Transport, TransportConfig
+
+
+def _verified(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"status": True, "message": "Verification successful", "data": transaction(1)})
+
+
+def test_shared_transport_is_left_open():
+    gateway = MockGateway()
+    client = gateway.client()
+    transport = Transport(client=client)
+
+    with PayStackIntegration(transport=transport) as paystack, AlatPayIntegration(transport=transport) as alatpay:
+        paystack.transactions.verify_transaction("ref-1")
+        alatpay.bank_transfer.confirm_transaction_status("txn-00001")
+
+    assert gateway.requests == 2
+    assert not client.is_closed
+    transport.close()
+    assert client.is_closed
+
+
+def test_client_passed_in_is_owned():
+    client = httpx.Client(transport=httpx.MockTransport(_verified))
+    with PayStackIntegration(client=client) as integration:
+        integration.transactions.verify_transaction("ref-1")
+    assert client.is_closed
+
+
+def test_per_host_cap_limits_concurrency():
+    in_flight, peak = 0, 0
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return _verified(request)
+
+    transport = Transport(
+        TransportConfig(max_connections_per_host=2),
+        client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    threads = [
+        threading.Thread(target=transport.request, args=("GET", "https://api.paystack.test/transaction/verify/ref-1"))
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    transport.close()
+    assert peak == 2
+
+
+def test_async_per_host_cap_limits_concurrency():
+    in_flight, peak = 0, 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _verified(request)
+
+    async def main():
+        async with AsyncTransport(
+            TransportConfig(max_connections_per_host=3),
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        ) as transport:
+            await asyncio.gather(*(
+                transport.request("GET", "https://api.paystack.test/transaction/verify/ref-1") for _ in range(8)
+            ))
+
+    asyncio.run(main())
+    assert peak == 3
+
+
+def test_http2_without_h2_falls_back(monkeypatch):
+    monkeypatch.setattr("transport.transport.HTTP2_AVAILABLE", False)
+    assert TransportConfig(http2=True).use_http2() is False
@@ -0,0 +1,115 @@
+import asyncio
+import httpx
+import threading
+import time
+from benchmarks.server import transaction
+from paystack.errors.errors import TransactionError
+from paystack.models import TransactionsVerifyResponseModel
+
+
+def _verify(reference: str) -> httpx.Response:
+    if reference.startswith("missing"):
+        return httpx.Response(200, json={"status": False, "message": "Transaction reference not found"})
+    return httpx.Response(200, json={
+        "status": True,
+        "message": "Verification successful",
+        "data": {**transaction(int(reference.split("-")[1])), "reference": reference}
+    })
+
+
+def _reference(request: httpx.Request) -> str:
+    return request.url.path.rsplit("/", 1)[-1]
+
+
+def test_ordered_results_keep_input_order(paystack):
+    delays = {"ref-1": 0.03, "ref-2": 0.0, "ref-3": 0.015}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        reference = _reference(request)
+        time.sleep(delays.get(reference, 0))
+        return _verify(reference)
+
+    with paystack(handler) as integration:
+        results = list(integration.transactions.verify_many(["ref-1", "ref-2", "missing-3", "ref-3"], concurrency=4))
+
+    assert [reference for reference, _ in results] == ["ref-1", "ref-2", "missing-3", "ref-3"]
+    assert isinstance(results[0][1], TransactionsVerifyResponseModel)
+    assert results[0][1].data.reference == "ref-1"
+    assert isinstance(results[2][1], TransactionError)
+    assert results[2][1].context["message"] == "Transaction reference not found"
+
+
+def test_unordered_yields_every_reference(paystack):
+    with paystack(lambda request: _verify(_reference(request))) as integration:
+        results = dict(integration.transactions.verify_many([f"ref-{i}" for i in range(20)], concurrency=5, ordered=False))
+
+    assert sorted(results) == sorted(f"ref-{i}" for i in range(20))
+    assert all(result.data.reference == reference for reference, result in results.items())
+
+
+def test_concurrency_is_bounded(paystack):
+    in_flight, peak = 0, 0
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return _verify(_reference(request))
+
+    with paystack(handler) as integration:
+        list(integration.transactions.verify_many([f"ref-{i}" for i in range(12)], concurrency=3))
+    assert peak == 3
+
+
+def test_timeout_yields_408(paystack):
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        reference = _reference(request)
+        if reference == "ref-2":
+            release.wait(5)
+        return _verify(reference)
+
+    try:
+        with paystack(handler) as integration:
+            for ordered in (True, False):
+                results = dict(integration.transactions.verify_many(["ref-1", "ref-2"], ordered=ordered, timeout=0.1))
+                assert isinstance(results["ref-1"], TransactionsVerifyResponseModel)
+                assert isinstance(results["ref-2"], TransactionError)
+                assert results["ref-2"].code == 408
+                assert results["ref-2"].context == {"reference": "ref-2"}
+    finally:
+        release.set()
+
+
+def test_async_verify_many(async_paystack):
+    in_flight, peak = 0, 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        reference = _reference(request)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(10 if reference == "ref-9" else 0.01)
+        in_flight -= 1
+        return _verify(reference)
+
+    references = [f"ref-{i}" for i in range(9)] + ["missing-1", "ref-9"]
+
+    async def main():
+        async with async_paystack(handler) as integration:
+            return [pair async for pair in integration.transactions.verify_many(references, concurrency=4, timeout=0.5)]
+
+    started = time.monotonic()
+    results = asyncio.run(main())
+
+    assert time.monotonic() - started < 5
+    assert [reference for reference, _ in results] == references
+    assert results[-2][1].context["message"] == "Transaction reference not found"
+    assert results[-1][1].code == 408
+    assert peak == 4
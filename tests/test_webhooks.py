@@ -0,0 +1,152 @@
+import asyncio
+import hashlib
+import hmac
+import httpx
+import pytest
+from benchmarks.server import transaction
+from transport import codec
+from webhooks.app import WebhookApp
+from webhooks.dispatcher import WebhookDispatcher
+from webhooks.models import AlatPayEvent, PaystackChargeEvent
+from webhooks.sources import AlatPayWebhook, PaystackWebhook, WebhookSource
+
+
+SECRET = "sk_test_webhooks"
+
+
+def _sign(body: bytes, secret: str = SECRET) -> str:
+    return hmac.new(secret.encode(), body, hashlib.sha512).hexdigest()
+
+
+def _charge(i: int = 1) -> bytes:
+    return codec.dumps({"event": "charge.success", "data": transaction(i)})
+
+
+def _deliver(deliveries, handlers: dict = None):
+    """
+    POST each `(path, body, headers)` to a WebhookApp and return the
+    response statuses and the events its handlers received.
+    """
+    received = []
+
+    async def main():
+        dispatcher = WebhookDispatcher(workers=2)
+        for event, handler in (handlers or {"*": received.append}).items():
+            dispatcher.on(event, handler)
+        app = WebhookApp({"/paystack": PaystackWebhook(SECRET), "/alatpay": AlatPayWebhook("s3cret")}, dispatcher)
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="https://hooks.test") as client:
+            statuses = [
+                (await client.post(path, content=body, headers=headers)).status_code
+                for path, body, headers in deliveries
+            ]
+        await dispatcher.stop()
+        return statuses
+
+    return asyncio.run(main()), received
+
+
+def test_signed_paystack_event_is_dispatched():
+    body = _charge()
+    statuses, received = _deliver([("/paystack", body, {"x-paystack-signature": _sign(body)})])
+
+    assert statuses == [200]
+    assert len(received) == 1
+    assert isinstance(received[0], PaystackChargeEvent)
+    assert received[0].id == f"charge.success:{transaction(1)['id']}"
+    assert received[0].data.reference == transaction(1)["reference"]
+
+
+@pytest.mark.parametrize("headers", [
+    {},
+    {"x-paystack-signature": _sign(_charge(), "sk_test_other")},
+    {"x-paystack-signature": _sign(_charge())[:-2] + "00"},
+    {"x-paystack-signature": _sign(_charge())[:-1].encode() + "é".encode("latin-1")}
+])
+def test_bad_signature_is_rejected(headers):
+    statuses, received = _deliver([("/paystack", _charge(), headers)])
+    assert statuses == [401]
+    assert received == []
+
+
+def test_signature_covers_the_exact_bytes():
+    body = _charge()
+    reserialised = codec.dumps(codec.loads(body)).replace(b",", b", ")
+    statuses, _ = _deliver([("/paystack", reserialised, {"x-paystack-signature": _sign(body)})])
+    assert statuses == [401]
+
+
+def test_redelivery_is_acknowledged_but_not_run_twice():
+    body = _charge()
+    headers = {"x-paystack-signature": _sign(body)}
+    statuses, received = _deliver([("/paystack", body, headers)] * 3)
+    assert statuses == [200, 200, 200]
+    assert len(received) == 1
+
+
+def test_routing_and_error_statuses():
+    unparseable = b"{not json"
+    statuses, received = _deliver([
+        ("/nowhere", b"{}", {}),
+        ("/paystack", unparseable, {"x-paystack-signature": _sign(unparseable)}),
+        ("/paystack", b"x" * 64, {"x-paystack-signature": _sign(b"x" * 64)})
+    ])
+    assert statuses == [404, 400, 400]
+    assert received == []
+
+
+def test_oversized_body_is_rejected():
+    async def main():
+        app = WebhookApp({"/paystack": PaystackWebhook(SECRET)}, max_body=16)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="https://hooks.test") as client:
+            return (await client.post("/paystack", content=_charge())).status_code
+
+    assert asyncio.run(main()) == 413
+
+
+def test_alatpay_callback_with_shared_secret():
+    body = codec.dumps({"Value": {"Data": {"Id": "txn-1", "OrderId": "order-1", "Status": "Completed", "Amount": 5000}}})
+    statuses, received = _deliver([
+        ("/alatpay", body, {"x-alatpay-secret": "s3cret"}),
+        ("/alatpay", body, {"x-alatpay-secret": "guess"}),
+        ("/alatpay", body, {"x-alatpay-secret": "s3cr\xe9".encode("latin-1")})
+    ])
+
+    assert statuses == [200, 401, 401]
+    assert isinstance(received[0], AlatPayEvent)
+    assert received[0].event == "transaction.completed"
+    assert received[0].id == "txn-1:completed"
+    assert received[0].data.orderId == "order-1"
+    assert received[0].data.amount == 5000
+
+
+def test_unknown_paystack_event_keeps_its_payload():
+    event = PaystackWebhook(SECRET).parse(codec.dumps({"event": "transfer.success", "data": {"id": 7, "amount": 100}}))
+    assert event.id == "transfer.success:7"
+    assert event.data == {"id": 7, "amount": 100}
+
+
+def test_sync_and_async_handlers_both_run():
+    calls = []
+
+    async def on_charge(event):
+        calls.append(("async", event.event))
+
+    body = _charge()
+    _deliver(
+        [("/paystack", body, {"x-paystack-signature": _sign(body)})],
+        handlers={"charge.success": on_charge, "*": lambda event: calls.append(("sync", event.event))}
+    )
+    assert sorted(calls) == [("async", "charge.success"), ("sync", "charge.success")]
+
+
+def test_webhook_source_is_abstract():
+    with pytest.raises(TypeError):
+        WebhookSource()
+
+    class Incomplete(WebhookSource):
+        def verify(self, body, headers):
+            return True
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,196 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from pydantic import BaseModel
+from transport import codec
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+
+DEFAULT_TTLS = {
+    "fetch_transaction": 24 * 3600,
+    "verify_transaction": 24 * 3600,
+    "view_transaction_timeline": 3600
+}
+
+
+class MemoryCache():
+    """
+    Bounded in-process LRU cache with per-entry expiry. Values are stored as
+    is; ResponseCache copies models going in and out.
+    """
+
+    serializes = False
+
+    def __init__(self, max_size: int = 10_000):
+        self.max_size = max_size
+        self.__entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.__lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self.__entries[key]
+                return None
+            self.__entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + ttl, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+class SQLiteCache():
+    """
+    LRU cache in a local SQLite file, shareable by every process on the host.
+    Values must be bytes; ResponseCache serialises models to JSON for it.
+    """
+
+    serializes = True
+
+    def __init__(self, path: str, max_size: int = 100_000):
+        self.path = path
+        self.max_size = max_size
+        self.evictions = 0
+        self.__lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.__conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.execute(
+            "CREATE TABLE IF NOT EXISTS response_cache ("
+            " key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self.__conn.execute("CREATE INDEX IF NOT EXISTS response_cache_accessed ON response_cache (accessed_at)")
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self.__lock:
+            row = self.__conn.execute(
+                "SELECT value, expires_at FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self.__conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                return None
+            self.__conn.execute("UPDATE response_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        now = time.time()
+        with self.__lock:
+            self.__conn.execute(
+                "INSERT OR REPLACE INTO response_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl, now)
+            )
+            excess = self.__conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0] - self.max_size
+            if excess > 0:
+                self.__conn.execute(
+                    "DELETE FROM response_cache WHERE key IN"
+                    " (SELECT key FROM response_cache ORDER BY accessed_at LIMIT ?)",
+                    (excess,)
+                )
+                self.evictions += excess
+
+    def delete(self, key: str) -> None:
+        with self.__lock:
+            self.__conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__conn.execute("DELETE FROM response_cache")
+
+    def close(self) -> None:
+        self.__conn.close()
+
+
+class ResponseCache():
+    """
+    Opt-in cache for immutable gateway lookups.
+
+    Entries are namespaced by method, each with its own TTL (`DEFAULT_TTLS`
+    unless overridden); a method without a TTL is never cached. Deciding
+    *whether* a response is immutable is left to the caller. Hit and miss
+    counts are kept per method, see `stats()`.
+    """
+
+    def __init__(self, backend: Union[MemoryCache, SQLiteCache] = None, ttls: Dict[str, float] = None):
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.__counts: Dict[str, Dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0, "stores": 0})
+        self.__lock = threading.Lock()
+
+    def _count(self, method: str, outcome: str) -> None:
+        with self.__lock:
+            self.__counts[method][outcome] += 1
+
+    def get(self, method: str, key: str, model: Type[BaseModel] = None) -> Optional[Any]:
+        """
+        The cached value for `key`, validated into `model` when the backend
+        stores serialised JSON. Every hit is a fresh copy, so a caller
+        mutating its result cannot change what later hits see.
+        """
+        value = self.backend.get(f"{method}:{key}")
+        if value is None:
+            self._count(method, "misses")
+            return None
+
+        self._count(method, "hits")
+        if isinstance(value, (bytes, bytearray)):
+            return model.model_validate_json(value) if model is not None else codec.loads(value)
+        return value.model_copy(deep=True)
+
+    def put(self, method: str, key: str, value: Union[BaseModel, Dict]) -> None:
+        ttl = self.ttls.get(method)
+        if not ttl:
+            return
+
+        if isinstance(value, dict):
+            stored = codec.dumps(value)
+        elif self.backend.serializes:
+            stored = value.model_dump_json().encode()
+        else:
+            # The caller keeps `value`, the cache holds its own copy
+            stored = value.model_copy(deep=True)
+
+        self.backend.set(f"{method}:{key}", stored, ttl)
+        self._count(method, "stores")
+
+    def invalidate(self, method: str, key: str) -> None:
+        self.backend.delete(f"{method}:{key}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self.__lock:
+            by_method = {method: dict(counts) for method, counts in self.__counts.items()}
+
+        hits = sum(counts["hits"] for counts in by_method.values())
+        misses = sum(counts["misses"] for counts in by_method.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            "evictions": self.backend.evictions,
+            "by_method": by_method
+        }
@@ -0,0 +1,189 @@
+import httpx
+import threading
+import time
+from collections import deque
+from enum import Enum
+from logger.logger import get_logger
+from pydantic import BaseModel, Field
+from transport.exceptions import GatewayUnavailable
+from typing import Deque, Dict, Optional, Tuple
+
+
+logger = get_logger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreakerConfig(BaseModel):
+    window_size: int = Field(50, ge=1, description="Number of most recent calls the rates are computed over")
+    minimum_calls: int = Field(10, ge=1, description="Calls needed in the window before the breaker may open")
+    failure_rate_threshold: float = Field(0.5, gt=0, le=1, description="Failed call share that opens the breaker")
+    slow_call_duration: float = Field(5.0, gt=0, description="Seconds after which a call counts as slow")
+    slow_call_rate_threshold: float = Field(0.8, gt=0, le=1, description="Slow call share that opens the breaker")
+    open_duration: float = Field(30.0, gt=0, description="Seconds to fail fast before letting trial calls through")
+    half_open_max_calls: int = Field(3, ge=1, description="Trial calls allowed while half open")
+
+
+def is_gateway_failure(error: Optional[Exception]) -> bool:
+    """
+    Only transport errors and 5xx/429 responses count against the gateway.
+    A 4xx such as a declined card is the caller's problem, not an outage.
+    """
+    if error is None:
+        return False
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status >= 500 or status == 429
+    return isinstance(error, httpx.TransportError)
+
+
+class CircuitBreaker():
+
+    def __init__(self, provider: str, route: str, config: CircuitBreakerConfig = None):
+        self.provider = provider
+        self.route = route
+        self.config = config or CircuitBreakerConfig()
+
+        self.__state = CircuitState.CLOSED
+        self.__window: Deque[Tuple[bool, bool]] = deque(maxlen=self.config.window_size)
+        self.__opened_at = 0.0
+        self.__half_open_calls = 0
+        self.__half_open_done = 0
+        self.__rejected = 0
+        self.__lock = threading.Lock()
+
+    def _transition(self, state: CircuitState) -> None:
+        logger.warning("Circuit %s %s: %s -> %s", self.provider, self.route, self.__state.value, state.value)
+        self.__state = state
+        self.__window.clear()
+        self.__half_open_calls = 0
+        self.__half_open_done = 0
+        if state == CircuitState.OPEN:
+            self.__opened_at = time.monotonic()
+
+    def before_call(self) -> None:
+        """
+        Reserve permission for one call, raising GatewayUnavailable if the circuit is open.
+        """
+        with self.__lock:
+            if self.__state == CircuitState.OPEN:
+                retry_in = self.__opened_at + self.config.open_duration - time.monotonic()
+                if retry_in > 0:
+                    self.__rejected += 1
+                    raise GatewayUnavailable(self.provider, self.route, retry_in)
+                self._transition(CircuitState.HALF_OPEN)
+
+            if self.__state == CircuitState.HALF_OPEN:
+                if self.__half_open_calls >= self.config.half_open_max_calls:
+                    self.__rejected += 1
+                    raise GatewayUnavailable(self.provider, self.route, 0.0)
+                self.__half_open_calls += 1
+
+    def release(self) -> None:
+        """
+        Give back the permission taken by `before_call` for a call that never
+        completed (cancelled or interrupted), without recording an outcome.
+        """
+        with self.__lock:
+            if self.__state == CircuitState.HALF_OPEN and self.__half_open_calls > 0:
+                self.__half_open_calls -= 1
+
+    def record(self, duration: float, failed: bool) -> None:
+        slow = duration >= self.config.slow_call_duration
+
+        with self.__lock:
+            if self.__state == CircuitState.HALF_OPEN:
+                if failed or slow:
+                    self._transition(CircuitState.OPEN)
+                    return
+                self.__half_open_done += 1
+                if self.__half_open_done >= self.config.half_open_max_calls:
+                    self._transition(CircuitState.CLOSED)
+                return
+
+            if self.__state == CircuitState.OPEN:
+                return
+
+            self.__window.append((failed, slow))
+            if len(self.__window) < self.config.minimum_calls:
+                return
+
+            failure_rate, slow_rate = self._rates()
+            if failure_rate >= self.config.failure_rate_threshold or slow_rate >= self.config.slow_call_rate_threshold:
+                self._transition(CircuitState.OPEN)
+
+    def _rates(self) -> Tuple[float, float]:
+        calls = len(self.__window)
+        if not calls:
+            return 0.0, 0.0
+        failures = sum(1 for failed, _ in self.__window if failed)
+        slow = sum(1 for _, is_slow in self.__window if is_slow)
+        return failures / calls, slow / calls
+
+    @property
+    def state(self) -> CircuitState:
+        with self.__lock:
+            if self.__state == CircuitState.OPEN and time.monotonic() - self.__opened_at >= self.config.open_duration:
+                return CircuitState.HALF_OPEN
+            return self.__state
+
+    def stats(self) -> Dict:
+        state = self.state
+        with self.__lock:
+            failure_rate, slow_rate = self._rates()
+            retry_in = 0.0
+            if state == CircuitState.OPEN:
+                retry_in = max(0.0, self.__opened_at + self.config.open_duration - time.monotonic())
+            return {
+                "provider": self.provider,
+                "route": self.route,
+                "state": state.value,
+                "calls": len(self.__window),
+                "failure_rate": failure_rate,
+                "slow_call_rate": slow_rate,
+                "rejected": self.__rejected,
+                "retry_in": retry_in
+            }
+
+
+class CircuitBreakerRegistry():
+    """
+    Breakers keyed by provider and endpoint template.
+
+    Share one registry between integrations to get a single `stats()` view a
+    load balancer can poll to route away from a degraded provider.
+    """
+
+    def __init__(self, config: CircuitBreakerConfig = None):
+        self.config = config or CircuitBreakerConfig()
+        self.__breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self.__lock = threading.Lock()
+
+    def get(self, provider: str, route: str) -> CircuitBreaker:
+        key = (provider, route)
+        breaker = self.__breakers.get(key)
+        if breaker is None:
+            with self.__lock:
+                breaker = self.__breakers.setdefault(key, CircuitBreaker(provider, route, self.config))
+        return breaker
+
+    def stats(self, provider: str = None) -> Dict[str, Dict]:
+        return {
+            f"{breaker.provider} {breaker.route}": breaker.stats()
+            for breaker in list(self.__breakers.values())
+            if provider is None or breaker.provider == provider
+        }
+
+    def is_available(self, provider: str) -> bool:
+        """
+        False while any endpoint of `provider` has an open circuit.
+        """
+        return all(
+            breaker.state != CircuitState.OPEN
+            for breaker in list(self.__breakers.values())
+            if breaker.provider == provider
+        )
@@ -0,0 +1,77 @@
+import json
+from datetime import date, time
+from pydantic import BaseModel
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _default(value: Any) -> Any:
+    # ISO format for dates and times, as orjson writes them natively, so the
+    # wire format does not depend on whether orjson is installed; pydantic
+    # Url and friends have a sensible str() form
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialise to JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=_default)
+    return json.dumps(value, default=_default, separators=(",", ":")).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def decode_model(
+    resp: Union[bytes, Dict],
+    model: Type[M],
+    expected_message: str
+) -> Tuple[Optional[M], Dict]:
+    """
+    Validate a response body into `model` when its `message` is the expected one.
+
+    Raw bytes go straight through `model.model_validate_json`, skipping the
+    intermediate dict; they are only decoded when validation fails or the
+    message is unexpected, which is the error path anyway.
+
+    Args:
+        resp (Union[bytes, Dict]): Raw JSON body or an already decoded dict.
+        model (Type[M]): The response model to validate into.
+        expected_message (str): The `message` a successful response carries.
+
+    Returns:
+        Tuple[Optional[M], Dict]: `(model, body)` on success, `(None, body)`
+        otherwise. `body` is empty when it never had to be decoded.
+    """
+    if isinstance(resp, (bytes, bytearray)):
+        try:
+            result = model.model_validate_json(resp)
+            if getattr(result, "message", None) == expected_message:
+                return result, {}
+        except ValueError:
+            pass
+        resp = loads(resp)
+
+    if resp.get("message") == expected_message:
+        return model(**resp), resp
+    return None, resp
+
+
+def as_dict(resp: Union[bytes, Dict]) -> Dict:
+    if isinstance(resp, (bytes, bytearray)):
+        return loads(resp)
+    return resp
@@ -0,0 +1,80 @@
+import codecs
+import csv
+from typing import Dict, List, Optional
+
+
+class CsvRowParser():
+    """
+    Incremental CSV parser fed with raw byte chunks as they arrive.
+
+    `feed` returns the rows completed by a chunk as dicts keyed by the header
+    row, `close` returns whatever is left at the end of the stream. Only the
+    current unfinished record is buffered, so memory stays flat however
+    large the file is. Quoted fields spanning lines are kept whole: records
+    are only cut at a newline outside a quoted field, where a quote only
+    opens one at the start of a field, as csv reads it.
+    """
+
+    def __init__(self, encoding: str = "utf-8-sig"):
+        self.__decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self.__partial = ""
+        self.__record: List[str] = []
+        self.__quoted = False
+        self.__header: Optional[List[str]] = None
+
+    def feed(self, chunk: bytes) -> List[Dict[str, str]]:
+        # Only "\n" ends a line here: splitlines() would also cut on \x0b, \x1c,
+        # \u2028 and friends, which may sit inside a quoted field. A "\r"
+        # before it is left for csv to strip.
+        lines = (self.__partial + self.__decoder.decode(chunk)).split("\n")
+        self.__partial = lines.pop()
+        return self._rows([line + "\n" for line in lines])
+
+    def close(self) -> List[Dict[str, str]]:
+        tail = self.__partial + self.__decoder.decode(b"", final=True)
+        self.__partial = ""
+        rows = self._rows([tail] if tail else [])
+        if self.__record:
+            rows.extend(self._rows([""], force=True))
+        return rows
+
+    def _rows(self, lines: List[str], force: bool = False) -> List[Dict[str, str]]:
+        rows = []
+        for line in lines:
+            self.__quoted = self._quoted_after(line, self.__quoted)
+            self.__record.append(line)
+            if self.__quoted and not force:
+                continue
+
+            values = next(csv.reader(["".join(self.__record)]), [])
+            self.__record = []
+            self.__quoted = False
+            if not values:
+                continue
+            if self.__header is None:
+                self.__header = values
+            else:
+                rows.append(dict(zip(self.__header, values)))
+        return rows
+
+    @staticmethod
+    def _quoted_after(line: str, quoted: bool) -> bool:
+        """
+        Whether a quoted field is still open at the end of `line`, given
+        whether one was open at its start. A quote elsewhere in an unquoted
+        field (`5" screen`) is a literal character, as it is to csv.
+        """
+        pos = 0
+        while True:
+            end = line.find('"', pos)
+            if end < 0:
+                return quoted
+            if quoted:
+                if line.startswith('"', end + 1):
+                    # Escaped "" inside the quoted field
+                    pos = end + 2
+                    continue
+                quoted = False
+            elif end == 0 or line[end - 1] == ",":
+                quoted = True
+            pos = end + 1
@@ -0,0 +1,206 @@
+import httpx
+import re
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class ErrorCode(str, Enum):
+    INVALID_REQUEST = "invalid_request"
+    AUTHENTICATION = "authentication"
+    DECLINED = "declined"
+    NOT_FOUND = "not_found"
+    DUPLICATE = "duplicate"
+    EXPIRED = "expired"
+    TIMEOUT = "timeout"
+    RATE_LIMITED = "rate_limited"
+    GATEWAY_ERROR = "gateway_error"
+    UNAVAILABLE = "unavailable"
+    IN_FLIGHT = "in_flight"
+    NETWORK = "network"
+    UNKNOWN = "unknown"
+
+
+# Worth trying again later with the same request
+RETRYABLE = frozenset({
+    ErrorCode.TIMEOUT,
+    ErrorCode.RATE_LIMITED,
+    ErrorCode.GATEWAY_ERROR,
+    ErrorCode.UNAVAILABLE,
+    ErrorCode.IN_FLIGHT,
+    ErrorCode.NETWORK
+})
+
+# Provider messages, checked before the status since both providers report
+# most failures with the same status (403 from Paystack, 400 from ALATPay)
+_MESSAGE_CODES = (
+    (re.compile(r"expired", re.I), ErrorCode.EXPIRED),
+    (re.compile(r"timed? ?out", re.I), ErrorCode.TIMEOUT),
+    (re.compile(r"too many requests|rate limit", re.I), ErrorCode.RATE_LIMITED),
+    (re.compile(r"duplicate|already exists", re.I), ErrorCode.DUPLICATE),
+    (re.compile(r"not found|does not exist|no \w+ found", re.I), ErrorCode.NOT_FOUND),
+    (re.compile(r"invalid (api |subscription )?key|unauthori[sz]ed|access denied", re.I), ErrorCode.AUTHENTICATION),
+    (re.compile(r"declined|insufficient|do not honou?r|not permitted|security validation", re.I), ErrorCode.DECLINED),
+)
+
+_STATUS_CODES = {
+    400: ErrorCode.INVALID_REQUEST,
+    401: ErrorCode.AUTHENTICATION,
+    403: ErrorCode.DECLINED,
+    404: ErrorCode.NOT_FOUND,
+    408: ErrorCode.TIMEOUT,
+    409: ErrorCode.DUPLICATE,
+    422: ErrorCode.INVALID_REQUEST,
+    429: ErrorCode.RATE_LIMITED
+}
+
+
+def classify(status: Optional[int], message: Optional[str] = None) -> ErrorCode:
+    """
+    Map a provider status and response message to an ErrorCode.
+    """
+    if message:
+        for pattern, code in _MESSAGE_CODES:
+            if pattern.search(message):
+                return code
+    if status is None:
+        return ErrorCode.UNKNOWN
+    if status >= 500:
+        return ErrorCode.GATEWAY_ERROR
+    return _STATUS_CODES.get(status, ErrorCode.UNKNOWN)
+
+
+def mask_value(value: Any) -> Any:
+    """
+    Mask a context value for logs: strings and numbers keep their first two
+    (and, past six characters, last two) characters, containers are masked
+    item by item, None and booleans are left alone.
+    """
+    if isinstance(value, dict):
+        return {k: mask_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [mask_value(v) for v in value]
+    if value is None or isinstance(value, bool):
+        return value
+    text = str(value)
+    if len(text) > 6:
+        return text[:2] + "****" + text[-2:]
+    return text[:2] + "****"
+
+
+class GatewayError(Exception):
+    """
+    Base for errors raised by the integrations.
+
+    Construction only stores its arguments. The error code and masked
+    context are worked out the first time they are used, so an error that is
+    caught and handled costs no more than a plain Exception. Callers decide
+    what to do with `error_code` and `is_retryable()` rather than by matching
+    on the message.
+    """
+
+    def __init__(self, message: str, code: int = None, context: Dict = None, error_code: ErrorCode = None):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+        self.context = context or {}
+        self._error_code = error_code
+        self._masked = None
+
+    def __str__(self) -> str:
+        if self.code:
+            return f"{self.message} (Error code: {self.code})"
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.message!r}, code={self.code!r}, error_code={self.error_code.value!r}, context={self.masked_context!r})"
+
+    @property
+    def error_code(self) -> ErrorCode:
+        if self._error_code is None:
+            self._error_code = classify(self.code, self.context.get("message") or self.message)
+        return self._error_code
+
+    @property
+    def masked_context(self) -> Dict:
+        if self._masked is None:
+            self._masked = mask_value(self.context)
+        return self._masked
+
+    def is_retryable(self) -> bool:
+        return self.error_code in RETRYABLE
+
+    def __reduce__(self):
+        # Subclass constructors take different arguments than `args` holds,
+        # so pickle and copy restore the attributes rather than call __init__
+        # (errors cross process pools and logging queues).
+        return _restore, (type(self), self.args, self.__dict__)
+
+
+def _restore(cls: type, args: tuple, state: Dict) -> GatewayError:
+    error = cls.__new__(cls, *args)
+    error.args = args
+    error.__dict__.update(state)
+    return error
+
+
+def classify_error(error: BaseException) -> ErrorCode:
+    """
+    ErrorCode for anything `_get_request`/`_post_request` may raise: integration
+    errors, httpx status errors (classified from the response body) and
+    transport errors.
+    """
+    if isinstance(error, GatewayError):
+        return error.error_code
+    if isinstance(error, httpx.HTTPStatusError):
+        try:
+            message = error.response.json().get("message")
+        except Exception:
+            message = None
+        return classify(error.response.status_code, message if isinstance(message, str) else None)
+    if isinstance(error, httpx.TimeoutException):
+        return ErrorCode.TIMEOUT
+    if isinstance(error, httpx.TransportError):
+        return ErrorCode.NETWORK
+    return ErrorCode.UNKNOWN
+
+
+def is_retryable(error: BaseException) -> bool:
+    return classify_error(error) in RETRYABLE
+
+
+class GatewayUnavailable(GatewayError):
+    """
+    Raised without touching the network while a provider endpoint's circuit is open.
+    """
+
+    def __init__(self, provider: str, route: str, retry_in: float):
+        self.provider = provider
+        self.route = route
+        self.retry_in = retry_in
+        super().__init__(
+            f"{provider} {route} is unavailable, circuit open for another {retry_in:.1f}s",
+            error_code=ErrorCode.UNAVAILABLE
+        )
+
+
+class IdempotencyConflict(GatewayError):
+    """
+    Raised when a request with the same idempotency key is still in flight
+    elsewhere and did not finish within the wait timeout, or, with
+    `mismatch`, when the key was already used for a different request.
+    """
+
+    def __init__(self, key: str, waited: float, mismatch: bool = False):
+        self.key = key
+        self.waited = waited
+        self.mismatch = mismatch
+        if mismatch:
+            super().__init__(
+                f"Idempotency key {key} was already used with a different request body",
+                error_code=ErrorCode.INVALID_REQUEST
+            )
+        else:
+            super().__init__(
+                f"Request with idempotency key {key} still in flight after {waited:.1f}s",
+                error_code=ErrorCode.IN_FLIGHT
+            )
@@ -0,0 +1,30 @@
+import math
+from datetime import datetime, timezone
+from typing import Any
+
+
+def get_field(item: Any, name: str) -> Any:
+    """
+    `name` from a raw dict or any object with that attribute, None if absent.
+    """
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def to_epoch(value: Any) -> float:
+    """
+    Epoch seconds from an ISO 8601 string (a trailing "Z" included), a
+    datetime or a number. Naive datetimes are taken as UTC; missing or
+    unparseable values are NaN.
+    """
+    if value is None or value == "":
+        return math.nan
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return math.nan
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
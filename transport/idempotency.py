@@ -0,0 +1,251 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from logger.logger import get_logger
+from transport.exceptions import IdempotencyConflict
+from typing import Any, Awaitable, Callable, Optional, Tuple, Union
+
+
+logger = get_logger(__name__)
+
+# What a claim finds: (True, None, None) when the caller now owns the key,
+# (False, None, fingerprint) while another caller holds it and
+# (False, body, fingerprint) once completed, with the fingerprint of the
+# request that claimed it.
+Claim = Tuple[bool, Optional[bytes], Optional[str]]
+
+
+def request_fingerprint(body: Optional[bytes]) -> Optional[str]:
+    """
+    Digest of a request body, stored with its claim so a key reused for a
+    different request can be told apart from a retry.
+    """
+    return hashlib.sha256(body).hexdigest() if body is not None else None
+
+
+class MemoryIdempotencyStore():
+    """
+    In-process store. Completed entries share one TTL, so the oldest expire
+    first and are dropped from the front of the ordered dict as new keys
+    are claimed. In-flight claims hold the key for `lease` seconds at a time,
+    renewed by `refresh` while the request is still running.
+    """
+
+    def __init__(self, ttl: float = 24 * 3600, lease: float = 60.0):
+        self.ttl = ttl
+        self.lease = lease
+        # key -> (expires at, body once completed, request fingerprint)
+        self.__entries: "OrderedDict[str, Tuple[float, Optional[bytes], Optional[str]]]" = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        while self.__entries:
+            key, entry = next(iter(self.__entries.items()))
+            if entry[0] > now:
+                break
+            del self.__entries[key]
+
+    def claim(self, key: str, fingerprint: str = None) -> Claim:
+        with self.__lock:
+            now = time.monotonic()
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] > now:
+                return False, entry[1], entry[2]
+
+            self.__entries.pop(key, None)
+            self.__entries[key] = (now + self.lease, None, fingerprint)
+            self._expire(now)
+            return True, None, None
+
+    def refresh(self, key: str) -> None:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[1] is None:
+                self.__entries[key] = (time.monotonic() + self.lease, None, entry[2])
+
+    def complete(self, key: str, body: bytes, fingerprint: str = None) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+            self.__entries[key] = (time.monotonic() + self.ttl, body, fingerprint)
+
+    def release(self, key: str) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+
+class SQLiteIdempotencyStore():
+    """
+    Store in a local SQLite file, so duplicates are caught across every
+    process on the host. Keys are the table's primary key.
+    """
+
+    def __init__(self, path: str, ttl: float = 24 * 3600, lease: float = 60.0, sweep_every: int = 1000):
+        self.path = path
+        self.ttl = ttl
+        self.lease = lease
+        self.sweep_every = sweep_every
+        self.__claims = 0
+        self.__lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.__conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.execute(
+            "CREATE TABLE IF NOT EXISTS idempotency ("
+            " key TEXT PRIMARY KEY, body BLOB, expires_at REAL NOT NULL, fingerprint TEXT)"
+        )
+        columns = {row[1] for row in self.__conn.execute("PRAGMA table_info(idempotency)")}
+        if "fingerprint" not in columns:
+            # Files created before request fingerprints were stored
+            self.__conn.execute("ALTER TABLE idempotency ADD COLUMN fingerprint TEXT")
+        self.__conn.execute("CREATE INDEX IF NOT EXISTS idempotency_expires ON idempotency (expires_at)")
+
+    def claim(self, key: str, fingerprint: str = None) -> Claim:
+        now = time.time()
+        with self.__lock:
+            self.__conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.__conn.execute(
+                    "SELECT body, expires_at, fingerprint FROM idempotency WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    return False, row[0], row[2]
+
+                self.__conn.execute(
+                    "INSERT OR REPLACE INTO idempotency (key, body, expires_at, fingerprint) VALUES (?, NULL, ?, ?)",
+                    (key, now + self.lease, fingerprint)
+                )
+                self.__claims += 1
+                if self.__claims % self.sweep_every == 0:
+                    self.__conn.execute("DELETE FROM idempotency WHERE expires_at <= ?", (now,))
+                return True, None, None
+            finally:
+                self.__conn.execute("COMMIT")
+
+    def refresh(self, key: str) -> None:
+        with self.__lock:
+            self.__conn.execute(
+                "UPDATE idempotency SET expires_at = ? WHERE key = ? AND body IS NULL",
+                (time.time() + self.lease, key)
+            )
+
+    def complete(self, key: str, body: bytes, fingerprint: str = None) -> None:
+        with self.__lock:
+            self.__conn.execute(
+                "INSERT OR REPLACE INTO idempotency (key, body, expires_at, fingerprint) VALUES (?, ?, ?, ?)",
+                (key, body, time.time() + self.ttl, fingerprint)
+            )
+
+    def release(self, key: str) -> None:
+        with self.__lock:
+            self.__conn.execute("DELETE FROM idempotency WHERE key = ? AND body IS NULL", (key,))
+
+    def close(self) -> None:
+        self.__conn.close()
+
+
+class IdempotencyGuard():
+    """
+    Runs a POST at most once per idempotency key.
+
+    The first caller claims the key and sends the request; its response body
+    is kept in `store` and handed back to every later caller with the same
+    key without touching the network. Duplicates arriving while the first
+    request is in flight wait up to `wait_timeout` seconds for its result,
+    then raise IdempotencyConflict. Failed requests release the key so they
+    can be retried. The claim's lease is renewed every third of a lease
+    while the request runs, so a send slowed by retries and backoff keeps
+    the key; a crashed process stops renewing and its claim expires.
+
+    Given the request body, its fingerprint is stored with the claim and a
+    key reused for a different request raises IdempotencyConflict instead
+    of replaying a response meant for something else. SQLite stores are
+    called from a worker thread by `run_async`, off the event loop.
+    """
+
+    def __init__(self,
+            store: Union[MemoryIdempotencyStore, SQLiteIdempotencyStore] = None,
+            wait_timeout: float = 30.0,
+            poll_interval: float = 0.05
+        ):
+        self.store = store if store is not None else MemoryIdempotencyStore()
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+
+    def _heartbeat(self, key: str, stop: threading.Event) -> None:
+        while not stop.wait(self.store.lease / 3):
+            self.store.refresh(key)
+
+    async def _store_async(self, method: Callable, *args) -> Any:
+        # SQLite stores take a write lock that may wait on other processes
+        if isinstance(self.store, MemoryIdempotencyStore):
+            return method(*args)
+        return await asyncio.to_thread(method, *args)
+
+    async def _heartbeat_async(self, key: str) -> None:
+        while True:
+            await asyncio.sleep(self.store.lease / 3)
+            await self._store_async(self.store.refresh, key)
+
+    def _check(self, key: str, fingerprint: Optional[str], stored: Optional[str]) -> None:
+        if fingerprint is not None and stored is not None and fingerprint != stored:
+            raise IdempotencyConflict(key, 0.0, mismatch=True)
+
+    def run(self, key: str, send: Callable[[], bytes], request: bytes = None) -> bytes:
+        fingerprint = request_fingerprint(request)
+        started = time.monotonic()
+        while True:
+            owned, body, stored = self.store.claim(key, fingerprint)
+            if owned:
+                break
+            self._check(key, fingerprint, stored)
+            if body is not None:
+                logger.info("Replaying stored response for idempotency key %s", key)
+                return body
+            if time.monotonic() - started >= self.wait_timeout:
+                raise IdempotencyConflict(key, time.monotonic() - started)
+            time.sleep(self.poll_interval)
+
+        stop = threading.Event()
+        threading.Thread(target=self._heartbeat, args=(key, stop), daemon=True).start()
+        try:
+            body = send()
+        except BaseException:
+            self.store.release(key)
+            raise
+        finally:
+            stop.set()
+
+        self.store.complete(key, body, fingerprint)
+        return body
+
+    async def run_async(self, key: str, send: Callable[[], Awaitable[bytes]], request: bytes = None) -> bytes:
+        fingerprint = request_fingerprint(request)
+        started = time.monotonic()
+        while True:
+            owned, body, stored = await self._store_async(self.store.claim, key, fingerprint)
+            if owned:
+                break
+            self._check(key, fingerprint, stored)
+            if body is not None:
+                logger.info("Replaying stored response for idempotency key %s", key)
+                return body
+            if time.monotonic() - started >= self.wait_timeout:
+                raise IdempotencyConflict(key, time.monotonic() - started)
+            await asyncio.sleep(self.poll_interval)
+
+        heartbeat = asyncio.ensure_future(self._heartbeat_async(key))
+        try:
+            body = await send()
+        except BaseException:
+            await self._store_async(self.store.release, key)
+            raise
+        finally:
+            heartbeat.cancel()
+
+        await self._store_async(self.store.complete, key, body, fingerprint)
+        return body
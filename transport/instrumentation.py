@@ -0,0 +1,525 @@
+import contextlib
+import contextvars
+import functools
+import httpx
+import inspect
+import math
+import threading
+import time
+from logger.logger import get_logger
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+
+logger = get_logger(__name__)
+
+PHASES = ("pool_wait", "connect", "tls", "send", "wait", "body", "validate")
+
+# httpcore trace event name (minus its "connection."/"http11."/"http2." prefix) -> phase.
+# httpcore resolves DNS inside connect_tcp, so DNS time is part of "connect".
+_TRACE_PHASES = {
+    "connect_tcp": "connect",
+    "connect_unix_socket": "connect",
+    "start_tls": "tls",
+    "send_connection_init": "tls",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "wait",
+    "receive_response_body": "body"
+}
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+_current: contextvars.ContextVar[Optional["GatewayCall"]] = contextvars.ContextVar("gateway_call", default=None)
+
+
+class GatewayCall():
+    """
+    What one gateway call did: a handler operation such as
+    `verify_transaction`, or a bare `_get_request`/`_post_request` made
+    outside of one, together with the HTTP exchange(s) it needed.
+
+    `phases` holds seconds per entry of PHASES. pool_wait is the time
+    between handing the request to the transport and httpcore starting on
+    a connection (host slots plus the connection pool); connect, tls, send,
+    wait (time to first response byte) and body come from httpcore's trace
+    events and stay empty on transports that emit none (MockTransport,
+    ASGITransport); validate is the time from the last response byte until
+    the handler returned, JSON decoding included.
+    """
+
+    __slots__ = (
+        "provider", "operation", "method", "route", "status", "error",
+        "attempts", "request_bytes", "response_bytes", "cache", "phases",
+        "started", "duration", "span", "_attempt_started", "_marks", "_transport_done"
+    )
+
+    def __init__(self, provider: str, operation: str):
+        self.provider = provider
+        self.operation = operation
+        self.method: Optional[str] = None
+        self.route: Optional[str] = None
+        self.status: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.attempts = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.cache: Optional[str] = None
+        self.phases: Dict[str, float] = {}
+        self.started = time.perf_counter()
+        self.duration: Optional[float] = None
+        # Free for hooks to keep per-call state in, SpanHook stores its span here
+        self.span: Any = None
+        self._attempt_started: Optional[float] = None
+        self._marks: Dict[str, float] = {}
+        self._transport_done: Optional[float] = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.provider}.{self.operation}"
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+    def _add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def begin_attempt(self) -> Dict[str, Callable]:
+        self.attempts += 1
+        self._attempt_started = time.perf_counter()
+        self._marks.clear()
+        return {"trace": self._trace}
+
+    def begin_attempt_async(self) -> Dict[str, Callable]:
+        self.attempts += 1
+        self._attempt_started = time.perf_counter()
+        self._marks.clear()
+        return {"trace": self._trace_async}
+
+    def _trace(self, event: str, info: Dict) -> None:
+        now = time.perf_counter()
+        if self._attempt_started is not None:
+            self._add("pool_wait", now - self._attempt_started)
+            self._attempt_started = None
+
+        step, _, stage = event.rpartition(".")
+        step = step.partition(".")[2]
+        if stage == "started":
+            self._marks[step] = now
+        elif step in self._marks:
+            phase = _TRACE_PHASES.get(step)
+            started = self._marks.pop(step)
+            if phase is not None:
+                self._add(phase, now - started)
+
+    async def _trace_async(self, event: str, info: Dict) -> None:
+        self._trace(event, info)
+
+    def end_attempt(self, resp: Optional[httpx.Response]) -> None:
+        self._attempt_started = None
+        self._transport_done = time.perf_counter()
+        if resp is not None:
+            self.status = resp.status_code
+            self.response_bytes += len(resp.content)
+            self.request_bytes += len(resp.request.content)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "operation": self.operation,
+            "method": self.method,
+            "route": self.route,
+            "status": self.status,
+            "error": type(self.error).__name__ if self.error is not None else None,
+            "attempts": self.attempts,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "cache": self.cache,
+            "duration": self.duration,
+            "phases": dict(self.phases)
+        }
+
+
+class InstrumentationHook():
+    """
+    Base class for hooks. `on_start` runs when a call begins and `on_end`
+    once it has finished, successfully or not (`call.error` is then set).
+    Both run on the calling thread or task, so keep them cheap.
+    """
+
+    def on_start(self, call: GatewayCall) -> None:
+        pass
+
+    def on_end(self, call: GatewayCall) -> None:
+        pass
+
+
+class Instrumentation():
+    """
+    Hooks notified about every gateway call of the integrations it is
+    passed to (`instrumentation=` on any integration).
+
+    Handler operations are recorded as one call each, with the HTTP
+    exchange they make and any response cache outcome attached; requests
+    made outside of an operation are recorded on their own, named after
+    their route. Integrations built without instrumentation skip all of
+    this behind a single `is None` check.
+
+        metrics = MetricsHook()
+        paystack = PayStackIntegration(instrumentation=Instrumentation([metrics, SpanHook()]))
+        ...
+        metrics.registry.render()
+    """
+
+    def __init__(self, hooks: Sequence[InstrumentationHook] = ()):
+        self.hooks: List[InstrumentationHook] = list(hooks)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.hooks)
+
+    def add_hook(self, hook: InstrumentationHook) -> InstrumentationHook:
+        self.hooks.append(hook)
+        return hook
+
+    def _start(self, call: GatewayCall) -> None:
+        for hook in self.hooks:
+            try:
+                hook.on_start(call)
+            except Exception as e:
+                logger.warning("Instrumentation hook %s failed on start: %s", type(hook).__name__, e)
+
+    def _end(self, call: GatewayCall) -> None:
+        now = time.perf_counter()
+        call.duration = now - call.started
+        if call._transport_done is not None:
+            call._add("validate", now - call._transport_done)
+        for hook in self.hooks:
+            try:
+                hook.on_end(call)
+            except Exception as e:
+                logger.warning("Instrumentation hook %s failed on end: %s", type(hook).__name__, e)
+
+    @contextlib.contextmanager
+    def call(self, provider: str, operation: str) -> Iterator[GatewayCall]:
+        """
+        Record a handler operation. Requests made inside it attach to it.
+        """
+        call = GatewayCall(provider, operation)
+        token = _current.set(call)
+        self._start(call)
+        try:
+            yield call
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            _current.reset(token)
+            self._end(call)
+
+    @contextlib.contextmanager
+    def request(self, provider: str, method: str, route: str) -> Iterator[GatewayCall]:
+        """
+        Record one logical request, retries included, on the current
+        operation, or as a call of its own when there is none.
+        """
+        call = _current.get()
+        standalone = call is None
+        if standalone:
+            call = GatewayCall(provider, route)
+            self._start(call)
+        call.method, call.route = method, route
+        try:
+            yield call
+        except BaseException as e:
+            call.error = e
+            if isinstance(e, httpx.HTTPStatusError):
+                call.status = e.response.status_code
+            raise
+        finally:
+            if standalone:
+                # Decoding happens after this returns, so there is no validate phase to time
+                call._transport_done = None
+                self._end(call)
+
+
+def current_call() -> Optional[GatewayCall]:
+    """
+    The call being recorded in this thread or task, if any.
+    """
+    return _current.get()
+
+
+def record_cache(hit: bool) -> None:
+    call = _current.get()
+    if call is not None:
+        call.cache = "hit" if hit else "miss"
+
+
+def instrumented(operation: str) -> Callable:
+    """
+    Record the decorated handler method as `operation` when the handler was
+    given an enabled Instrumentation. Handlers provide `provider` and
+    `_instrumentation`.
+    """
+    def decorate(fn: Callable) -> Callable:
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(self, *args, **kwargs):
+                instrumentation = self._instrumentation
+                if instrumentation is None or not instrumentation.hooks:
+                    return await fn(self, *args, **kwargs)
+                with instrumentation.call(self.provider, operation):
+                    return await fn(self, *args, **kwargs)
+        else:
+            @functools.wraps(fn)
+            def wrapper(self, *args, **kwargs):
+                instrumentation = self._instrumentation
+                if instrumentation is None or not instrumentation.hooks:
+                    return fn(self, *args, **kwargs)
+                with instrumentation.call(self.provider, operation):
+                    return fn(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[Any], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _label_order(item: Tuple) -> Tuple:
+    return tuple(str(value) for value in item[0])
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter():
+    """
+    A monotonically increasing count per label combination.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.__values: Dict[Tuple, float] = {}
+        self.__lock = threading.Lock()
+
+    def inc(self, *labels: Any, amount: float = 1) -> None:
+        with self.__lock:
+            self.__values[labels] = self.__values.get(labels, 0) + amount
+
+    def value(self, *labels: Any) -> float:
+        return self.__values.get(labels, 0)
+
+    def samples(self) -> Dict[Tuple, float]:
+        with self.__lock:
+            return dict(self.__values)
+
+    def render(self) -> List[str]:
+        return [f"{self.name}{_labels(self.labels, key)} {_number(value)}" for key, value in sorted(self.samples().items(), key=_label_order)]
+
+
+class Histogram():
+    """
+    Observations counted into cumulative `buckets` per label combination,
+    with their sum and count, as Prometheus histograms are.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = DURATION_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self.__values: Dict[Tuple, List] = {}
+        self.__lock = threading.Lock()
+
+    def observe(self, value: float, *labels: Any) -> None:
+        with self.__lock:
+            state = self.__values.get(labels)
+            if state is None:
+                # [per-bucket counts, sum, count]
+                state = self.__values[labels] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def samples(self) -> Dict[Tuple, Dict[str, Any]]:
+        with self.__lock:
+            items = [(key, list(state[0]), state[1], state[2]) for key, state in self.__values.items()]
+        samples = {}
+        for key, counts, total, count in items:
+            cumulative, running = [], 0
+            for bound, bucket in zip(self.buckets, counts):
+                running += bucket
+                cumulative.append((bound, running))
+            samples[key] = {"buckets": cumulative, "sum": total, "count": count}
+        return samples
+
+    def render(self) -> List[str]:
+        lines = []
+        for key, sample in sorted(self.samples().items(), key=_label_order):
+            for bound, count in sample["buckets"]:
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labels, key, le)} {count}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, key)} {_number(sample['sum'])}")
+            lines.append(f"{self.name}_count{_labels(self.labels, key)} {sample['count']}")
+        return lines
+
+
+class MetricsRegistry():
+    """
+    In-process counters and histograms, exportable in the Prometheus text
+    exposition format with `render()`.
+    """
+
+    def __init__(self):
+        self.__metrics: Dict[str, Any] = {}
+        self.__lock = threading.Lock()
+
+    def _register(self, cls: type, name: str, help: str, labels: Sequence[str], **options) -> Any:
+        with self.__lock:
+            metric = self.__metrics.get(name)
+            if metric is None:
+                metric = self.__metrics[name] = cls(name, help, labels, **options)
+            elif not isinstance(metric, cls) or metric.labels != tuple(labels):
+                raise ValueError(f"Metric {name} is already registered with a different type or labels")
+            return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, help, labels)
+
+    def histogram(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = DURATION_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, help, labels, buckets=buckets)
+
+    def get(self, name: str) -> Optional[Any]:
+        return self.__metrics.get(name)
+
+    def render(self) -> str:
+        lines = []
+        for name, metric in sorted(self.__metrics.items()):
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class MetricsHook(InstrumentationHook):
+    """
+    Records every call into a MetricsRegistry:
+
+    - gateway_calls_total{provider, operation, status}: status is the HTTP
+      status, "cached" for cache hits and "error" when no response came back
+    - gateway_call_duration_seconds{provider, operation}
+    - gateway_phase_duration_seconds{provider, operation, phase}
+    - gateway_request_bytes / gateway_response_bytes{provider, operation}
+    - gateway_retries_total{provider, operation}
+    - gateway_cache_total{provider, operation, result}
+    - gateway_errors_total{provider, operation, error}
+    """
+
+    def __init__(self, registry: MetricsRegistry = None):
+        self.registry = registry if registry is not None else MetricsRegistry()
+        labels = ("provider", "operation")
+        self.__calls = self.registry.counter("gateway_calls_total", "Gateway calls", labels + ("status",))
+        self.__duration = self.registry.histogram("gateway_call_duration_seconds", "Gateway call duration", labels)
+        self.__phases = self.registry.histogram("gateway_phase_duration_seconds", "Time per call phase", labels + ("phase",))
+        self.__request_bytes = self.registry.histogram("gateway_request_bytes", "Request body size", labels, SIZE_BUCKETS)
+        self.__response_bytes = self.registry.histogram("gateway_response_bytes", "Response body size", labels, SIZE_BUCKETS)
+        self.__retries = self.registry.counter("gateway_retries_total", "Retried attempts", labels)
+        self.__cache = self.registry.counter("gateway_cache_total", "Response cache lookups", labels + ("result",))
+        self.__errors = self.registry.counter("gateway_errors_total", "Failed gateway calls", labels + ("error",))
+
+    def on_end(self, call: GatewayCall) -> None:
+        provider, operation = call.provider, call.operation
+        if call.status is not None:
+            status = call.status
+        else:
+            status = "cached" if call.cache == "hit" else "error" if call.error is not None else "none"
+
+        self.__calls.inc(provider, operation, status)
+        self.__duration.observe(call.duration, provider, operation)
+        for phase, seconds in call.phases.items():
+            self.__phases.observe(seconds, provider, operation, phase)
+        if call.attempts:
+            self.__request_bytes.observe(call.request_bytes, provider, operation)
+            self.__response_bytes.observe(call.response_bytes, provider, operation)
+        if call.retries:
+            self.__retries.inc(provider, operation, amount=call.retries)
+        if call.cache is not None:
+            self.__cache.inc(provider, operation, call.cache)
+        if call.error is not None:
+            self.__errors.inc(provider, operation, type(call.error).__name__)
+
+
+class SpanHook(InstrumentationHook):
+    """
+    Opens one OpenTelemetry client span per call, named `provider.operation`,
+    with HTTP attributes, retries, cache outcome and phase timings (in ms)
+    set when it ends. Any tracer with the OpenTelemetry `start_span` API
+    works; by default the global tracer provider's is used, which needs the
+    opentelemetry-api package.
+    """
+
+    def __init__(self, tracer: Any = None):
+        if tracer is None:
+            if otel_trace is None:
+                raise ImportError("SpanHook needs the opentelemetry-api package, or a tracer passed in")
+            tracer = otel_trace.get_tracer(__name__)
+        self.tracer = tracer
+
+    def on_start(self, call: GatewayCall) -> None:
+        kind = otel_trace.SpanKind.CLIENT if otel_trace is not None else None
+        options = {"kind": kind} if kind is not None else {}
+        call.span = self.tracer.start_span(call.name, attributes={"gateway.provider": call.provider}, **options)
+
+    def on_end(self, call: GatewayCall) -> None:
+        span = call.span
+        if span is None:
+            return
+        attributes = {
+            "gateway.operation": call.operation,
+            "gateway.attempts": call.attempts,
+            "http.request.body.size": call.request_bytes,
+            "http.response.body.size": call.response_bytes
+        }
+        if call.method is not None:
+            attributes["http.request.method"] = call.method
+            attributes["url.template"] = call.route
+        if call.status is not None:
+            attributes["http.response.status_code"] = call.status
+        if call.cache is not None:
+            attributes["gateway.cache"] = call.cache
+        for phase, seconds in call.phases.items():
+            attributes[f"gateway.phase.{phase}_ms"] = round(seconds * 1000, 3)
+        span.set_attributes(attributes)
+
+        if call.error is not None:
+            span.record_exception(call.error)
+            if otel_trace is not None:
+                span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, str(call.error)))
+        span.end()
@@ -0,0 +1,220 @@
+import asyncio
+import hashlib
+import httpx
+import json
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from logger.logger import get_logger
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+logger = get_logger(__name__)
+
+
+class TokenBucket():
+    """
+    In-process token bucket.
+
+    `reserve` takes a token immediately and returns how long the caller must
+    wait before using it, letting the balance go negative. That keeps the
+    lock held for a few instructions only and works the same for threads
+    (time.sleep) and coroutines (asyncio.sleep).
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.__tokens = self.capacity
+        self.__updated = time.monotonic()
+        self.__paused_until = 0.0
+        self.__lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.capacity, self.__tokens + (now - self.__updated) * self.rate)
+            self.__updated = now
+            self.__tokens -= tokens
+
+            wait = -self.__tokens / self.rate if self.__tokens < 0 else 0.0
+            return max(wait, self.__paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        with self.__lock:
+            self.__paused_until = max(self.__paused_until, time.monotonic() + seconds)
+            self.__tokens = min(self.__tokens, 0.0)
+
+
+class FileTokenBucket():
+    """
+    Token bucket whose state lives in a small file guarded by flock, so every
+    process on the host pointing at the same file draws from one budget.
+
+    Wall clock time is used because monotonic clocks are not comparable
+    across processes.
+    """
+
+    def __init__(self, path: str, rate: float, capacity: float = None):
+        if fcntl is None:
+            raise RuntimeError("FileTokenBucket needs fcntl, which is not available on this platform")
+
+        self.path = path
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.__lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a"):
+            pass
+
+    def _update(self, apply: Callable[[Dict, float], float]) -> float:
+        with self.__lock, open(self.path, "r+") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                raw = fh.read()
+                now = time.time()
+                state = json.loads(raw) if raw else {"tokens": self.capacity, "updated": now, "paused_until": 0.0}
+                state["tokens"] = min(self.capacity, state["tokens"] + (now - state["updated"]) * self.rate)
+                state["updated"] = now
+
+                result = apply(state, now)
+
+                fh.seek(0)
+                fh.truncate()
+                fh.write(json.dumps(state))
+                fh.flush()
+                return result
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        def apply(state: Dict, now: float) -> float:
+            state["tokens"] -= tokens
+            wait = -state["tokens"] / self.rate if state["tokens"] < 0 else 0.0
+            return max(wait, state["paused_until"] - now)
+
+        return self._update(apply)
+
+    def pause(self, seconds: float) -> None:
+        def apply(state: Dict, now: float) -> float:
+            state["paused_until"] = max(state["paused_until"], now + seconds)
+            state["tokens"] = min(state["tokens"], 0.0)
+            return 0.0
+
+        self._update(apply)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Seconds to wait according to a Retry-After header, which may be either
+    a delay in seconds or an HTTP date. Returns None when absent or invalid.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _reset_seconds(value: str) -> Optional[float]:
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+
+    # Some gateways send an epoch timestamp, others a delay in seconds
+    if reset > 1_000_000_000:
+        return max(0.0, reset - time.time())
+    return max(0.0, reset)
+
+
+class RateLimiter():
+    """
+    Client-side throttle for one provider.
+
+    Every request draws from the provider wide bucket plus, when configured,
+    a bucket for its endpoint template (see transport.routes.RouteTable).
+    `observe` reads Retry-After and X-RateLimit-* headers from responses and
+    pauses the affected buckets so the next callers back off before Paystack
+    or ALATPay start returning 429s.
+
+    When `state_dir` is given the buckets are file backed and shared by every
+    process using the same directory and `name`, which is then required
+    (the provider, usually) so limiters for different providers never
+    share a bucket.
+    """
+
+    def __init__(self,
+            rate: float,
+            capacity: float = None,
+            path_limits: Dict[str, Tuple[float, float]] = None,
+            name: str = None,
+            state_dir: str = None
+        ):
+        if state_dir is not None and not name:
+            raise ValueError("A file backed RateLimiter needs a name, such as the provider it throttles")
+        self.name = name or "default"
+        self.__state_dir = state_dir
+        self.__bucket = self._make_bucket("*", rate, capacity)
+        self.__path_buckets = {
+            template: self._make_bucket(template, path_rate, path_capacity)
+            for template, (path_rate, path_capacity) in (path_limits or {}).items()
+        }
+
+    def _make_bucket(self, key: str, rate: float, capacity: float = None):
+        if self.__state_dir is None:
+            return TokenBucket(rate, capacity)
+
+        digest = hashlib.sha1(f"{self.name}:{key}".encode()).hexdigest()[:16]
+        return FileTokenBucket(os.path.join(self.__state_dir, f"{self.name}-{digest}.bucket"), rate, capacity)
+
+    def _buckets(self, route: str) -> List:
+        path_bucket = self.__path_buckets.get(route)
+        return [self.__bucket, path_bucket] if path_bucket is not None else [self.__bucket]
+
+    def reserve(self, route: str) -> float:
+        return max(bucket.reserve() for bucket in self._buckets(route))
+
+    def acquire(self, route: str) -> None:
+        wait = self.reserve(route)
+        if wait > 0:
+            logger.debug("Rate limited %s %s, waiting %.3fs", self.name, route, wait)
+            time.sleep(wait)
+
+    async def acquire_async(self, route: str) -> None:
+        # File backed buckets take a blocking flock, keep that off the event loop
+        if self.__state_dir is not None:
+            wait = await asyncio.to_thread(self.reserve, route)
+        else:
+            wait = self.reserve(route)
+        if wait > 0:
+            logger.debug("Rate limited %s %s, waiting %.3fs", self.name, route, wait)
+            await asyncio.sleep(wait)
+
+    def observe(self, route: str, response: httpx.Response) -> None:
+        headers = response.headers
+        pause = None
+
+        if response.status_code in (429, 503) and "retry-after" in headers:
+            pause = parse_retry_after(headers["retry-after"])
+        elif headers.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in headers:
+            pause = _reset_seconds(headers["x-ratelimit-reset"])
+
+        if pause:
+            logger.warning("%s asked us to slow down on %s, pausing for %.1fs", self.name, route, pause)
+            for bucket in self._buckets(route):
+                bucket.pause(pause)
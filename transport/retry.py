@@ -0,0 +1,69 @@
+import httpx
+import random
+import time
+from pydantic import BaseModel, Field
+from transport.rate_limit import parse_retry_after
+from typing import FrozenSet, Optional, Tuple, Type
+
+
+class RetryPolicy(BaseModel):
+    max_attempts: int = Field(3, ge=1, description="Total attempts including the first one")
+    base_delay: float = Field(0.2, ge=0, description="Backoff base in seconds, doubled every attempt")
+    max_delay: float = Field(5.0, ge=0, description="Upper bound for a single backoff")
+    total_timeout: Optional[float] = Field(
+        30.0, gt=0, description="Give up once retrying would exceed this many seconds since the first attempt"
+    )
+    retry_statuses: FrozenSet[int] = Field(
+        frozenset({429, 500, 502, 503, 504}), description="HTTP statuses considered transient"
+    )
+    retry_exceptions: Tuple[Type[Exception], ...] = Field(
+        (httpx.TransportError,), description="Exceptions considered transient (connection resets, timeouts)"
+    )
+    retry_methods: FrozenSet[str] = Field(
+        frozenset({"GET"}), description="Methods safe to retry without an idempotency key"
+    )
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Full jitter: a uniform delay between zero and the capped exponential backoff.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def next_delay(self,
+            method: str,
+            attempt: int,
+            started: float,
+            error: Exception,
+            idempotent: bool = False
+        ) -> Optional[float]:
+        """
+        How long to sleep before retrying after `error`, or None to give up.
+
+        Args:
+            method (str): HTTP method of the failed request.
+            attempt (int): Zero based number of the attempt that just failed.
+            started (float): time.monotonic() of the first attempt.
+            error (Exception): What the attempt raised.
+            idempotent (bool): True when the request carries an idempotency key,
+                which makes non-GET methods safe to repeat.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if method not in self.retry_methods and not idempotent:
+            return None
+
+        retry_after = None
+        if isinstance(error, httpx.HTTPStatusError):
+            if error.response.status_code not in self.retry_statuses:
+                return None
+            retry_after = parse_retry_after(error.response.headers.get("retry-after"))
+        elif not isinstance(error, self.retry_exceptions):
+            return None
+
+        delay = self.backoff(attempt)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if self.total_timeout is not None and time.monotonic() - started + delay > self.total_timeout:
+            return None
+        return delay
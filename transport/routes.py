@@ -0,0 +1,31 @@
+import re
+from typing import Iterable, List, Pattern, Tuple
+
+
+_PLACEHOLDER = re.compile(r"\{[^/{}]+\}")
+
+
+class RouteTable():
+    """
+    Maps concrete request paths back to the endpoint template they came from.
+
+    `/transaction/verify/abc123` matches `/transaction/verify/{reference}`, so
+    rate limits and breaker state can be kept per endpoint rather than per
+    reference. Literal templates win over templated ones, and a path that
+    matches no template is returned unchanged.
+    """
+
+    def __init__(self, templates: Iterable[str] = ()):
+        ordered = sorted(set(templates), key=lambda t: (len(_PLACEHOLDER.findall(t)), -len(t)))
+        self.__routes: List[Tuple[Pattern, str]] = [(self._compile(t), t) for t in ordered]
+
+    @staticmethod
+    def _compile(template: str) -> Pattern:
+        parts = _PLACEHOLDER.split(template)
+        return re.compile("^" + "[^/]+".join(re.escape(part) for part in parts) + "$")
+
+    def match(self, path: str) -> str:
+        for pattern, template in self.__routes:
+            if pattern.match(path):
+                return template
+        return path
@@ -0,0 +1,99 @@
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+def client_identity(base_url: str, headers: Dict[str, str]) -> str:
+    """
+    Fingerprint of who is asking: the base URL and the headers (credentials
+    included), so integrations for different accounts sharing a SingleFlight
+    never coalesce into each other's responses.
+    """
+    digest = hashlib.sha256(base_url.encode())
+    for name, value in sorted((str(k).lower(), str(v)) for k, v in headers.items()):
+        digest.update(f"\n{name}:{value}".encode())
+    return digest.hexdigest()
+
+
+def request_key(provider: str, path: str, params: Optional[Dict] = None, identity: str = "") -> Tuple:
+    """
+    Key identifying a GET: provider, caller identity (see client_identity),
+    path and params, param order ignored.
+    """
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return provider, identity, path, items
+
+
+class SingleFlight():
+    """
+    Collapses concurrent identical calls made from threads into one.
+
+    The first caller for a key runs the call; callers arriving while it is in
+    flight wait for it and receive the same result or exception. Nothing is
+    remembered once the call finishes. One instance can be shared by several
+    integrations: their request keys include the base URL and credentials,
+    so only requests made as the same account are coalesced.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__calls: Dict[Hashable, Future] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+            if leader:
+                call = Future()
+                self.__calls[key] = call
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return call.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+
+
+class AsyncSingleFlight():
+    """
+    The asyncio counterpart of SingleFlight.
+
+    The call runs as its own task, so cancelling the caller that started it
+    does not cancel it for the others waiting on it.
+    """
+
+    def __init__(self):
+        self.__calls: Dict[Hashable, asyncio.Task] = {}
+        self.coalesced = 0
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self.__calls.get(key) is task:
+            del self.__calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter went away.
+            task.exception()
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        task = self.__calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self.__calls[key] = task
+            task.add_done_callback(lambda done: self._done(key, done))
+
+        return await asyncio.shield(task)
@@ -0,0 +1,601 @@
+import asyncio
+import contextlib
+import httpx
+import threading
+import time
+from logger.logger import get_logger
+from pydantic import BaseModel, Field
+from transport import codec
+from transport.circuit_breaker import CircuitBreakerRegistry, is_gateway_failure
+from transport.exceptions import GatewayUnavailable
+from transport.idempotency import IdempotencyGuard
+from transport.instrumentation import GatewayCall, Instrumentation
+from transport.rate_limit import RateLimiter
+from transport.retry import RetryPolicy
+from transport.routes import RouteTable
+from transport.single_flight import AsyncSingleFlight, SingleFlight, client_identity, request_key
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+
+logger = get_logger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class TransportConfig(BaseModel):
+    max_connections: int = Field(100, ge=1, description="Total connections the pool may open")
+    max_keepalive_connections: int = Field(20, ge=0, description="Idle connections kept open for reuse")
+    keepalive_expiry: float = Field(30.0, ge=0, description="Seconds an idle connection stays in the pool")
+    http2: bool = Field(False, description="Negotiate HTTP/2 when the h2 package is installed")
+    connect_timeout: float = Field(5.0, gt=0, description="Seconds to establish a connection (TCP + TLS)")
+    read_timeout: float = Field(30.0, gt=0, description="Seconds to wait for a chunk of the response")
+    write_timeout: float = Field(30.0, gt=0, description="Seconds to wait while sending the request body")
+    pool_timeout: float = Field(5.0, gt=0, description="Seconds to wait for a free connection from the pool")
+    max_connections_per_host: Optional[int] = Field(
+        None, ge=1, description="Cap on concurrent requests to a single host. None means no cap"
+    )
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout
+        )
+
+    def use_http2(self) -> bool:
+        if self.http2 and not HTTP2_AVAILABLE:
+            logger.warning("HTTP/2 requested but the h2 package is not installed, falling back to HTTP/1.1")
+            return False
+        return self.http2
+
+
+class Transport():
+    """
+    A pooled httpx.Client that any number of integrations can share.
+
+    Passing the same Transport to several integrations lets them reuse
+    kept-alive connections instead of each opening its own pool.
+    """
+
+    def __init__(self, config: TransportConfig = None, client: httpx.Client = None):
+        self.config = config or TransportConfig()
+        self.__client = client or httpx.Client(
+            limits=self.config.limits(),
+            timeout=self.config.timeout(),
+            http2=self.config.use_http2()
+        )
+        self.__host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self.__host_slots_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.__client.close()
+
+    def _host_slot(self, url: str) -> Optional[threading.BoundedSemaphore]:
+        if self.config.max_connections_per_host is None:
+            return None
+
+        host = httpx.URL(url).host
+        with self.__host_slots_lock:
+            slot = self.__host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.config.max_connections_per_host)
+                self.__host_slots[host] = slot
+        return slot
+
+    def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        slot = self._host_slot(url)
+        if slot is None:
+            return self.__client.request(method, url, **kwargs)
+
+        with slot:
+            return self.__client.request(method, url, **kwargs)
+
+    @contextlib.contextmanager
+    def stream(self, method: str, url: str, **kwargs) -> Iterator[httpx.Response]:
+        with self._host_slot(url) or contextlib.nullcontext(), self.__client.stream(method, url, **kwargs) as resp:
+            yield resp
+
+
+class AsyncTransport():
+    """
+    The asyncio counterpart of Transport, built on a pooled httpx.AsyncClient.
+    """
+
+    def __init__(self, config: TransportConfig = None, client: httpx.AsyncClient = None):
+        self.config = config or TransportConfig()
+        self.__client = client or httpx.AsyncClient(
+            limits=self.config.limits(),
+            timeout=self.config.timeout(),
+            http2=self.config.use_http2()
+        )
+        self.__host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.__client.aclose()
+
+    def _host_slot(self, url: str) -> Optional[asyncio.Semaphore]:
+        if self.config.max_connections_per_host is None:
+            return None
+
+        host = httpx.URL(url).host
+        slot = self.__host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.config.max_connections_per_host)
+            self.__host_slots[host] = slot
+        return slot
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        slot = self._host_slot(url)
+        if slot is None:
+            return await self.__client.request(method, url, **kwargs)
+
+        async with slot:
+            return await self.__client.request(method, url, **kwargs)
+
+    @contextlib.asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        async with self._host_slot(url) or contextlib.nullcontext(), self.__client.stream(method, url, **kwargs) as resp:
+            yield resp
+
+
+class BaseIntegration():
+    """
+    Request plumbing shared by every provider integration.
+
+    Subclasses supply the base URL and auth headers, and list their endpoint
+    templates in `routes`; `_on_status_error` can be overridden to translate
+    HTTP errors into provider specific exceptions. Transient failures are
+    retried according to `retry_policy`: GETs by default, other methods only
+    when sent with an idempotency key. With `circuit_breakers` set, calls to
+    an endpoint whose circuit is open fail fast with GatewayUnavailable.
+    With `fast_json` set, handlers are given the `_*_raw_request` methods and
+    validate response bytes directly into their models. With `single_flight`
+    set, concurrent identical GETs share one upstream request. With
+    `idempotency` set, a POST sent with an idempotency key runs once and its
+    response is replayed to duplicates. With `instrumentation` set, every
+    call is timed phase by phase and reported to its hooks. A client passed
+    in is owned and closed by the integration, a Transport passed in is
+    shared and left open. Provider integrations forward their keyword
+    options here.
+    """
+
+    provider = "default"
+    routes = RouteTable()
+
+    def __init__(self,
+            base_url: str,
+            headers: Dict[str, str],
+            client: httpx.Client = None,
+            transport: Transport = None,
+            config: TransportConfig = None,
+            rate_limiter: RateLimiter = None,
+            retry_policy: RetryPolicy = None,
+            circuit_breakers: CircuitBreakerRegistry = None,
+            fast_json: bool = False,
+            single_flight: SingleFlight = None,
+            idempotency: IdempotencyGuard = None,
+            instrumentation: Instrumentation = None
+        ):
+        self.__base_url = base_url
+        self.__headers = headers
+        self.__owns_transport = transport is None
+        self.__transport = transport or Transport(config=config, client=client)
+        self.__rate_limiter = rate_limiter
+        self.__retry_policy = retry_policy or RetryPolicy()
+        self.__circuit_breakers = circuit_breakers
+        self.__single_flight = single_flight
+        self.__identity = client_identity(base_url, headers) if single_flight is not None else ""
+        self.__idempotency = idempotency
+        self._fast_json = fast_json
+        self._instrumentation = instrumentation
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.__owns_transport:
+            self.__transport.close()
+
+    def _on_status_error(self, error: httpx.HTTPStatusError, method: str) -> None:
+        logger.error("HTTP error: %s - %s", error.response.status_code, error.response.text)
+
+    def _attempt(self, method: str, route: str, path: str, headers: Dict, call: GatewayCall = None, **kwargs) -> httpx.Response:
+        breaker = None
+        if self.__circuit_breakers is not None:
+            breaker = self.__circuit_breakers.get(self.provider, route)
+            breaker.before_call()
+        if self.__rate_limiter is not None:
+            try:
+                self.__rate_limiter.acquire(route)
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+        if call is not None:
+            kwargs["extensions"] = call.begin_attempt()
+        started = time.monotonic()
+        try:
+            resp = self.__transport.request(method, f"{self.__base_url}{path}", headers=headers, **kwargs)
+            if call is not None:
+                call.end_attempt(resp)
+            if self.__rate_limiter is not None:
+                self.__rate_limiter.observe(route, resp)
+            resp.raise_for_status()
+        except Exception as e:
+            if call is not None and not isinstance(e, httpx.HTTPStatusError):
+                call.end_attempt(None)
+            if breaker is not None:
+                breaker.record(time.monotonic() - started, failed=is_gateway_failure(e))
+            raise
+        except BaseException:
+            # Cancelled or interrupted: the call says nothing about the
+            # gateway, but its half-open slot must be handed back.
+            if call is not None:
+                call.end_attempt(None)
+            if breaker is not None:
+                breaker.release()
+            raise
+
+        if breaker is not None:
+            breaker.record(time.monotonic() - started, failed=False)
+        return resp
+
+    def _request(self, method: str, path: str, headers: Dict = None, idempotency_key: str = None, **kwargs) -> httpx.Response:
+        route = self.routes.match(path)
+        headers = {**self.__headers, **(headers or {})}
+        if idempotency_key is not None:
+            headers["Idempotency-Key"] = idempotency_key
+
+        instrumentation = self._instrumentation
+        if instrumentation is None or not instrumentation.hooks:
+            return self._send(method, route, path, headers, idempotency_key is not None, None, **kwargs)
+        with instrumentation.request(self.provider, method, route) as call:
+            return self._send(method, route, path, headers, idempotency_key is not None, call, **kwargs)
+
+    def _send(self, method: str, route: str, path: str, headers: Dict, idempotent: bool, call: Optional[GatewayCall], **kwargs) -> httpx.Response:
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                resp = self._attempt(method, route, path, headers, call, **kwargs)
+                break
+            except Exception as e:
+                delay = self.__retry_policy.next_delay(method, attempt, started, e, idempotent)
+                if delay is None:
+                    if isinstance(e, GatewayUnavailable):
+                        # Load shed by an open circuit, not a fault worth an error line per call
+                        logger.debug("%s %s shed: %s", method, route, e)
+                    elif isinstance(e, httpx.HTTPStatusError):
+                        self._on_status_error(e, method)
+                    else:
+                        logger.error("Unexpected error: %s", e)
+                    raise
+
+            # httpx has already read the failed response, so its connection is
+            # back in the pool and nothing is held while we back off.
+            logger.warning("%s %s attempt %s failed, retrying in %.2fs", method, route, attempt + 1, delay)
+            time.sleep(delay)
+            attempt += 1
+
+        return resp
+
+    def _download(self, url: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Yield the body of an absolute URL, such as a signed export link, in
+        chunks. Provider auth headers are not sent. A dropped connection is
+        resumed with a Range request from the last byte received; the retry
+        policy bounds how many consecutive drops without progress are allowed.
+        """
+        offset = 0
+        failures = 0
+        while True:
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            try:
+                with self.__transport.stream("GET", url, headers=headers) as resp:
+                    if offset and resp.status_code == 416:
+                        return
+                    resp.raise_for_status()
+
+                    # A server ignoring Range resends the whole file, skip what we have
+                    skip = offset if offset and resp.status_code != 206 else 0
+                    for chunk in resp.iter_bytes(chunk_size):
+                        if skip:
+                            chunk, skip = chunk[skip:], max(0, skip - len(chunk))
+                            if not chunk:
+                                continue
+                        offset += len(chunk)
+                        failures = 0
+                        yield chunk
+                return
+            except httpx.TransportError as e:
+                failures += 1
+                if failures >= self.__retry_policy.max_attempts:
+                    logger.error("Download failed after %s bytes: %s", offset, e)
+                    raise
+                delay = self.__retry_policy.backoff(failures - 1)
+                logger.warning("Download dropped after %s bytes, resuming in %.2fs", offset, delay)
+                time.sleep(delay)
+
+    def _get_content(self, path: str, params: Dict = None) -> bytes:
+        # Only the body bytes are shared between coalesced callers, each one
+        # decodes its own copy.
+        params = params if params else None
+        if self.__single_flight is None:
+            return self._request("GET", path, params=params).content
+
+        key = request_key(self.provider, path, params, self.__identity)
+        return self.__single_flight.do(key, lambda: self._request("GET", path, params=params).content)
+
+    def _get_request(self, path: str, params: Dict = None) -> Dict:
+        return codec.loads(self._get_content(path, params))
+
+    def _post_content(self, path: str, idempotency_key: str = None, guard_key: str = None, **kwargs) -> bytes:
+        """
+        POST through the idempotency guard. Only a caller supplied
+        `idempotency_key` is sent to the provider and makes the request safe
+        to retry; `guard_key` (a reference or order id) only dedupes locally.
+        """
+        def send() -> bytes:
+            return self._request("POST", path, idempotency_key=idempotency_key, **kwargs).content
+
+        key = idempotency_key or guard_key
+        if self.__idempotency is None or key is None:
+            return send()
+        return self.__idempotency.run(f"{self.provider}:{path}:{key}", send, kwargs.get("content"))
+
+    def _post_request(self, payload: Dict, path: str, idempotency_key: str = None, guard_key: str = None) -> Dict:
+        return codec.loads(self._post_content(
+            path,
+            headers={"Content-Type": "application/json"},
+            idempotency_key=idempotency_key,
+            guard_key=guard_key,
+            content=codec.dumps(payload)
+        ))
+
+    def _get_raw_request(self, path: str, params: Dict = None) -> bytes:
+        return self._get_content(path, params)
+
+    def _post_raw_request(self, content: bytes, path: str, idempotency_key: str = None, guard_key: str = None) -> bytes:
+        return self._post_content(
+            path,
+            headers={"Content-Type": "application/json"},
+            idempotency_key=idempotency_key,
+            guard_key=guard_key,
+            content=content
+        )
+
+
+class AsyncBaseIntegration():
+    """
+    The asyncio counterpart of BaseIntegration.
+    """
+
+    provider = "default"
+    routes = RouteTable()
+
+    def __init__(self,
+            base_url: str,
+            headers: Dict[str, str],
+            client: httpx.AsyncClient = None,
+            transport: AsyncTransport = None,
+            config: TransportConfig = None,
+            rate_limiter: RateLimiter = None,
+            retry_policy: RetryPolicy = None,
+            circuit_breakers: CircuitBreakerRegistry = None,
+            fast_json: bool = False,
+            single_flight: AsyncSingleFlight = None,
+            idempotency: IdempotencyGuard = None,
+            instrumentation: Instrumentation = None
+        ):
+        self.__base_url = base_url
+        self.__headers = headers
+        self.__owns_transport = transport is None
+        self.__transport = transport or AsyncTransport(config=config, client=client)
+        self.__rate_limiter = rate_limiter
+        self.__retry_policy = retry_policy or RetryPolicy()
+        self.__circuit_breakers = circuit_breakers
+        self.__single_flight = single_flight
+        self.__identity = client_identity(base_url, headers) if single_flight is not None else ""
+        self.__idempotency = idempotency
+        self._fast_json = fast_json
+        self._instrumentation = instrumentation
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        if self.__owns_transport:
+            await self.__transport.aclose()
+
+    def _on_status_error(self, error: httpx.HTTPStatusError, method: str) -> None:
+        logger.error("HTTP error: %s - %s", error.response.status_code, error.response.text)
+
+    async def _attempt(self, method: str, route: str, path: str, headers: Dict, call: GatewayCall = None, **kwargs) -> httpx.Response:
+        breaker = None
+        if self.__circuit_breakers is not None:
+            breaker = self.__circuit_breakers.get(self.provider, route)
+            breaker.before_call()
+        if self.__rate_limiter is not None:
+            try:
+                await self.__rate_limiter.acquire_async(route)
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+        if call is not None:
+            kwargs["extensions"] = call.begin_attempt_async()
+        started = time.monotonic()
+        try:
+            resp = await self.__transport.request(method, f"{self.__base_url}{path}", headers=headers, **kwargs)
+            if call is not None:
+                call.end_attempt(resp)
+            if self.__rate_limiter is not None:
+                self.__rate_limiter.observe(route, resp)
+            resp.raise_for_status()
+        except Exception as e:
+            if call is not None and not isinstance(e, httpx.HTTPStatusError):
+                call.end_attempt(None)
+            if breaker is not None:
+                breaker.record(time.monotonic() - started, failed=is_gateway_failure(e))
+            raise
+        except BaseException:
+            # Cancelled or interrupted: the call says nothing about the
+            # gateway, but its half-open slot must be handed back.
+            if call is not None:
+                call.end_attempt(None)
+            if breaker is not None:
+                breaker.release()
+            raise
+
+        if breaker is not None:
+            breaker.record(time.monotonic() - started, failed=False)
+        return resp
+
+    async def _request(self, method: str, path: str, headers: Dict = None, idempotency_key: str = None, **kwargs) -> httpx.Response:
+        route = self.routes.match(path)
+        headers = {**self.__headers, **(headers or {})}
+        if idempotency_key is not None:
+            headers["Idempotency-Key"] = idempotency_key
+
+        instrumentation = self._instrumentation
+        if instrumentation is None or not instrumentation.hooks:
+            return await self._send(method, route, path, headers, idempotency_key is not None, None, **kwargs)
+        with instrumentation.request(self.provider, method, route) as call:
+            return await self._send(method, route, path, headers, idempotency_key is not None, call, **kwargs)
+
+    async def _send(self, method: str, route: str, path: str, headers: Dict, idempotent: bool, call: Optional[GatewayCall], **kwargs) -> httpx.Response:
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                resp = await self._attempt(method, route, path, headers, call, **kwargs)
+                break
+            except Exception as e:
+                delay = self.__retry_policy.next_delay(method, attempt, started, e, idempotent)
+                if delay is None:
+                    if isinstance(e, GatewayUnavailable):
+                        # Load shed by an open circuit, not a fault worth an error line per call
+                        logger.debug("%s %s shed: %s", method, route, e)
+                    elif isinstance(e, httpx.HTTPStatusError):
+                        self._on_status_error(e, method)
+                    else:
+                        logger.error("Unexpected error: %s", e)
+                    raise
+
+            # httpx has already read the failed response, so its connection is
+            # back in the pool and nothing is held while we back off.
+            logger.warning("%s %s attempt %s failed, retrying in %.2fs", method, route, attempt + 1, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        return resp
+
+    async def _download(self, url: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        offset = 0
+        failures = 0
+        while True:
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            try:
+                async with self.__transport.stream("GET", url, headers=headers) as resp:
+                    if offset and resp.status_code == 416:
+                        return
+                    resp.raise_for_status()
+
+                    skip = offset if offset and resp.status_code != 206 else 0
+                    async for chunk in resp.aiter_bytes(chunk_size):
+                        if skip:
+                            chunk, skip = chunk[skip:], max(0, skip - len(chunk))
+                            if not chunk:
+                                continue
+                        offset += len(chunk)
+                        failures = 0
+                        yield chunk
+                return
+            except httpx.TransportError as e:
+                failures += 1
+                if failures >= self.__retry_policy.max_attempts:
+                    logger.error("Download failed after %s bytes: %s", offset, e)
+                    raise
+                delay = self.__retry_policy.backoff(failures - 1)
+                logger.warning("Download dropped after %s bytes, resuming in %.2fs", offset, delay)
+                await asyncio.sleep(delay)
+
+    async def _get_content(self, path: str, params: Dict = None) -> bytes:
+        params = params if params else None
+        if self.__single_flight is None:
+            return (await self._request("GET", path, params=params)).content
+
+        async def fetch() -> bytes:
+            return (await self._request("GET", path, params=params)).content
+
+        return await self.__single_flight.do(request_key(self.provider, path, params, self.__identity), fetch)
+
+    async def _get_request(self, path: str, params: Dict = None) -> Dict:
+        return codec.loads(await self._get_content(path, params))
+
+    async def _post_content(self, path: str, idempotency_key: str = None, guard_key: str = None, **kwargs) -> bytes:
+        """
+        POST through the idempotency guard. Only a caller supplied
+        `idempotency_key` is sent to the provider and makes the request safe
+        to retry; `guard_key` (a reference or order id) only dedupes locally.
+        """
+        async def send() -> bytes:
+            return (await self._request("POST", path, idempotency_key=idempotency_key, **kwargs)).content
+
+        key = idempotency_key or guard_key
+        if self.__idempotency is None or key is None:
+            return await send()
+        return await self.__idempotency.run_async(f"{self.provider}:{path}:{key}", send, kwargs.get("content"))
+
+    async def _post_request(self, payload: Dict, path: str, idempotency_key: str = None, guard_key: str = None) -> Dict:
+        return codec.loads(await self._post_content(
+            path,
+            headers={"Content-Type": "application/json"},
+            idempotency_key=idempotency_key,
+            guard_key=guard_key,
+            content=codec.dumps(payload)
+        ))
+
+    async def _get_raw_request(self, path: str, params: Dict = None) -> bytes:
+        return await self._get_content(path, params)
+
+    async def _post_raw_request(self, content: bytes, path: str, idempotency_key: str = None, guard_key: str = None) -> bytes:
+        return await self._post_content(
+            path,
+            headers={"Content-Type": "application/json"},
+            idempotency_key=idempotency_key,
+            guard_key=guard_key,
+            content=content
+        )
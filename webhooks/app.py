@@ -0,0 +1,106 @@
+from logger.logger import get_logger
+from transport import codec
+from typing import Callable, Dict, Mapping
+from webhooks.dispatcher import WebhookDispatcher
+from webhooks.sources import WebhookSource
+
+
+logger = get_logger(__name__)
+
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class WebhookApp():
+    """
+    ASGI application receiving provider webhooks.
+
+    `sources` maps a path to the provider it serves, e.g.
+    `{"/paystack": PaystackWebhook(), "/alatpay": AlatPayWebhook()}`; mount
+    the app under any prefix. A delivery is answered as soon as it is
+    verified and queued on `dispatcher`, handlers run afterwards:
+
+    - 200 queued, or a duplicate of an event already received
+    - 401 bad signature, 400 unparseable body, 404 unknown path, 413 too large
+    - 503 the dispatcher queue is full; providers retry later
+
+        app = WebhookApp({"/paystack": PaystackWebhook()}, dispatcher)
+        uvicorn.run(app)
+    """
+
+    def __init__(self, sources: Dict[str, WebhookSource], dispatcher: WebhookDispatcher = None, max_body: int = MAX_BODY_BYTES):
+        self.sources = {path.rstrip("/") or "/": source for path, source in sources.items()}
+        self.dispatcher = dispatcher or WebhookDispatcher()
+        self.max_body = max_body
+
+    async def __call__(self, scope: Dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            status, message = await self._handle(scope, receive)
+            await _respond(send, status, message)
+
+    async def _lifespan(self, receive: Callable, send: Callable) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.dispatcher.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.dispatcher.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _handle(self, scope: Dict, receive: Callable):
+        path = scope["path"][len(scope.get("root_path", "")):].rstrip("/") or "/"
+        source = self.sources.get(path)
+        if source is None:
+            return 404, "not found"
+        if scope["method"] != "POST":
+            return 405, "method not allowed"
+
+        body = await _read_body(receive, self.max_body)
+        if body is None:
+            return 413, "payload too large"
+
+        if not source.verify(body, _headers(scope)):
+            logger.warning("Rejected %s webhook with an invalid signature", source.provider)
+            return 401, "invalid signature"
+
+        try:
+            event = source.parse(body)
+        except Exception as e:
+            logger.warning("Unparseable %s webhook: %s", source.provider, e)
+            return 400, "invalid payload"
+
+        if not await self.dispatcher.submit(event):
+            return 503, "busy"
+        return 200, "ok"
+
+
+def _headers(scope: Dict) -> Mapping[str, str]:
+    return {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in scope.get("headers", [])}
+
+
+async def _read_body(receive: Callable, limit: int):
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return b""
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+async def _respond(send: Callable, status: int, message: str) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json")]
+    })
+    await send({"type": "http.response.body", "body": codec.dumps({"message": message})})
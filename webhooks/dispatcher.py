@@ -0,0 +1,120 @@
+import asyncio
+import inspect
+from logger.logger import get_logger
+from transport.cache import MemoryCache, SQLiteCache
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+from webhooks.models import WebhookEvent
+
+
+logger = get_logger(__name__)
+
+EventHandler = Callable[[WebhookEvent], Union[None, Awaitable[None]]]
+
+
+class WebhookDispatcher():
+    """
+    Queues verified events and runs their handlers on a fixed pool of
+    asyncio workers.
+
+    Handlers are registered per event name (`"*"` receives everything) and
+    may be coroutines or plain functions; plain functions run in the default
+    executor so they cannot stall the event loop. The queue holds at most
+    `queue_size` events: `submit` waits up to `enqueue_timeout` for room and
+    returns False when there is none, so callers can push back on the sender.
+
+    Event ids are remembered for `dedup_ttl` seconds in `seen`, any
+    transport.cache backend, so redeliveries are acknowledged but not run
+    again. Use a SQLiteCache to share that memory between processes.
+    """
+
+    def __init__(self,
+            workers: int = 8,
+            queue_size: int = 10_000,
+            enqueue_timeout: float = 1.0,
+            seen: Union[MemoryCache, SQLiteCache] = None,
+            dedup_ttl: float = 3 * 24 * 3600
+        ):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.enqueue_timeout = enqueue_timeout
+        self.dedup_ttl = dedup_ttl
+        self.__seen = seen if seen is not None else MemoryCache(max_size=100_000)
+        self.__handlers: Dict[str, List[EventHandler]] = {}
+        self.__queue: Optional[asyncio.Queue] = None
+        self.__workers: List[asyncio.Task] = []
+
+    def on(self, event: str, handler: EventHandler = None):
+        """
+        Register `handler` for `event`. Without a handler, returns a decorator.
+        """
+        if handler is None:
+            return lambda fn: self.on(event, fn)
+
+        self.__handlers.setdefault(event, []).append(handler)
+        return handler
+
+    @property
+    def running(self) -> bool:
+        return bool(self.__workers)
+
+    @property
+    def backlog(self) -> int:
+        return self.__queue.qsize() if self.__queue is not None else 0
+
+    def start(self) -> None:
+        if self.__workers:
+            return
+        self.__queue = asyncio.Queue(maxsize=self.queue_size)
+        self.__workers = [asyncio.ensure_future(self._work()) for _ in range(self.workers)]
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stop the workers, after finishing every queued event when `drain` is set.
+        """
+        if not self.__workers:
+            return
+        if drain:
+            await self.__queue.join()
+        for worker in self.__workers:
+            worker.cancel()
+        await asyncio.gather(*self.__workers, return_exceptions=True)
+        self.__workers = []
+
+    async def submit(self, event: WebhookEvent) -> bool:
+        """
+        Queue `event`. Returns True once it is queued or known to be a
+        duplicate, False if the queue stayed full.
+        """
+        self.start()
+
+        key = f"{event.provider}:{event.id}"
+        if self.__seen.get(key) is not None:
+            logger.info("Duplicate %s event %s ignored", event.provider, event.id)
+            return True
+
+        # Marked before waiting for room so a concurrent redelivery of the same
+        # event is not queued twice; unmarked again if it could not be queued.
+        self.__seen.set(key, b"1", self.dedup_ttl)
+        try:
+            await asyncio.wait_for(self.__queue.put(event), self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            self.__seen.delete(key)
+            logger.warning("Webhook queue full, rejected %s event %s", event.provider, event.id)
+            return False
+        return True
+
+    async def _work(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            event = await self.__queue.get()
+            try:
+                for handler in self.__handlers.get(event.event, []) + self.__handlers.get("*", []):
+                    try:
+                        if inspect.iscoroutinefunction(handler):
+                            await handler(event)
+                        else:
+                            await loop.run_in_executor(None, handler, event)
+                    except Exception as e:
+                        logger.error("Webhook handler %s failed for %s event %s: %s", getattr(handler, "__name__", handler), event.provider, event.id, e)
+            finally:
+                self.__queue.task_done()
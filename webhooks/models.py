@@ -0,0 +1,48 @@
+from paystack.models import ChargeData
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Dict, Optional
+
+
+class WebhookEvent(BaseModel):
+    """
+    An inbound event. `id` is what duplicates are detected by.
+    """
+
+    provider: str
+    event: str
+    id: str
+    data: Any
+
+
+class PaystackEvent(WebhookEvent):
+    provider: str = "paystack"
+    data: Dict[str, Any]
+
+
+class PaystackChargeEvent(PaystackEvent):
+    """
+    `charge.success`: the data is the transaction, typed with the same
+    ChargeData model charge_authorization returns.
+    """
+
+    data: ChargeData
+
+
+class AlatPayCallbackData(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    transactionId: Optional[str] = None
+    orderId: Optional[str] = None
+    status: Optional[str] = None
+    amount: Optional[float] = None
+    currency: Optional[str] = None
+
+
+class AlatPayEvent(WebhookEvent):
+    provider: str = "alatpay"
+    data: AlatPayCallbackData
+
+
+PAYSTACK_EVENT_MODELS = {
+    "charge.success": PaystackChargeEvent
+}
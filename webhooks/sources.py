@@ -0,0 +1,116 @@
+import hashlib
+import hmac
+import os
+from abc import ABC, abstractmethod
+from logger.logger import get_logger
+from pydantic import ValidationError
+from transport import codec
+from typing import Dict, Mapping
+from webhooks.models import PAYSTACK_EVENT_MODELS, AlatPayEvent, PaystackEvent, WebhookEvent
+
+
+logger = get_logger(__name__)
+
+# ALATPay callbacks use PascalCase keys; map them onto AlatPayCallbackData
+_ALATPAY_KEYS = {
+    "transactionId": ("transactionId", "TransactionId", "Id"),
+    "orderId": ("orderId", "OrderId"),
+    "status": ("status", "Status"),
+    "amount": ("amount", "Amount"),
+    "currency": ("currency", "Currency")
+}
+
+
+def _encode(value: str) -> bytes:
+    # Header values arrive as latin-1 text and may hold anything a sender put there
+    return value.encode("utf-8", "surrogateescape")
+
+
+class WebhookSource(ABC):
+    """
+    How one provider's webhooks are authenticated and parsed.
+
+    Both steps work on the raw request body: signatures are checked against
+    the exact bytes received, never a re-serialised copy.
+    """
+
+    provider = "default"
+
+    @abstractmethod
+    def verify(self, body: bytes, headers: Mapping[str, str]) -> bool:
+        ...
+
+    @abstractmethod
+    def parse(self, body: bytes) -> WebhookEvent:
+        ...
+
+
+class PaystackWebhook(WebhookSource):
+    """
+    Paystack signs each delivery with HMAC-SHA512 of the body keyed by the
+    secret key, sent hex encoded in `x-paystack-signature`.
+    """
+
+    provider = "paystack"
+
+    def __init__(self, secret_key: str = None):
+        secret_key = secret_key or os.getenv("PAYSTACK_TEST_SECRET_KEY")
+        if not secret_key:
+            logger.error("Missing required environment variables for PaystackWebhook.")
+            raise EnvironmentError("Missing required environment variables for PaystackWebhook")
+        self.__secret = secret_key.encode()
+
+    def verify(self, body: bytes, headers: Mapping[str, str]) -> bool:
+        signature = headers.get("x-paystack-signature")
+        if not signature:
+            return False
+        expected = hmac.new(self.__secret, body, hashlib.sha512).hexdigest()
+        # compare_digest raises TypeError on non-ASCII str, so compare bytes
+        return hmac.compare_digest(expected.encode(), _encode(signature.strip().lower()))
+
+    def parse(self, body: bytes) -> PaystackEvent:
+        payload = codec.loads(body)
+        event = payload.get("event", "")
+        data = payload.get("data") or {}
+        event_id = f"{event}:{data['id']}" if data.get("id") is not None else hashlib.sha256(body).hexdigest()
+
+        model = PAYSTACK_EVENT_MODELS.get(event, PaystackEvent)
+        try:
+            return model(event=event, id=event_id, data=data)
+        except ValidationError as e:
+            # Never drop a genuine event because its payload drifted from the model
+            logger.warning("Paystack %s event %s did not match %s: %s error(s)", event, event_id, model.__name__, e.error_count())
+            return PaystackEvent(event=event, id=event_id, data=data)
+
+
+class AlatPayWebhook(WebhookSource):
+    """
+    ALATPay callbacks are not signed. With `secret` set, deliveries must carry
+    it in the `header` configured on the ALATPay dashboard callback URL;
+    confirm payment state with BankTransfer.confirm_transaction_status before
+    acting on it either way.
+    """
+
+    provider = "alatpay"
+
+    def __init__(self, secret: str = None, header: str = "x-alatpay-secret"):
+        self.__secret = _encode(secret) if secret is not None else None
+        self.__header = header.lower()
+
+    def verify(self, body: bytes, headers: Mapping[str, str]) -> bool:
+        if self.__secret is None:
+            return True
+        return hmac.compare_digest(_encode(headers.get(self.__header, "")), self.__secret)
+
+    def parse(self, body: bytes) -> AlatPayEvent:
+        payload = codec.loads(body)
+        # Callbacks wrap the transaction in Value.Data
+        data: Dict = ((payload.get("Value") or {}).get("Data") or payload) if isinstance(payload, dict) else {}
+        data = {
+            **data,
+            **{field: next((data[key] for key in keys if data.get(key) is not None), None) for field, keys in _ALATPAY_KEYS.items()}
+        }
+
+        status = (data["status"] or "").lower()
+        event_id = f"{data['transactionId']}:{status}" if data["transactionId"] else hashlib.sha256(body).hexdigest()
+        return AlatPayEvent(event=f"transaction.{status or 'unknown'}", id=event_id, data=data)